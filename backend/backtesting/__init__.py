@@ -1,5 +1,5 @@
 # Export all backtesting components
-from .engine import BacktestEngine
+from .engine import BacktestEngine, run_parallel
 from .performance import PerformanceCalculator
 from .positions import Position, Trade
 from .risk_manager import RiskManager
@@ -10,4 +10,5 @@ __all__ = [
     "RiskManager",
     "PerformanceCalculator",
     "BacktestEngine",
+    "run_parallel",
 ]
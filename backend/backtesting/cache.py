@@ -0,0 +1,169 @@
+"""Result caching for repeated backtest runs.
+
+Parameter sweeps often re-run the same price data and signals with an
+identical engine configuration. Results are keyed by a SHA-256 over
+everything that influences a run and kept in two tiers:
+
+- L1: a small in-process LRU of pickled results
+- L2: ``<cache_dir>/<key>.pkl`` files that survive restarts
+
+Caching is opt-in via ``BacktestEngine(cache_dir=...)``.
+"""
+import functools
+import hashlib
+import json
+import logging
+import pickle
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from .engine import BacktestEngine
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+"""Bump when engine logic changes so stale results are not reused."""
+
+MEMORY_CACHE_SIZE = 32
+"""Maximum number of results kept in the in-process (L1) cache."""
+
+_memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def backtest_cache_key(
+    engine: "BacktestEngine",
+    price_data: Dict[str, pd.DataFrame],
+    signals: Optional[Dict[Union[str, date], List[Dict[str, Any]]]],
+    start_date: Optional[date],
+    end_date: Optional[date],
+) -> str:
+    """
+    Hash every input that can change a backtest's results.
+
+    Args:
+        engine: Engine whose configuration is being run
+        price_data: Dict of symbol -> OHLCV DataFrame
+        signals: Pre-computed signals passed to run_backtest
+        start_date: Backtest start date
+        end_date: Backtest end date
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    config = {
+        "version": CACHE_VERSION,
+        "initial_capital": engine.initial_capital,
+        "max_positions": engine.max_positions,
+        "risk_manager": type(engine.risk_manager).__qualname__,
+        "risk_params": vars(engine.risk_manager),
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+
+    for symbol in sorted(price_data):
+        df = price_data[symbol]
+        digest.update(symbol.encode())
+        digest.update(str(len(df)).encode())
+        digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+        for column in ("high", "low", "close"):
+            digest.update(
+                np.ascontiguousarray(df[column].to_numpy(dtype=np.float64))
+            )
+
+    signal_items = sorted(
+        (str(key), value) for key, value in (signals or {}).items()
+    )
+    digest.update(json.dumps(signal_items, sort_keys=True, default=str).encode())
+
+    return digest.hexdigest()
+
+
+def _load(cache_dir: Path, key: str) -> Optional[Dict[str, Any]]:
+    """Return cached results from L1, then L2, or None on a miss."""
+    payload = _memory_cache.get(key)
+    if payload is not None:
+        _memory_cache.move_to_end(key)
+        return pickle.loads(payload)
+
+    path = cache_dir / f"{key}.pkl"
+    if not path.exists():
+        return None
+    try:
+        payload = path.read_bytes()
+        results = pickle.loads(payload)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable backtest cache {path}: {e}")
+        return None
+
+    _remember(key, payload)
+    return results
+
+
+def _store(cache_dir: Path, key: str, results: Dict[str, Any]) -> None:
+    """Write results to both cache tiers."""
+    payload = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+    _remember(key, payload)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_dir / f"{key}.pkl.tmp"
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(cache_dir / f"{key}.pkl")
+    except OSError as e:
+        logger.warning(f"Could not persist backtest cache {key}: {e}")
+
+
+def _remember(key: str, payload: bytes) -> None:
+    """Insert into the L1 cache, evicting the least recently used entry."""
+    _memory_cache[key] = payload
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def clear_memory_cache() -> None:
+    """Drop all L1 entries (disk entries are left in place)."""
+    _memory_cache.clear()
+
+
+def cached_backtest(
+    run: Callable[..., Dict[str, Any]],
+) -> Callable[..., Dict[str, Any]]:
+    """
+    Decorate ``BacktestEngine.run_backtest`` with result caching.
+
+    Does nothing unless the engine was created with a ``cache_dir``. On a
+    hit the engine is reset and the stored results are returned without
+    replaying the simulation.
+    """
+
+    @functools.wraps(run)
+    def wrapper(
+        self: "BacktestEngine",
+        price_data: Dict[str, pd.DataFrame],
+        signals: Optional[Dict[Union[str, date], List[Dict[str, Any]]]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        if self.cache_dir is None:
+            return run(self, price_data, signals, start_date, end_date)
+
+        key = backtest_cache_key(self, price_data, signals, start_date, end_date)
+        cached = _load(self.cache_dir, key)
+        if cached is not None:
+            logger.debug(f"Backtest cache hit: {key}")
+            self.reset()
+            return cached
+
+        results = run(self, price_data, signals, start_date, end_date)
+        _store(self.cache_dir, key, results)
+        return results
+
+    return wrapper
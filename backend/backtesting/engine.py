@@ -1,10 +1,19 @@
 """Core backtesting engine with positions-first algorithm."""
+import heapq
 import logging
-from datetime import date
-from typing import Any, Dict, List, Optional
-
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
 import pandas as pd
 
+from backend.core.jit import njit
+
+from .cache import cached_backtest
 from .performance import PerformanceCalculator
 from .positions import Position, Trade
 from .risk_manager import RiskManager
@@ -12,6 +21,88 @@ from .utils import calculate_atr
 
 logger = logging.getLogger(__name__)
 
+def _normalize_signals(
+    signals: Optional[Dict[Union[str, date], List[Dict[str, Any]]]],
+) -> Dict[date, List[Dict[str, Any]]]:
+    """Key signals by ``date`` so the day loop can look them up directly."""
+    normalized: Dict[date, List[Dict[str, Any]]] = {}
+    for key, day_signals in (signals or {}).items():
+        if isinstance(key, str):
+            key = date.fromisoformat(key)
+        elif isinstance(key, datetime):
+            key = key.date()
+        normalized[key] = day_signals
+    return normalized
+
+
+def _index_days(index: pd.Index) -> np.ndarray:
+    """Convert a date or timestamp index to ``datetime64[D]`` values."""
+    if isinstance(index, pd.DatetimeIndex):
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return index.values.astype("datetime64[D]")
+    return np.asarray(index, dtype="datetime64[D]")
+
+
+EXIT_NONE = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+
+
+@njit(cache=True)
+def _mark_to_market(
+    close_row: np.ndarray,
+    atr_row: np.ndarray,
+    cols: np.ndarray,
+    shares: np.ndarray,
+    trigger_prices: np.ndarray,
+    prices: np.ndarray,
+    stops: np.ndarray,
+    targets: np.ndarray,
+    last_rows: np.ndarray,
+    n: int,
+    row: int,
+    atr_multiplier: float,
+    fallback_stop_pct: float,
+) -> tuple:
+    """
+    Update open-position slots for one day and flag exits.
+
+    Applies the same hybrid trailing-stop rule as
+    ``RiskManager.update_trailing_stop`` to every slot in place. A NaN
+    close means the symbol did not trade that day and leaves the slot
+    untouched. Until a slot's price reaches its precomputed trigger
+    price the stop cannot move, so ATR is not read at all.
+
+    Returns:
+        (change in total position value, per-slot EXIT_* codes)
+    """
+    value_delta = 0.0
+    exit_codes = np.zeros(n, dtype=np.int8)
+
+    for k in range(n):
+        price = close_row[cols[k]]
+        if not math.isnan(price):
+            value_delta += shares[k] * (price - prices[k])
+            prices[k] = price
+            last_rows[k] = row
+
+            if price >= trigger_prices[k]:
+                atr = atr_row[cols[k]]
+                if atr > 0:
+                    trailing_stop = price - atr_multiplier * atr
+                else:
+                    trailing_stop = price * (1 - fallback_stop_pct)
+                if trailing_stop > stops[k]:
+                    stops[k] = trailing_stop
+
+        if prices[k] <= stops[k]:
+            exit_codes[k] = EXIT_STOP_LOSS
+        elif prices[k] >= targets[k]:
+            exit_codes[k] = EXIT_TAKE_PROFIT
+
+    return value_delta, exit_codes
+
 
 class BacktestEngine:
     """
@@ -32,6 +123,7 @@ class BacktestEngine:
         initial_capital: float = 100000.0,
         max_positions: int = 10,
         risk_manager: Optional[RiskManager] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
     ):
         """
         Initialize backtesting engine.
@@ -40,30 +132,165 @@ class BacktestEngine:
             initial_capital: Starting capital
             max_positions: Maximum concurrent positions
             risk_manager: Risk management instance
+            cache_dir: Optional directory for cached results (see
+                backtesting.cache); caching is disabled when None
         """
         self.initial_capital = initial_capital
         self.cash = initial_capital
         self.max_positions = max_positions
         self.risk_manager = risk_manager or RiskManager()
         self.performance_calc = PerformanceCalculator()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
         self.positions: Dict[str, Position] = {}
         self.trades: List[Trade] = []
-        self.equity_curve: List[float] = []
+        # Preallocated per run (one slot per trading day) and filled by
+        # index; trimmed to the recorded length once the run finishes
+        self.equity_curve = np.empty(0, dtype=np.float64)
+        self._eq_i = 0
         self.peak_equity = initial_capital
 
+        # Running sum of open position market values (see
+        # _calculate_portfolio_value)
+        self._position_value = 0.0
+
+        # (date x symbol) price/ATR matrices built once per run
+        # (see _prepare_price_data); NaN where a symbol has no bar.
+        self._calendar: List[date] = []
+        self._row_of_date: Dict[date, int] = {}
+        self._col_of: Dict[str, int] = {}
+        self._close_mat = np.empty((0, 0))
+        self._atr_mat = np.empty((0, 0))
+        self._trading_dates: List[date] = []
+        self._pending_exits = np.zeros(0, dtype=np.int8)
+
+        # Open-position mirror for the daily kernel. Slot k holds the
+        # k-th entry of self.positions (insertion order); the Position
+        # objects are synced from it on exit and at the end of the run.
+        self._slot_symbols: List[str] = []
+        self._slot_of: Dict[str, int] = {}
+        self._allocate_slots(max_positions)
+
     def reset(self) -> None:
         """Reset engine state for new backtest."""
         self.cash = self.initial_capital
         self.positions = {}
         self.trades = []
-        self.equity_curve = []
+        self.equity_curve = np.empty(0, dtype=np.float64)
+        self._eq_i = 0
         self.peak_equity = self.initial_capital
+        self._position_value = 0.0
+        self._calendar = []
+        self._row_of_date = {}
+        self._col_of = {}
+        self._close_mat = np.empty((0, 0))
+        self._atr_mat = np.empty((0, 0))
+        self._trading_dates = []
+        self._pending_exits = np.zeros(0, dtype=np.int8)
+        self._slot_symbols = []
+        self._slot_of = {}
+
+    def _allocate_slots(self, capacity: int) -> None:
+        """Create (or grow) the per-slot position arrays."""
+        old = getattr(self, "_slot_arrays", ())
+        self._slot_cols = np.zeros(capacity, dtype=np.int64)
+        self._slot_shares = np.zeros(capacity)
+        self._slot_trigger_prices = np.zeros(capacity)
+        self._slot_prices = np.zeros(capacity)
+        self._slot_stops = np.zeros(capacity)
+        self._slot_targets = np.zeros(capacity)
+        self._slot_last_rows = np.zeros(capacity, dtype=np.int64)
+        self._slot_arrays = (
+            self._slot_cols,
+            self._slot_shares,
+            self._slot_trigger_prices,
+            self._slot_prices,
+            self._slot_stops,
+            self._slot_targets,
+            self._slot_last_rows,
+        )
+        for new_arr, old_arr in zip(self._slot_arrays, old):
+            new_arr[:len(old_arr)] = old_arr
+
+    def _add_slot(self, position: Position) -> None:
+        """Append a newly opened position to the slot arrays."""
+        n = len(self._slot_symbols)
+        if n == len(self._slot_prices):
+            self._allocate_slots(max(1, 2 * n))
+
+        self._slot_cols[n] = self._col_of[position.symbol]
+        self._slot_shares[n] = position.shares
+        self._slot_trigger_prices[n] = position.entry_price * (
+            1 + self.risk_manager.trailing_stop_trigger_pct
+        )
+        self._slot_prices[n] = position.current_price
+        self._slot_stops[n] = position.stop_loss
+        self._slot_targets[n] = position.take_profit
+        self._slot_last_rows[n] = self._row_of_date[position.current_date]
+        self._slot_of[position.symbol] = n
+        self._slot_symbols.append(position.symbol)
+
+    def _remove_slot(self, symbol: str) -> None:
+        """Drop a closed position, shifting later slots down to keep order."""
+        k = self._slot_of.pop(symbol)
+        n = len(self._slot_symbols)
+        for arr in self._slot_arrays:
+            arr[k:n - 1] = arr[k + 1:n]
+        del self._slot_symbols[k]
+        for later in self._slot_symbols[k:]:
+            self._slot_of[later] -= 1
+
+    def _sync_position(self, symbol: str) -> Position:
+        """Copy a slot's price, date and stop back onto its Position."""
+        position = self.positions[symbol]
+        k = self._slot_of[symbol]
+        position.update_price(
+            float(self._slot_prices[k]),
+            self._calendar[self._slot_last_rows[k]],
+        )
+        position.stop_loss = float(self._slot_stops[k])
+        return position
+
+    def _prepare_price_data(self, price_data: Dict[str, pd.DataFrame]) -> None:
+        """
+        Align all symbols onto one date axis as (date x symbol) matrices.
+
+        ATR only depends on the full price history, so it is computed
+        once per symbol here. The daily loop then reads one matrix row
+        per day instead of doing per-symbol label lookups.
+        """
+        symbol_days = {
+            symbol: _index_days(df.index) for symbol, df in price_data.items()
+        }
 
+        # Sorted union of every symbol's dates (C-level sort + dedup)
+        calendar = (
+            np.unique(np.concatenate(list(symbol_days.values())))
+            if symbol_days
+            else np.empty(0, dtype="datetime64[D]")
+        )
+        self._calendar = calendar.astype(object).tolist()
+        self._row_of_date = {d: i for i, d in enumerate(self._calendar)}
+        self._col_of = {symbol: j for j, symbol in enumerate(price_data)}
+
+        shape = (len(self._calendar), len(price_data))
+        self._close_mat = np.full(shape, np.nan)
+        self._atr_mat = np.full(shape, np.nan)
+
+        for symbol, df in price_data.items():
+            j = self._col_of[symbol]
+            rows = np.searchsorted(calendar, symbol_days[symbol])
+            self._close_mat[rows, j] = df["close"].to_numpy(dtype=np.float64)
+            if len(df) >= 14:
+                self._atr_mat[rows, j] = calculate_atr(
+                    df["high"], df["low"], df["close"]
+                ).to_numpy()
+
+    @cached_backtest
     def run_backtest(
         self,
         price_data: Dict[str, pd.DataFrame],
-        signals: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        signals: Optional[Dict[Union[str, date], List[Dict[str, Any]]]] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
     ) -> Dict[str, Any]:
@@ -72,7 +299,8 @@ class BacktestEngine:
 
         Args:
             price_data: Dict of symbol -> OHLCV DataFrame
-            signals: Optional pre-computed signals {date_str: [signal_dicts]}
+            signals: Optional pre-computed signals {date: [signal_dicts]};
+                keys may be ``date`` objects or ISO date strings
             start_date: Backtest start date
             end_date: Backtest end date
 
@@ -80,27 +308,30 @@ class BacktestEngine:
             Dict with performance metrics and trade history
         """
         self.reset()
+        self._prepare_price_data(price_data)
+        signals_by_date = _normalize_signals(signals)
 
         # Determine date range from data if not provided
-        all_dates = set()
-        for df in price_data.values():
-            all_dates.update(
-                df.index.date if hasattr(
-                    df.index, 'date') else df.index)
+        sorted_dates = self._calendar
 
-        if not all_dates:
+        if not sorted_dates:
             return self._get_results()
 
-        sorted_dates = sorted(all_dates)
         start = start_date or sorted_dates[0]
         end = end_date or sorted_dates[-1]
 
         # Filter to date range
-        trading_dates = [d for d in sorted_dates if start <= d <= end]
+        self._trading_dates = [d for d in sorted_dates if start <= d <= end]
+        self.equity_curve = np.empty(len(self._trading_dates), dtype=np.float64)
 
         # Main backtest loop
-        for current_date in trading_dates:
-            self._process_day(current_date, price_data, signals)
+        for current_date in self._trading_dates:
+            self._process_day(current_date, price_data, signals_by_date)
+
+        self.equity_curve = self.equity_curve[:self._eq_i]
+
+        for symbol in self.positions:
+            self._sync_position(symbol)
 
         return self._get_results()
 
@@ -108,7 +339,7 @@ class BacktestEngine:
         self,
         current_date: date,
         price_data: Dict[str, pd.DataFrame],
-        signals: Optional[Dict[str, List[Dict[str, Any]]]],
+        signals: Dict[date, List[Dict[str, Any]]],
     ) -> None:
         """Process a single trading day."""
         # STEP A: Update existing positions
@@ -119,60 +350,71 @@ class BacktestEngine:
 
         # STEP C: Update portfolio metrics
         portfolio_value = self._calculate_portfolio_value()
-        self.equity_curve.append(portfolio_value)
+        self.equity_curve[self._eq_i] = portfolio_value
+        self._eq_i += 1
         self.peak_equity = max(self.peak_equity, portfolio_value)
 
-        # STEP D-G: Process entries if signals provided
-        if signals:
-            date_str = str(current_date)
-            day_signals = signals.get(date_str, [])
-            self._process_entries(current_date, day_signals, price_data)
+        # STEP D-G: Process entries if signals provided. Nothing changes
+        # state between here and the entries, so reuse this tick's value.
+        day_signals = signals.get(current_date) if signals else None
+        if day_signals:
+            self._process_entries(
+                current_date,
+                day_signals,
+                price_data,
+                portfolio_value,
+                self._calculate_current_drawdown(portfolio_value),
+            )
 
     def _update_positions(
         self, current_date: date, price_data: Dict[str, pd.DataFrame]
     ) -> None:
         """Update all positions with current prices."""
-        for symbol, position in self.positions.items():
-            if symbol in price_data:
-                df = price_data[symbol]
-                # Get price for current date
-                if current_date in df.index:
-                    row = df.loc[current_date]
-                    position.update_price(row["close"], current_date)
-
-                    # Update trailing stop if applicable
-                    atr_val = None
-                    if len(df) >= 14:
-                        atr = calculate_atr(df["high"], df["low"], df["close"])
-                        if current_date in atr.index:
-                            atr_val = atr.loc[current_date]
-
-                    new_stop = self.risk_manager.update_trailing_stop(
-                        position, position.current_price, atr_val
-                    )
-                    position.stop_loss = new_stop
+        n = len(self._slot_symbols)
+        if n == 0:
+            return
+
+        row = self._row_of_date[current_date]
+        rm = self.risk_manager
+        value_delta, self._pending_exits = _mark_to_market(
+            self._close_mat[row],
+            self._atr_mat[row],
+            self._slot_cols,
+            self._slot_shares,
+            self._slot_trigger_prices,
+            self._slot_prices,
+            self._slot_stops,
+            self._slot_targets,
+            self._slot_last_rows,
+            n,
+            row,
+            rm.trailing_stop_atr_multiplier,
+            rm.initial_stop_loss_pct,
+        )
+        self._position_value += value_delta
 
     def _check_exits(
         self, current_date: date, price_data: Dict[str, pd.DataFrame]
     ) -> None:
         """Check and execute exit conditions."""
-        exit_signals = []
+        n = len(self._slot_symbols)
+        if n == 0:
+            return
 
-        for symbol, position in list(self.positions.items()):
-            # Check stop-loss
-            if position.current_price <= position.stop_loss:
-                exit_signals.append({
-                    "symbol": symbol,
-                    "reason": "STOP_LOSS",
-                    "price": position.current_price,
-                })
-            # Check take-profit
-            elif position.current_price >= position.take_profit:
-                exit_signals.append({
-                    "symbol": symbol,
-                    "reason": "TAKE_PROFIT",
-                    "price": position.current_price,
-                })
+        exit_signals = []
+        for k in np.flatnonzero(self._pending_exits[:n]):
+            symbol = self._slot_symbols[k]
+            reason = (
+                "STOP_LOSS"
+                if self._pending_exits[k] == EXIT_STOP_LOSS
+                else "TAKE_PROFIT"
+            )
+            exit_signals.append({
+                "symbol": symbol,
+                "reason": reason,
+                "price": float(self._slot_prices[k]),
+            })
+        self._pending_exits = np.zeros(0, dtype=np.int8)
 
         # Execute exits
         for exit_signal in exit_signals:
@@ -188,45 +430,67 @@ class BacktestEngine:
         current_date: date,
         day_signals: List[Dict[str, Any]],
         price_data: Dict[str, pd.DataFrame],
+        portfolio_value: float,
+        current_drawdown: float,
     ) -> None:
-        """Process entry signals for the day."""
-        # Sort by confidence
-        sorted_signals = sorted(
-            day_signals, key=lambda x: x.get("confidence", 0), reverse=True
+        """
+        Process entry signals for the day.
+
+        Args:
+            current_date: Trading day being processed
+            day_signals: Signals for current_date
+            price_data: Dict of symbol -> OHLCV DataFrame
+            portfolio_value: Portfolio value after today's exits
+            current_drawdown: Drawdown from peak at portfolio_value
+        """
+        if len(self.positions) >= self.max_positions:
+            return
+
+        # Drawdown only moves between days, so one check covers the batch
+        if self.risk_manager.check_drawdown_limit(current_drawdown):
+            return
+
+        # Stops, targets and sizes for every candidate in one vectorized
+        # call; the loop below only does the sequential slot/cash checks.
+        # Symbols without price data get NaN and are skipped.
+        row = self._close_mat[self._row_of_date[current_date]]
+        cols = np.array(
+            [self._col_of.get(signal.get("symbol"), -1)
+             for signal in day_signals],
+            dtype=np.int64,
+        )
+        prices = np.where(cols >= 0, row[cols], np.nan)
+        stops, targets, sizes = self.risk_manager.size_batch(
+            prices, portfolio_value
         )
 
-        portfolio_value = self._calculate_portfolio_value()
-        current_drawdown = self._calculate_current_drawdown()
+        # Pop by confidence lazily: usually only a few slots are open, so a
+        # heap avoids sorting the whole day's signals. The index tie-break
+        # keeps equal-confidence signals in input order, as sorted() did.
+        heap = [
+            (-signal.get("confidence", 0), i)
+            for i, signal in enumerate(day_signals)
+        ]
+        heapq.heapify(heap)
+
+        while heap:
+            i = heapq.heappop(heap)[1]
 
-        for signal in sorted_signals:
             # Check position slots
             if len(self.positions) >= self.max_positions:
                 break
 
-            # Check drawdown limit
-            if self.risk_manager.check_drawdown_limit(current_drawdown):
-                break
-
-            symbol = signal.get("symbol")
+            symbol = day_signals[i].get("symbol")
             if not symbol or symbol in self.positions:
                 continue
 
-            # Get entry price
-            if symbol not in price_data:
+            entry_price = float(prices[i])
+            if math.isnan(entry_price):
                 continue
-            df = price_data[symbol]
-            if current_date not in df.index:
-                continue
-
-            entry_price = df.loc[current_date, "close"]
-            stop_loss = self.risk_manager.calculate_initial_stop_loss(
-                entry_price)
-            take_profit = self.risk_manager.calculate_take_profit(entry_price)
+            stop_loss = float(stops[i])
+            take_profit = float(targets[i])
 
-            # Calculate position size
-            shares = self.risk_manager.calculate_position_size(
-                portfolio_value, entry_price, stop_loss
-            )
+            shares = int(sizes[i])
             if shares <= 0:
                 continue
 
@@ -270,6 +534,8 @@ class BacktestEngine:
         )
 
         self.positions[symbol] = position
+        self._add_slot(position)
+        self._position_value += position.current_value
         self.cash -= cost
 
         logger.info(f"ENTRY: {symbol} {shares} shares @ ${entry_price:.2f}")
@@ -282,7 +548,14 @@ class BacktestEngine:
         reason: str,
     ) -> None:
         """Execute position exit."""
+        self._sync_position(symbol)
         position = self.positions.pop(symbol)
+        self._remove_slot(symbol)
+        if self.positions:
+            self._position_value -= position.current_value
+        else:
+            # Re-anchor so float drift never outlives the open positions
+            self._position_value = 0.0
 
         proceeds = position.shares * exit_price
         profit_loss = proceeds - position.cost_basis
@@ -309,20 +582,27 @@ class BacktestEngine:
         )
 
     def _calculate_portfolio_value(self) -> float:
-        """Calculate total portfolio value."""
-        position_value = sum(p.current_value for p in self.positions.values())
-        return self.cash + position_value
+        """
+        Calculate total portfolio value.
 
-    def _calculate_current_drawdown(self) -> float:
-        """Calculate current drawdown from peak."""
-        current_value = self._calculate_portfolio_value()
+        Position value is maintained incrementally on entry, exit and
+        price update, so this is O(1) rather than a sum over positions.
+        """
+        return self.cash + self._position_value
+
+    def _calculate_current_drawdown(
+        self, current_value: Optional[float] = None
+    ) -> float:
+        """Calculate current drawdown from peak (at current_value if given)."""
+        if current_value is None:
+            current_value = self._calculate_portfolio_value()
         if self.peak_equity <= 0:
             return 0.0
         return (self.peak_equity - current_value) / self.peak_equity
 
     def _get_results(self) -> Dict[str, Any]:
         """Compile final backtest results."""
-        equity_series = pd.Series(self.equity_curve)
+        equity_series = pd.Series(self.equity_curve[:self._eq_i])
 
         metrics = self.performance_calc.calculate_all_metrics(
             trades=self.trades,
@@ -336,3 +616,72 @@ class BacktestEngine:
             "equity_curve": equity_series,
             "open_positions": list(self.positions.values()),
         }
+
+
+def _run_single_symbol(
+    symbol: str,
+    df: pd.DataFrame,
+    signals: Optional[Dict[Union[str, date], List[Dict[str, Any]]]],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    engine_kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Worker entry point: backtest one symbol on a fresh engine."""
+    engine = BacktestEngine(**engine_kwargs)
+    return engine.run_backtest({symbol: df}, signals, start_date, end_date)
+
+
+def run_parallel(
+    price_data: Dict[str, pd.DataFrame],
+    signals: Optional[Dict[Union[str, date], List[Dict[str, Any]]]] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    max_workers: Optional[int] = None,
+    **engine_kwargs: Any,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run independent single-symbol backtests across worker processes.
+
+    A portfolio backtest is path-dependent (shared cash and position
+    slots), so it cannot be split. When each symbol is evaluated on its
+    own engine, however, the runs are independent and scale with cores.
+
+    Args:
+        price_data: Dict of symbol -> OHLCV DataFrame
+        signals: Optional pre-computed signals {date: [signal_dicts]}
+        start_date: Backtest start date
+        end_date: Backtest end date
+        max_workers: Worker processes (default: os.cpu_count())
+        **engine_kwargs: Passed to each BacktestEngine
+
+    Returns:
+        Dict of symbol -> run_backtest results
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    workers = max_workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for symbol, df in price_data.items():
+            # Only ship each worker the signals it can act on
+            symbol_signals = None
+            if signals:
+                symbol_signals = {
+                    day: [s for s in day_signals if s.get("symbol") == symbol]
+                    for day, day_signals in signals.items()
+                }
+            future = executor.submit(
+                _run_single_symbol,
+                symbol,
+                df,
+                symbol_signals,
+                start_date,
+                end_date,
+                engine_kwargs,
+            )
+            futures[future] = symbol
+
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return results
@@ -1,5 +1,5 @@
 """Performance metrics calculator for backtesting."""
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -54,8 +54,19 @@ class PerformanceCalculator:
             total_return = 0.0
             days = 0
 
-        returns = equity_curve.pct_change().dropna() if len(
-            equity_curve) > 1 else pd.Series([])
+        # Daily returns straight from the values array; equivalent to
+        # pct_change().dropna() without building intermediate Series
+        equity = equity_curve.to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(equity) / equity[:-1]
+        returns = returns[~np.isnan(returns)]
+
+        # One pass over the returns feeds both risk-adjusted ratios
+        mean, std, downside_std = self._excess_return_stats(returns)
+
+        # Likewise, one pass over the trades feeds all trade statistics
+        total_trades = len(trades)
+        wins, gross_profit, gross_loss = self._trade_stats(trades)
 
         return {
             "total_return": total_return,
@@ -63,14 +74,16 @@ class PerformanceCalculator:
                 total_return, days
             ),
             "cagr": self.calculate_cagr(initial_capital, final_value, days),
-            "sharpe_ratio": self.calculate_sharpe_ratio(returns),
-            "sortino_ratio": self.calculate_sortino_ratio(returns),
-            "max_drawdown": self.calculate_max_drawdown(equity_curve),
-            "win_rate": self.calculate_win_rate(trades),
-            "profit_factor": self.calculate_profit_factor(trades),
-            "total_trades": len(trades),
-            "winning_trades": sum(1 for t in trades if t.is_winner),
-            "losing_trades": sum(1 for t in trades if not t.is_winner),
+            "sharpe_ratio": self._sharpe_from_stats(mean, std),
+            "sortino_ratio": self._sortino_from_stats(mean, downside_std),
+            "max_drawdown": self.calculate_max_drawdown(equity),
+            "win_rate": wins / total_trades if total_trades else 0.0,
+            "profit_factor": self._profit_factor_from(
+                gross_profit, gross_loss
+            ),
+            "total_trades": total_trades,
+            "winning_trades": wins,
+            "losing_trades": total_trades - wins,
             "final_value": final_value,
         }
 
@@ -96,6 +109,48 @@ class PerformanceCalculator:
             return 0.0
         return float((final_value / initial_value) ** (1 / years) - 1)
 
+    def _excess_return_stats(
+        self, returns: np.ndarray
+    ) -> Tuple[float, float, float]:
+        """
+        Compute excess-return mean, std and downside std in one place.
+
+        Uses sample std (ddof=1) like pandas. Std is NaN for a single
+        observation; downside std is 0.0 when there are no negative
+        excess returns (which the ratio helpers treat as "undefined").
+        Returns (nan, nan, 0.0) for an empty array.
+        """
+        if returns.size == 0:
+            return float("nan"), float("nan"), 0.0
+
+        daily_rf = self.risk_free_rate / self.trading_days_per_year
+        excess = returns - daily_rf
+
+        mean = float(excess.mean())
+        std = float(excess.std(ddof=1)) if excess.size > 1 else float("nan")
+
+        downside = excess[excess < 0]
+        if downside.size == 0:
+            downside_std = 0.0
+        elif downside.size == 1:
+            downside_std = float("nan")
+        else:
+            downside_std = float(downside.std(ddof=1))
+
+        return mean, std, downside_std
+
+    def _sharpe_from_stats(self, mean: float, std: float) -> float:
+        """Annualized Sharpe from precomputed excess-return stats."""
+        if np.isnan(mean) or std == 0:
+            return 0.0
+        return float(mean / std * np.sqrt(self.trading_days_per_year))
+
+    def _sortino_from_stats(self, mean: float, downside_std: float) -> float:
+        """Annualized Sortino from precomputed excess-return stats."""
+        if np.isnan(mean) or downside_std == 0:
+            return 0.0
+        return float(mean / downside_std * np.sqrt(self.trading_days_per_year))
+
     def calculate_sharpe_ratio(self, returns: pd.Series) -> float:
         """
         Calculate Sharpe Ratio.
@@ -103,15 +158,10 @@ class PerformanceCalculator:
         Sharpe = (Mean Return - Risk Free Rate) / Std Dev of Returns
         Annualized by sqrt(252)
         """
-        if returns.empty or returns.std() == 0:
-            return 0.0
-
-        daily_rf = self.risk_free_rate / self.trading_days_per_year
-        excess_returns = returns - daily_rf
-        sharpe = excess_returns.mean() / excess_returns.std()
-
-        # Annualize
-        return float(sharpe * np.sqrt(self.trading_days_per_year))
+        mean, std, _ = self._excess_return_stats(
+            np.asarray(returns, dtype=np.float64)
+        )
+        return self._sharpe_from_stats(mean, std)
 
     def calculate_sortino_ratio(self, returns: pd.Series) -> float:
         """
@@ -119,21 +169,10 @@ class PerformanceCalculator:
 
         Like Sharpe, but only uses downside deviation.
         """
-        if returns.empty:
-            return 0.0
-
-        daily_rf = self.risk_free_rate / self.trading_days_per_year
-        excess_returns = returns - daily_rf
-
-        # Downside deviation (only negative returns)
-        downside = excess_returns[excess_returns < 0]
-        if downside.empty or downside.std() == 0:
-            return 0.0
-
-        downside_std = downside.std()
-        sortino = excess_returns.mean() / downside_std
-
-        return float(sortino * np.sqrt(self.trading_days_per_year))
+        mean, _, downside_std = self._excess_return_stats(
+            np.asarray(returns, dtype=np.float64)
+        )
+        return self._sortino_from_stats(mean, downside_std)
 
     def calculate_max_drawdown(self, equity_curve: pd.Series) -> float:
         """
@@ -141,19 +180,48 @@ class PerformanceCalculator:
 
         Max drawdown = largest peak-to-trough decline
         """
-        if equity_curve.empty:
+        if len(equity_curve) == 0:
             return 0.0
 
-        peak = equity_curve.expanding().max()
-        drawdown = (equity_curve - peak) / peak
-        return float(abs(drawdown.min()))
+        equity = np.asarray(equity_curve, dtype=np.float64)
+        # fmax (not maximum) skips NaN like expanding().max() does
+        peak = np.fmax.accumulate(equity)
+        drawdown = (equity - peak) / peak
+        return float(abs(np.nanmin(drawdown)))
+
+    def _trade_stats(self, trades: List[Trade]) -> Tuple[int, float, float]:
+        """
+        Count winners and sum gross profit / gross loss in one pass.
+
+        Returns:
+            (winning trades, gross profit, gross loss as a positive number)
+        """
+        wins = 0
+        gross_profit = 0.0
+        gross_loss = 0.0
+        for t in trades:
+            pnl = t.profit_loss
+            if pnl > 0:
+                wins += 1
+                gross_profit += pnl
+            elif pnl < 0:
+                gross_loss -= pnl
+        return wins, gross_profit, gross_loss
+
+    def _profit_factor_from(
+        self, gross_profit: float, gross_loss: float
+    ) -> float:
+        """Profit factor from precomputed gross profit and loss."""
+        if gross_loss == 0:
+            return float("inf") if gross_profit > 0 else 0.0
+        return gross_profit / gross_loss
 
     def calculate_win_rate(self, trades: List[Trade]) -> float:
         """Calculate percentage of winning trades."""
         if not trades:
             return 0.0
-        winners = sum(1 for t in trades if t.is_winner)
-        return winners / len(trades)
+        wins, _, _ = self._trade_stats(trades)
+        return wins / len(trades)
 
     def calculate_profit_factor(self, trades: List[Trade]) -> float:
         """
@@ -161,11 +229,5 @@ class PerformanceCalculator:
 
         Profit Factor = Gross Profit / Gross Loss
         """
-        gross_profit = sum(t.profit_loss for t in trades if t.profit_loss > 0)
-        gross_loss = abs(
-            sum(t.profit_loss for t in trades if t.profit_loss < 0))
-
-        if gross_loss == 0:
-            return float("inf") if gross_profit > 0 else 0.0
-
-        return gross_profit / gross_loss
+        _, gross_profit, gross_loss = self._trade_stats(trades)
+        return self._profit_factor_from(gross_profit, gross_loss)
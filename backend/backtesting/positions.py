@@ -4,7 +4,7 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     Represents an open position in the portfolio.
@@ -55,7 +55,7 @@ class Position:
         self.current_date = dt
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
     Represents a completed trade (entry + exit).
@@ -1,5 +1,7 @@
 """Risk management module for backtesting."""
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from .positions import Position
 
@@ -126,6 +128,45 @@ class RiskManager:
 
         return min(shares_by_size, shares_by_risk)
 
+    def size_batch(
+        self,
+        prices: np.ndarray,
+        portfolio_value: float,
+        target_pct: float = 0.20,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized initial stop, take-profit and position size.
+
+        Element-wise equivalent of calculate_initial_stop_loss,
+        calculate_take_profit and calculate_position_size for a day's
+        candidate entries. Non-finite or non-positive prices get 0 shares.
+
+        Args:
+            prices: Entry prices
+            portfolio_value: Total portfolio value
+            target_pct: Take-profit target (default 20%)
+
+        Returns:
+            (stop-loss prices, take-profit prices, share counts as int64)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        stops = prices * (1 - self.initial_stop_loss_pct)
+        targets = prices * (1 + target_pct)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            by_size = (portfolio_value * self.max_position_size_pct) / prices
+            risk_per_share = prices - stops
+            by_risk = (portfolio_value * self.max_portfolio_risk_pct) / \
+                risk_per_share
+
+        # Same rule as calculate_position_size: risk sizing only applies
+        # when the stop sits below the entry
+        raw = np.where(risk_per_share > 0, np.minimum(by_size, by_risk), by_size)
+        valid = np.isfinite(raw) & (prices > 0)
+        shares = np.trunc(np.where(valid, raw, 0.0)).astype(np.int64)
+
+        return stops, targets, shares
+
     def check_drawdown_limit(self, current_drawdown: float) -> bool:
         """
         Check if drawdown exceeds limit.
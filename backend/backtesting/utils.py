@@ -1,8 +1,81 @@
 """Utility functions for backtesting."""
+import math
 from typing import List
 
+import numpy as np
 import pandas as pd
 
+from backend.core.jit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _nan_max(a: float, b: float) -> float:
+    """Max of two floats ignoring NaN (NaN only if both are NaN)."""
+    if math.isnan(a):
+        return b
+    if math.isnan(b):
+        return a
+    return a if a >= b else b
+
+
+@njit(cache=True)
+def _atr_core(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> np.ndarray:
+    """
+    Single-pass True Range + rolling mean kernel.
+
+    Keeps a running window sum (and a count of NaN entries in the window)
+    so each output value costs O(1), matching ``rolling(period).mean()``.
+    """
+    n = high.shape[0]
+    tr = np.empty(n)
+    out = np.full(n, np.nan)
+    window_sum = 0.0
+    window_nans = 0
+
+    for i in range(n):
+        value = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            value = _nan_max(value, abs(high[i] - prev_close))
+            value = _nan_max(value, abs(low[i] - prev_close))
+        tr[i] = value
+
+        if math.isnan(value):
+            window_nans += 1
+        else:
+            window_sum += value
+
+        if i >= period:
+            leaving = tr[i - period]
+            if math.isnan(leaving):
+                window_nans -= 1
+            else:
+                window_sum -= leaving
+
+        if i >= period - 1 and window_nans == 0:
+            out[i] = window_sum / period
+
+    return out
+
+
+def _atr_numpy(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> np.ndarray:
+    """
+    Vectorized ATR used when Numba is unavailable.
+
+    ``np.fmax`` ignores NaN like ``DataFrame.max(axis=1)`` does, without
+    materializing the intermediate 3-column DataFrame.
+    """
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+
+    tr = np.fmax.reduce(
+        [high - low, np.abs(high - prev_close), np.abs(low - prev_close)]
+    )
+    return pd.Series(tr).rolling(window=period).mean().to_numpy()
+
 
 def calculate_atr(
     high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14
@@ -21,15 +94,15 @@ def calculate_atr(
     Returns:
         ATR values as pandas Series
     """
-    high_low = high - low
-    high_close_prev = abs(high - close.shift(1))
-    low_close_prev = abs(low - close.shift(1))
-
-    tr = pd.concat([high_low, high_close_prev, low_close_prev],
-                   axis=1).max(axis=1)
-    atr = tr.rolling(window=period).mean()
-
-    return atr
+    kernel = _atr_core if NUMBA_AVAILABLE else _atr_numpy
+    atr = kernel(
+        high.to_numpy(dtype=np.float64),
+        low.to_numpy(dtype=np.float64),
+        close.to_numpy(dtype=np.float64),
+        period,
+    )
+
+    return pd.Series(atr, index=high.index)
 
 
 def get_trading_days(
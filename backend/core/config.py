@@ -10,7 +10,7 @@ Usage:
     api_key = settings.ZERODHA_API_KEY
 """
 
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -74,6 +74,12 @@ class Settings(BaseSettings):
     HISTORICAL_YEARS: int = 20
     """Number of years of historical data to load."""
 
+    DATA_CACHE_DIR: Optional[str] = None
+    """Directory for cached provider history (disabled when unset)."""
+
+    USE_FLOAT32_OHLC: bool = True
+    """Narrow prices to float32 / volume to int32 for indicator computation."""
+
     # ==============================================================================
     # Rate Limiting
     # ==============================================================================
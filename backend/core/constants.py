@@ -16,8 +16,16 @@ Usage:
 
     if mansfield_rs > TREND_TEMPLATE_RS_THRESHOLD:
         # Stock meets RS criteria
+
+Typing:
+    Every constant is annotated ``Final`` so type checkers flag
+    reassignment. Thresholds read inside per-symbol loops are also grouped
+    into frozen NamedTuples (e.g. ``TREND_TEMPLATE``) that callers can bind
+    to a local once.
 """
 
+from typing import Final, NamedTuple
+
 # ============================================================================
 # PATTERN RECOGNITION THRESHOLDS
 # ============================================================================
@@ -26,7 +34,7 @@ Usage:
 # Minervini Trend Template Criteria
 # -----------------------------------------------------------------------------
 
-TREND_TEMPLATE_RS_THRESHOLD = 70
+TREND_TEMPLATE_RS_THRESHOLD: Final[int] = 70
 """
 Minimum Mansfield Relative Strength score for Trend Template qualification.
 
@@ -35,7 +43,7 @@ Rationale: Minervini's research shows stocks with RS > 70 have higher
            probability of sustained upward moves.
 """
 
-TREND_TEMPLATE_PRICE_ABOVE_52W_LOW_PCT = 1.30
+TREND_TEMPLATE_PRICE_ABOVE_52W_LOW_PCT: Final[float] = 1.30
 """
 Price must be at least 30% above 52-week low (1.30x multiplier).
 
@@ -44,7 +52,7 @@ Rationale: Stocks still near 52-week lows are in Stage 4 decline or early Stage
            not ideal for trend-following strategies.
 """
 
-TREND_TEMPLATE_PRICE_WITHIN_52W_HIGH_PCT = 0.75
+TREND_TEMPLATE_PRICE_WITHIN_52W_HIGH_PCT: Final[float] = 0.75
 """
 Price must be within 25% of 52-week high (0.75x multiplier).
 
@@ -52,7 +60,7 @@ Purpose: Identify stocks in or near Stage 2 advance (leadership phase).
 Rationale: Stocks far from highs may have lost momentum or be consolidating.
 """
 
-TREND_TEMPLATE_MA_200_TREND_DAYS = 30
+TREND_TEMPLATE_MA_200_TREND_DAYS: Final[int] = 30
 """
 Number of days to lookback for 200-day MA uptrend validation.
 
@@ -60,11 +68,25 @@ Purpose: Confirm long-term moving average is sloping upward, not flat or down.
 Rationale: Upward-sloping 200-day MA indicates healthy long-term trend.
 """
 
+
+class TrendTemplate(NamedTuple):
+    """Trend Template thresholds grouped for single-lookup access in scans."""
+
+    price_above_52w_low_pct: float = TREND_TEMPLATE_PRICE_ABOVE_52W_LOW_PCT
+    price_within_52w_high_pct: float = TREND_TEMPLATE_PRICE_WITHIN_52W_HIGH_PCT
+    # The detector's one-month (20-row) 200-day MA uptrend lookback; it
+    # does not use the longer TREND_TEMPLATE_MA_200_TREND_DAYS
+    ma_200_trend_days: int = 20
+
+
+TREND_TEMPLATE: Final[TrendTemplate] = TrendTemplate()
+"""Default Trend Template thresholds (bind locally: ``tt = TREND_TEMPLATE``)."""
+
 # -----------------------------------------------------------------------------
 # VCP (Volatility Contraction Pattern) Detection
 # -----------------------------------------------------------------------------
 
-VCP_MIN_CONTRACTIONS = 2
+VCP_MIN_CONTRACTIONS: Final[int] = 2
 """
 Minimum number of pullback contractions required for valid VCP pattern.
 
@@ -73,7 +95,7 @@ Rationale: Fewer than 2 contractions doesn't demonstrate the "tightening"
            characteristic of VCP.
 """
 
-VCP_MAX_CONTRACTIONS = 4
+VCP_MAX_CONTRACTIONS: Final[int] = 4
 """
 Maximum number of pullback contractions for valid VCP pattern.
 
@@ -81,7 +103,7 @@ Purpose: Prevent overly complex or extended patterns.
 Rationale: Too many contractions may indicate indecision or weakening pattern.
 """
 
-VCP_TOLERANCE_PCT = 0.20
+VCP_TOLERANCE_PCT: Final[float] = 0.20
 """
 Tolerance (20%) for VCP pattern matching flexibility.
 
@@ -94,7 +116,7 @@ Example: If previous pullback was 5%, next pullback up to 6% (5% * 1.20) is acce
 # Cup and Handle Pattern
 # -----------------------------------------------------------------------------
 
-CUP_MIN_WEEKS = 7
+CUP_MIN_WEEKS: Final[int] = 7
 """
 Minimum duration in weeks for cup formation.
 
@@ -102,7 +124,7 @@ Purpose: Distinguish between valid cups and short-term consolidations.
 Rationale: Shorter consolidations lack the base-building characteristic.
 """
 
-CUP_MAX_WEEKS = 65
+CUP_MAX_WEEKS: Final[int] = 65
 """
 Maximum duration in weeks for cup formation.
 
@@ -110,7 +132,7 @@ Purpose: Prevent excessively long consolidations (may indicate weakness).
 Rationale: Patterns lasting over a year often lose their predictive power.
 """
 
-HANDLE_MAX_DEPTH_PCT = 0.12
+HANDLE_MAX_DEPTH_PCT: Final[float] = 0.12
 """
 Maximum depth of handle as percentage of cup depth (12%).
 
@@ -122,7 +144,7 @@ Rationale: Deep handles may indicate distribution rather than healthy pause.
 # RISK MANAGEMENT PARAMETERS
 # ============================================================================
 
-INITIAL_CAPITAL = 100000
+INITIAL_CAPITAL: Final[int] = 100000
 """
 Initial portfolio capital for backtesting ($100,000).
 
@@ -131,7 +153,7 @@ Rationale: Provides meaningful dollar amounts while being achievable for
            individual investors.
 """
 
-INITIAL_STOP_LOSS_PCT = 0.10
+INITIAL_STOP_LOSS_PCT: Final[float] = 0.10
 """
 Initial fixed stop-loss: 10% below entry price.
 
@@ -139,7 +161,7 @@ Purpose: Limit maximum loss on any single trade.
 Rationale: Minervini's 7-8% rule, rounded to 10% for conservative approach.
 """
 
-TRAILING_STOP_TRIGGER_PCT = 0.15
+TRAILING_STOP_TRIGGER_PCT: Final[float] = 0.15
 """
 Switch to trailing stop when position is up 15% from entry.
 
@@ -148,7 +170,7 @@ Rationale: Once position is profitable, use trailing stop to protect gains
            while giving room for continued upside.
 """
 
-TRAILING_STOP_ATR_MULTIPLIER = 2.0
+TRAILING_STOP_ATR_MULTIPLIER: Final[float] = 2.0
 """
 Trailing stop distance: 2x Average True Range (ATR) below current price.
 
@@ -156,7 +178,7 @@ Purpose: Set dynamic stop based on stock's volatility.
 Rationale: More volatile stocks need wider stops; ATR adapts automatically.
 """
 
-MAX_POSITION_SIZE_PCT = 0.10
+MAX_POSITION_SIZE_PCT: Final[float] = 0.10
 """
 Maximum position size as percentage of total portfolio (10%).
 
@@ -165,7 +187,7 @@ Rationale: No single position should dominate portfolio; 10% allows for
            10 positions minimum.
 """
 
-MAX_CONCURRENT_POSITIONS = 10
+MAX_CONCURRENT_POSITIONS: Final[int] = 10
 """
 Maximum number of open positions at any time.
 
@@ -174,7 +196,7 @@ Rationale: Too few positions = concentrated risk; too many = diluted returns
            and difficult to monitor.
 """
 
-PORTFOLIO_DRAWDOWN_LIMIT_PCT = 0.20
+PORTFOLIO_DRAWDOWN_LIMIT_PCT: Final[float] = 0.20
 """
 Halt new entries if portfolio drawdown exceeds 20%.
 
@@ -187,7 +209,7 @@ Rationale: 20% drawdown suggests systematic issues (bear market, strategy
 # PERFORMANCE TARGETS & THRESHOLDS
 # ============================================================================
 
-TARGET_FULL_SCAN_MINUTES = 30
+TARGET_FULL_SCAN_MINUTES: Final[int] = 30
 """
 Target: Complete full universe scan (10,000 symbols) in under 30 minutes.
 
@@ -196,7 +218,7 @@ Rationale: 30 minutes allows overnight batch processing while leaving buffer
            for other tasks. 15 minutes is ideal target.
 """
 
-TARGET_BACKTEST_MINUTES = 30
+TARGET_BACKTEST_MINUTES: Final[int] = 30
 """
 Target: Complete 20-year backtest (10,000 symbols) in under 30 minutes.
 
@@ -204,7 +226,7 @@ Purpose: Performance benchmark for backtesting engine efficiency.
 Rationale: Enables rapid iteration on strategy parameters without long waits.
 """
 
-DATA_INGESTION_SUCCESS_RATE_TARGET = 0.99
+DATA_INGESTION_SUCCESS_RATE_TARGET: Final[float] = 0.99
 """
 Target: 99% success rate for daily data ingestion.
 
@@ -213,7 +235,7 @@ Rationale: Occasional failures are acceptable (API outages), but consistent
            failures indicate systemic issues requiring attention.
 """
 
-DATABASE_QUERY_P95_LATENCY_MS = 500
+DATABASE_QUERY_P95_LATENCY_MS: Final[int] = 500
 """
 Target: 95th percentile database query latency under 500ms.
 
@@ -222,7 +244,7 @@ Rationale: 500ms is fast enough for batch processing; queries slower than
            this should be optimized (indexing, query structure).
 """
 
-API_RESPONSE_P95_LATENCY_MS = 2000
+API_RESPONSE_P95_LATENCY_MS: Final[int] = 2000
 """
 Target: 95th percentile API response time under 2 seconds.
 
@@ -234,7 +256,7 @@ Rationale: 2 seconds is upper bound for acceptable UX; faster is better.
 # DATA PROCESSING PARAMETERS
 # ============================================================================
 
-TRADING_DAYS_PER_YEAR = 252
+TRADING_DAYS_PER_YEAR: Final[int] = 252
 """
 Approximate number of trading days per year for return annualization.
 
@@ -242,7 +264,7 @@ Purpose: Convert daily returns to annualized returns for performance metrics.
 Rationale: US markets: ~252 trading days/year (365 - weekends - holidays).
 """
 
-RISK_FREE_RATE = 0.0
+RISK_FREE_RATE: Final[float] = 0.0
 """
 Risk-free rate for Sharpe/Sortino ratio calculations (default: 0%).
 
@@ -251,7 +273,7 @@ Rationale: Use 0% for simplicity in MVP; can be updated to T-bill rate
            (typically 2-5%) for production.
 """
 
-MANSFIELD_RS_SMOOTH_PERIOD = 52
+MANSFIELD_RS_SMOOTH_PERIOD: Final[int] = 52
 """
 Smoothing period for Mansfield Relative Strength calculation (52 weeks).
 
@@ -259,7 +281,7 @@ Purpose: Reduce noise in RS calculation while maintaining responsiveness.
 Rationale: 52-week (1 year) smoothing balances trend detection with lag.
 """
 
-INDICATOR_LOOKBACK_DAYS = 300
+INDICATOR_LOOKBACK_DAYS: Final[int] = 300
 """
 Default lookback period for indicator calculations (300 days).
 
@@ -267,59 +289,70 @@ Purpose: Ensure sufficient data for 200-day MA and other long-period indicators.
 Rationale: 200-day MA needs 200 days; 300 provides buffer for weekends/holidays.
 """
 
+INDICATOR_INCREMENTAL_WARMUP_DAYS: Final[int] = 450
+"""
+Calendar days of price history re-read before the last stored metrics
+date on incremental indicator runs (~310 trading days).
+
+Purpose: Recompute only the trailing window instead of the full history.
+Rationale: Covers the 252-day windows (52-week high/low, Mansfield RS)
+           and leaves RSI/MACD warm-up error far below stored precision;
+           the long EMAs are continued from their stored values.
+"""
+
 # ============================================================================
 # TECHNICAL INDICATOR PERIODS
 # ============================================================================
 
 # Moving Averages (Daily Timeframe)
-MA_PERIOD_50_DAY = 50
+MA_PERIOD_50_DAY: Final[int] = 50
 """50-day moving average period for daily charts."""
 
-MA_PERIOD_150_DAY = 150
+MA_PERIOD_150_DAY: Final[int] = 150
 """150-day moving average period for daily charts."""
 
-MA_PERIOD_200_DAY = 200
+MA_PERIOD_200_DAY: Final[int] = 200
 """200-day moving average period for daily charts."""
 
 # Moving Averages (Weekly Timeframe)
-MA_PERIOD_10_WEEK = 10
+MA_PERIOD_10_WEEK: Final[int] = 10
 """10-week moving average period for weekly charts (~ 50-day equivalent)."""
 
-MA_PERIOD_30_WEEK = 30
+MA_PERIOD_30_WEEK: Final[int] = 30
 """30-week moving average period for weekly charts (~ 150-day equivalent)."""
 
-MA_PERIOD_40_WEEK = 40
+MA_PERIOD_40_WEEK: Final[int] = 40
 """40-week moving average period for weekly charts (~ 200-day equivalent)."""
 
 # RSI (Relative Strength Index)
-RSI_PERIOD = 14
+RSI_PERIOD: Final[int] = 14
 """Default RSI period (14 days/periods)."""
 
-RSI_OVERBOUGHT_THRESHOLD = 70
+RSI_OVERBOUGHT_THRESHOLD: Final[int] = 70
 """RSI above 70 considered overbought."""
 
-RSI_OVERSOLD_THRESHOLD = 30
+RSI_OVERSOLD_THRESHOLD: Final[int] = 30
 """RSI below 30 considered oversold."""
 
 # MACD (Moving Average Convergence Divergence)
-MACD_FAST_PERIOD = 12
+MACD_FAST_PERIOD: Final[int] = 12
 """MACD fast EMA period (12 days)."""
 
-MACD_SLOW_PERIOD = 26
+MACD_SLOW_PERIOD: Final[int] = 26
 """MACD slow EMA period (26 days)."""
 
-MACD_SIGNAL_PERIOD = 9
+MACD_SIGNAL_PERIOD: Final[int] = 9
 """MACD signal line period (9 days)."""
 
 # ATR (Average True Range)
-ATR_PERIOD = 14
+ATR_PERIOD: Final[int] = 14
 """Default ATR period (14 days) for volatility measurement."""
 
 # ============================================================================
 # TESTING & COVERAGE
 # ============================================================================
 
-MIN_BRANCH_COVERAGE_PCT = 80
+MIN_BRANCH_COVERAGE_PCT: Final[int] = 80
 """
 Minimum branch coverage required for new/changed code (80%).
 
@@ -328,7 +361,7 @@ Rationale: 80% is achievable while allowing for edge cases and error paths
            that are difficult to test.
 """
 
-UNIT_TEST_MAX_DURATION_SECONDS = 10
+UNIT_TEST_MAX_DURATION_SECONDS: Final[int] = 10
 """
 Maximum duration for entire unit test suite (10 seconds).
 
@@ -340,7 +373,7 @@ Rationale: Slow tests discourage TDD and reduce productivity.
 # DATA VALIDATION THRESHOLDS
 # ============================================================================
 
-MAX_PRICE_CHANGE_PCT_PER_DAY = 0.50
+MAX_PRICE_CHANGE_PCT_PER_DAY: Final[float] = 0.50
 """
 Maximum acceptable single-day price change (50%) for data validation.
 
@@ -349,7 +382,7 @@ Rationale: While extreme moves happen, 50%+ moves are rare and should be
            manually reviewed.
 """
 
-MIN_VOLUME = 1
+MIN_VOLUME: Final[int] = 1
 """
 Minimum acceptable volume (1 share).
 
@@ -358,7 +391,7 @@ Rationale: Even thinly traded stocks have some volume; zero likely indicates
            data quality issue.
 """
 
-MAX_DAYS_MISSING_DATA = 10
+MAX_DAYS_MISSING_DATA: Final[int] = 10
 """
 Maximum consecutive days of missing data before flagging symbol as stale.
 
@@ -371,114 +404,159 @@ Rationale: More than 10 consecutive missing days suggests stock is no longer
 # FILE PATHS & NAMING
 # ============================================================================
 
-IDEAS_LOG_FILENAME = "ideas.csv"
+IDEAS_LOG_FILENAME: Final[str] = "ideas.csv"
 """Filename for pattern detection ideas log."""
 
-BACKTEST_RESULTS_PREFIX = "backtest_results"
+BACKTEST_RESULTS_PREFIX: Final[str] = "backtest_results"
 """Prefix for backtest result CSV files (datetime appended)."""
 
-APPLICATION_LOG_FILENAME = "application.log"
+APPLICATION_LOG_FILENAME: Final[str] = "application.log"
 """Filename for application logs."""
 
 # ============================================================================
 # API RATE LIMITING
 # ============================================================================
 
-API_RATE_LIMIT_BACKTEST_PER_MINUTE = 10
+API_RATE_LIMIT_BACKTEST_PER_MINUTE: Final[int] = 10
 """Maximum backtest API calls per minute per IP."""
 
-API_RATE_LIMIT_SCAN_PER_MINUTE = 20
+API_RATE_LIMIT_SCAN_PER_MINUTE: Final[int] = 20
 """Maximum pattern scan API calls per minute per IP."""
 
 # ============================================================================
 # DATABASE CONFIGURATION
 # ============================================================================
 
-DB_CONNECTION_POOL_SIZE = 10
+DB_CONNECTION_POOL_SIZE: Final[int] = 10
 """Database connection pool size."""
 
-DB_CONNECTION_TIMEOUT_SECONDS = 30
+DB_CONNECTION_TIMEOUT_SECONDS: Final[int] = 30
 """Database connection timeout (30 seconds)."""
 
-DB_QUERY_TIMEOUT_SECONDS = 60
+DB_QUERY_TIMEOUT_SECONDS: Final[int] = 60
 """Maximum query execution time before timeout (60 seconds)."""
 
+PRICE_DATA_CHUNK_INTERVAL_DAYS: Final[int] = 30
+"""TimescaleDB chunk width for price_data (one month of daily bars)."""
+
+PRICE_DATA_COMPRESS_AFTER_DAYS: Final[int] = 90
+"""Age after which price_data chunks are compressed (columnstore)."""
+
 # ============================================================================
 # RETRY & RESILIENCE
 # ============================================================================
 
-API_RETRY_MAX_ATTEMPTS = 3
+API_RETRY_MAX_ATTEMPTS: Final[int] = 3
 """Maximum retry attempts for failed API calls."""
 
-API_RETRY_BACKOFF_SECONDS = 1.0
+API_RETRY_BACKOFF_SECONDS: Final[float] = 1.0
 """Initial backoff duration for exponential retry (doubles each attempt)."""
 
-API_TIMEOUT_SECONDS = 30
+RATE_LIMIT_JITTER_SECONDS: Final[float] = 0.05
+"""Maximum random delay added to rate-limit waits and retry backoffs.
+
+Purpose: De-synchronise callers queued on the same limit so they do not
+hit the API in lockstep (and trip 429s) when their waits expire.
+"""
+
+API_TIMEOUT_SECONDS: Final[int] = 30
 """HTTP request timeout (30 seconds)."""
 
-DATA_INGESTION_RETRY_DELAY_SECONDS = 300
+DATA_INGESTION_RETRY_DELAY_SECONDS: Final[int] = 300
 """Wait 5 minutes before retrying failed data ingestion."""
 
 # ============================================================================
 # MARKET & EXCHANGE CONSTANTS
 # ============================================================================
 
-MARKET_US = "US"
+MARKET_US: Final[str] = "US"
 """United States Market Code."""
 
-MARKET_IN = "IN"
+MARKET_IN: Final[str] = "IN"
 """Indian Market Code."""
 
-EXCHANGE_NSE = "NSE"
+EXCHANGE_NSE: Final[str] = "NSE"
 """National Stock Exchange of India."""
 
-EXCHANGE_BSE = "BSE"
+EXCHANGE_BSE: Final[str] = "BSE"
 """Bombay Stock Exchange."""
 
-EXCHANGE_NYSE = "NYSE"
+EXCHANGE_NYSE: Final[str] = "NYSE"
 """New York Stock Exchange."""
 
-EXCHANGE_NASDAQ = "NASDAQ"
+EXCHANGE_NASDAQ: Final[str] = "NASDAQ"
 """Nasdaq Stock Market."""
 
-EXCHANGE_UNKNOWN = "UNKNOWN"
+EXCHANGE_UNKNOWN: Final[str] = "UNKNOWN"
 """Unknown Exchange."""
 
 # ============================================================================
 # DATA PROVIDER CONFIGURATION
 # ============================================================================
 
-YAHOO_RATE_LIMIT = 10.0
+YAHOO_RATE_LIMIT: Final[float] = 10.0
 """Yahoo Finance API rate limit (requests per second).
 
 Purpose: Prevent rate limiting from Yahoo Finance.
 Rationale: Yahoo Finance is lenient, but 10 req/s is conservative and safe.
 """
 
-ZERODHA_RATE_LIMIT = 3.0
+YAHOO_BATCH_SIZE: Final[int] = 20
+"""Tickers requested per yf.download call in batch history fetches.
+
+Purpose: Cut HTTP round-trips (and 429s) for multi-symbol loads.
+Rationale: Yahoo serves ~20 tickers per request reliably; larger groups
+are split by yfinance anyway and fail as a unit more often.
+"""
+
+ZERODHA_RATE_LIMIT: Final[float] = 3.0
 """Zerodha Kite Connect API rate limit (requests per second).
 
 Purpose: Comply with Zerodha API rate limits.
 Rationale: Kite Connect has documented limit of 3 req/s per API key.
 """
 
-INTERVAL_DAILY = "1d"
+INTERVAL_DAILY: Final[str] = "1d"
 """Daily data interval for Yahoo Finance."""
 
-INTERVAL_5MIN = "5m"
+INTERVAL_5MIN: Final[str] = "5m"
 """5-minute data interval."""
 
-BATCH_SIZE_INSERT = 100
+BATCH_SIZE_INSERT: Final[int] = 100
 """Batch size for database insertions."""
 
-URL_SP500_WIKIPEDIA = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+BATCH_SIZE_FETCH: Final[int] = 50
+"""Symbols handed to a provider per batch history fetch.
+
+Purpose: Overlap provider requests while bounding how much history is
+held in memory before it is written to the database.
+"""
+
+BATCH_SIZE_INDICATORS: Final[int] = 100
+"""Symbols whose price history is read in one query for indicator runs.
+
+Purpose: Replace one SELECT per symbol with one per batch.
+Rationale: ~100 symbols of daily history stays well under a few hundred
+MB of frames while cutting round-trips by two orders of magnitude.
+"""
+
+BATCH_SIZE_METRICS_ROWS: Final[int] = 50_000
+"""derived_metrics rows buffered across symbols before one bulk upsert.
+
+Purpose: Write many symbols per statement batch and commit instead of
+one upsert and commit per handful of symbols.
+Rationale: ~10-20 symbols of full daily history; a few tens of MB of
+parameter dicts, comfortably small for one transaction.
+"""
+
+URL_SP500_WIKIPEDIA: Final[str] = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
 """URL for fetching S&P 500 constituents."""
 
 # Column Mapping
-COL_OPEN = "open"
-COL_HIGH = "high"
-COL_LOW = "low"
-COL_CLOSE = "close"
-COL_VOLUME = "volume"
-COL_ADJ_CLOSE = "adjusted_close"
-COL_DATE = "date"
+COL_OPEN: Final[str] = "open"
+COL_HIGH: Final[str] = "high"
+COL_LOW: Final[str] = "low"
+COL_CLOSE: Final[str] = "close"
+COL_VOLUME: Final[str] = "volume"
+COL_ADJ_CLOSE: Final[str] = "adjusted_close"
+COL_DATE: Final[str] = "date"
@@ -11,21 +11,30 @@ Usage:
 
     with get_session() as session:
         result = session.execute(query)
+
+    # Async callers (requires sqlalchemy[asyncio] and psycopg v3)
+    async with get_async_session() as session:
+        result = await session.execute(query)
 """
 
 import logging
-from contextlib import contextmanager
-from typing import Generator
+import time
+from contextlib import asynccontextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Dict,
+    Optional,
+    Union,
+)
 
-from sqlalchemy import create_engine, event, text
+import pandas as pd
+from sqlalchemy import URL, Executable, create_engine, event, make_url, text
+from sqlalchemy.exc import DisconnectionError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 from backend.core.config import settings
 from backend.core.constants import (
@@ -33,8 +42,12 @@ from backend.core.constants import (
     API_RETRY_MAX_ATTEMPTS,
     DB_CONNECTION_POOL_SIZE,
     DB_CONNECTION_TIMEOUT_SECONDS,
+    DB_QUERY_TIMEOUT_SECONDS,
 )
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,12 +55,26 @@ logger = logging.getLogger(__name__)
 # Database Engine Configuration
 # ==============================================================================
 
+def _connect_args(database_url: str) -> Dict[str, Any]:
+    """Driver-level connection arguments for the configured backend."""
+    if make_url(database_url).get_backend_name() == "postgresql":
+        return {
+            "connect_timeout": DB_CONNECTION_TIMEOUT_SECONDS,
+            # Enforce the query timeout server-side
+            "options": f"-c statement_timeout={DB_QUERY_TIMEOUT_SECONDS * 1000}",
+        }
+    return {}
+
+
 engine = create_engine(
     settings.DATABASE_URL,
     poolclass=QueuePool,
     pool_size=DB_CONNECTION_POOL_SIZE,
     pool_timeout=DB_CONNECTION_TIMEOUT_SECONDS,
     pool_pre_ping=True,  # Verify connections before using
+    pool_recycle=1800,  # Replace connections before server idle timeouts
+    pool_use_lifo=True,  # Reuse the most recent (warm) connection first
+    connect_args=_connect_args(settings.DATABASE_URL),
     echo=settings.ENVIRONMENT == "development",  # SQL logging in dev mode
 )
 """Global database engine with connection pooling."""
@@ -66,6 +93,16 @@ def receive_close(dbapi_conn, connection_record):
     logger.debug("Database connection closed")
 
 
+_TRANSIENT_ERRORS = (
+    OperationalError,
+    DisconnectionError,
+    PoolTimeoutError,
+    ConnectionError,
+    TimeoutError,
+)
+"""Errors worth retrying; anything else (bad SQL, integrity, bugs) fails fast."""
+
+
 # ==============================================================================
 # Session Factory
 # ==============================================================================
@@ -82,8 +119,39 @@ SessionLocal = sessionmaker(
 # Session Management
 # ==============================================================================
 
-@contextmanager
-def get_session() -> Generator[Session, None, None]:
+class _SessionContext:
+    """Transactional scope returned by get_session.
+
+    A plain context manager class rather than a @contextmanager generator,
+    so each ``with get_session()`` skips the generator setup and resume.
+    """
+
+    __slots__ = ("session",)
+
+    def __enter__(self) -> Session:
+        self.session = SessionLocal()
+        return self.session
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        session = self.session
+        try:
+            if exc_type is None:
+                try:
+                    session.commit()
+                except Exception as e:
+                    session.rollback()
+                    logger.error("Database transaction rolled back: %s", e)
+                    raise
+                logger.debug("Database transaction committed")
+            elif issubclass(exc_type, Exception):
+                session.rollback()
+                logger.error("Database transaction rolled back: %s", exc)
+        finally:
+            session.close()
+        return False
+
+
+def get_session() -> _SessionContext:
     """Provide a transactional scope for database operations.
 
     This context manager automatically:
@@ -92,42 +160,24 @@ def get_session() -> Generator[Session, None, None]:
     - Rolls back on exception
     - Closes the session
 
-    Yields:
-        Session: SQLAlchemy session for database operations
+    Returns:
+        Context manager yielding a SQLAlchemy Session
 
     Example:
         >>> with get_session() as session:
         ...     result = session.query(Symbol).filter_by(symbol="AAPL").first()
         ...     print(result.name)
     """
-    session = SessionLocal()
-    try:
-        yield session
-        session.commit()
-        logger.debug("Database transaction committed")
-    except Exception as e:
-        session.rollback()
-        logger.error(f"Database transaction rolled back: {e}")
-        raise
-    finally:
-        session.close()
-
-
-@retry(
-    stop=stop_after_attempt(API_RETRY_MAX_ATTEMPTS),
-    wait=wait_exponential(
-        multiplier=API_RETRY_BACKOFF_SECONDS,
-        min=API_RETRY_BACKOFF_SECONDS,
-        max=60,
-    ),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
-)
+    return _SessionContext()
+
+
 def execute_with_retry(query_func, *args, **kwargs):
     """Execute a database query with automatic retry on failure.
 
     Uses exponential backoff retry strategy for transient failures
-    (network issues, connection timeouts, deadlocks).
+    (network issues, connection timeouts, deadlocks). Other errors are
+    raised immediately since retrying cannot fix them. The loop is plain
+    Python, so the common no-failure path costs a single call.
 
     Args:
         query_func: Function that executes the database query
@@ -147,12 +197,133 @@ def execute_with_retry(query_func, *args, **kwargs):
         >>>
         >>> symbols = execute_with_retry(fetch_symbols)
     """
-    logger.debug(f"Executing query with retry: {query_func.__name__}")
+    logger.debug("Executing query with retry: %s", query_func.__name__)
+    delay = API_RETRY_BACKOFF_SECONDS
+    for attempt in range(1, API_RETRY_MAX_ATTEMPTS + 1):
+        try:
+            return query_func(*args, **kwargs)
+        except _TRANSIENT_ERRORS as e:
+            logger.warning("Query failed, will retry: %s", e)
+            if attempt == API_RETRY_MAX_ATTEMPTS:
+                raise
+            time.sleep(min(delay, 60))
+            delay *= 2
+
+
+# ==============================================================================
+# Async Engine & Sessions
+# ==============================================================================
+
+_async_engine: Optional["AsyncEngine"] = None
+_async_session_factory: Optional["async_sessionmaker[AsyncSession]"] = None
+
+
+def _async_database_url(database_url: str) -> URL:
+    """Map the configured URL onto its asyncio driver."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        return url.set(drivername="postgresql+psycopg")
+    if backend == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    return url
+
+
+def get_async_engine() -> "AsyncEngine":
+    """Return the shared async engine, creating it on first use.
+
+    Created lazily because the asyncio stack (greenlet, plus psycopg v3
+    for PostgreSQL) is optional; sync-only processes never import it.
+    psycopg v3 can pipeline several statements on one connection, so
+    concurrent queries do not each pay a full round trip.
+
+    Returns:
+        AsyncEngine: Engine sharing the sync engine's pool settings
+    """
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_engine = create_async_engine(
+            _async_database_url(settings.DATABASE_URL),
+            pool_size=DB_CONNECTION_POOL_SIZE,
+            pool_timeout=DB_CONNECTION_TIMEOUT_SECONDS,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            pool_use_lifo=True,
+            connect_args=_connect_args(settings.DATABASE_URL),
+            echo=settings.ENVIRONMENT == "development",
+        )
+        _async_session_factory = async_sessionmaker(
+            _async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_engine
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator["AsyncSession", None]:
+    """Async counterpart of get_session.
+
+    Commits on success, rolls back on exception and always closes.
+
+    Yields:
+        AsyncSession: SQLAlchemy async session
+
+    Example:
+        >>> async with get_async_session() as session:
+        ...     await session.execute(insert(PriceData), rows)
+    """
+    get_async_engine()
+    session = _async_session_factory()
     try:
-        return query_func(*args, **kwargs)
+        yield session
+        await session.commit()
+        logger.debug("Async database transaction committed")
     except Exception as e:
-        logger.warning(f"Query failed, will retry: {e}")
+        await session.rollback()
+        logger.error("Async database transaction rolled back: %s", e)
         raise
+    finally:
+        await session.close()
+
+
+# ==============================================================================
+# Bulk Reads and Writes
+# ==============================================================================
+
+def bulk_read(
+    query: Union[str, Executable],
+    params: Optional[Dict[str, Any]] = None,
+    dtype: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """Read a query result straight into a DataFrame, bypassing the ORM.
+
+    Rows go from the DBAPI cursor into pandas without creating a mapped
+    object per row, and the connection streams results (server-side
+    cursor on PostgreSQL) so the driver does not buffer the whole result
+    as Python tuples first. Select explicit columns rather than entities.
+
+    Args:
+        query: SQL string or SQLAlchemy Core select of columns
+        params: Bind parameters for a SQL string
+        dtype: Optional column -> dtype mapping applied as the frame is built
+
+    Returns:
+        DataFrame with one column per selected column
+
+    Example:
+        >>> df = bulk_read(
+        ...     "SELECT date, close FROM price_data WHERE symbol_id = :sid",
+        ...     {"sid": 1},
+        ... )
+    """
+    if isinstance(query, str):
+        query = text(query)
+    with engine.connect() as conn:
+        conn = conn.execution_options(stream_results=True)
+        return pd.read_sql(query, conn, params=params, dtype=dtype)
 
 
 # ==============================================================================
@@ -172,10 +343,11 @@ def check_database_connection() -> bool:
         ...     print("Database connection failed")
     """
     try:
-        with get_session() as session:
-            session.execute(text("SELECT 1"))
+        # A bare pooled connection: no Session, identity map or commit
+        with engine.connect() as conn:
+            conn.exec_driver_sql("SELECT 1")
         logger.info("Database connection check: SUCCESS")
         return True
     except Exception as e:
-        logger.error(f"Database connection check: FAILED - {e}")
+        logger.error("Database connection check: FAILED - %s", e)
         return False
@@ -0,0 +1,26 @@
+"""Optional Numba JIT support for numeric kernels.
+
+Numba is pulled in transitively by pandas-ta, but kernels must keep
+working (just slower) when it is not importable.
+"""
+from typing import Any, Callable
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """No-op stand-in for ``numba.njit`` supporting both call styles."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
@@ -9,36 +9,127 @@ Implementations:
 - ZerodhaProvider: Indian market data via Kite Connect API
 """
 
+import asyncio
 import logging
+import math
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional, Tuple, Type
 
+import numpy as np
 import pandas as pd
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
-from backend.core.constants import API_RETRY_BACKOFF_SECONDS, API_RETRY_MAX_ATTEMPTS
+from backend.core.constants import (
+    API_RETRY_BACKOFF_SECONDS,
+    API_RETRY_MAX_ATTEMPTS,
+    RATE_LIMIT_JITTER_SECONDS,
+)
+from backend.core.jit import NUMBA_AVAILABLE, njit
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+"""OHLCV columns checked by validate_data, in block order."""
+
+_REQUIRED_COLUMN_SET = frozenset(_REQUIRED_COLUMNS)
+
+
+@njit(cache=True)
+def _first_invalid_row(arr: np.ndarray) -> int:
+    """Index of the first bad OHLCV row, or -1 if every row is valid.
+
+    ``arr`` is a (rows x 5) float64 block in open/high/low/close/volume
+    order. A row is bad if any value is NaN, the OHLC relationships are
+    broken, or volume is not positive. Stops at the first bad row.
+    """
+    for i in range(arr.shape[0]):
+        o = arr[i, 0]
+        h = arr[i, 1]
+        l = arr[i, 2]
+        c = arr[i, 3]
+        v = arr[i, 4]
+        # NaN compares False everywhere, so test it explicitly
+        if o != o or h != h or l != l or c != c or v != v:
+            return i
+        if h < l or h < o or h < c or l > o or l > c or v <= 0:
+            return i
+    return -1
+
+
+def _invalid_row_mask(arr: np.ndarray) -> np.ndarray:
+    """NumPy equivalent of _first_invalid_row: one mask over every check."""
+    o, h, l, c, v = arr.T
+    return np.logical_or.reduce((
+        h < l, h < o, h < c, l > o, l > c, v <= 0,
+        np.isnan(arr).any(axis=1),
+    ))
+
+
+_FLOAT32_PRICE_LIMIT = 2.0 ** 16
+"""Below this, float32 spacing (< 1/256) keeps prices within half a cent."""
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def downcast_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink OHLCV columns to 32-bit types for indicator computation.
+
+    Prices become float32 only if every price is below 2**16, where
+    float32 stays within half a cent of the original (the stored value is
+    not exact, so narrowed frames must not be written back); volume
+    becomes int32 (signed, so differences cannot wrap) if it fits.
+    Otherwise the column keeps its dtype, as do columns with missing
+    values. Halves the bytes moved by downstream operations.
+
+    Args:
+        df: Typed price_data rows or other compute-only OHLCV frame
+
+    Returns:
+        The same DataFrame, with narrowed columns
+    """
+    prices = [c for c in (*_REQUIRED_COLUMNS[:4], 'adjusted_close') if c in df]
+    if len(df) and np.abs(df[prices].to_numpy()).max() < _FLOAT32_PRICE_LIMIT:
+        for col in prices:
+            df[col] = df[col].astype(np.float32, copy=False)
+    if len(df) and not df['volume'].hasnans and df['volume'].max() <= _INT32_MAX:
+        df['volume'] = df['volume'].astype(np.int32, copy=False)
+    return df
+
 
 class DataProviderError(Exception):
     """Base exception for data provider errors."""
 
+    __slots__ = ()
+
 
 class RateLimitError(DataProviderError):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ()
+
 
 class DataNotFoundError(DataProviderError):
     """Raised when requested data is not available."""
 
+    __slots__ = ()
+
+
+class _RateState:
+    """Token bucket shared by every provider instance with the same key."""
+
+    __slots__ = ('lock', 'tokens', 'last_refill')
+
+    def __init__(self, capacity: float):
+        self.lock = threading.Lock()
+        # Goes negative while requests are queued for future slots
+        self.tokens = capacity
+        # Monotonic time of the last refill; None until first use
+        self.last_refill: Optional[float] = None
+
 
 class BaseDataProvider(ABC):
     """Abstract base class for all data providers.
@@ -54,9 +145,34 @@ class BaseDataProvider(ABC):
 
     Attributes:
         rate_limit: Maximum requests per second
-        last_request_time: Timestamp of last API request
+        _min_interval: Minimum seconds between requests (1 / rate_limit)
+        rate_limit_key: Upstream the limit applies to; instances sharing a
+            key share one request budget (default: the class name)
+        rate_burst: Token bucket capacity (default: 1, i.e. strict pacing)
+        rate_limit_errors: Client exceptions to treat as RateLimitError
     """
 
+    rate_limit_key: ClassVar[Optional[str]] = None
+
+    # Requests that may go out back-to-back after an idle period
+    rate_burst: ClassVar[float] = 1.0
+
+    # Provider exceptions that signal throttling (HTTP 429); retried with
+    # backoff by _retry_on_failure like RateLimitError
+    rate_limit_errors: ClassVar[Tuple[Type[BaseException], ...]] = ()
+
+    # Pacing state per rate_limit_key, so two instances of the same
+    # provider cannot each spend the full upstream budget
+    _rate_state: ClassVar[Dict[str, _RateState]] = {}
+
+    # Fixed attribute layout: no per-instance __dict__. Subclasses declare
+    # their own __slots__ for any state they add.
+    __slots__ = (
+        'rate_limit',
+        '_min_interval',
+        'logger',
+    )
+
     def __init__(self, rate_limit: float = 10.0):
         """Initialize the data provider.
 
@@ -64,47 +180,52 @@ class BaseDataProvider(ABC):
             rate_limit: Maximum requests per second (default: 10)
         """
         self.rate_limit = rate_limit
-        self.last_request_time: Optional[float] = None
+        self._min_interval = 1.0 / rate_limit
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def _enforce_rate_limit(self) -> None:
         """Enforce rate limiting by sleeping if necessary.
 
-        Calculates time elapsed since last request and sleeps
-        if needed to stay within rate limit.
+        A token bucket refilled at ``rate_limit`` tokens per second, holding
+        at most ``rate_burst``. Each request takes a token; without one it
+        reserves the next refill and sleeps until then, plus a little random
+        jitter so queued callers do not all fire in the same instant. Uses
+        the monotonic clock so wall-clock adjustments cannot skip or stretch
+        a wait. Safe to call from several threads (see
+        fetch_historical_data_batch), and shared across all instances with
+        the same ``rate_limit_key``.
         """
-        if self.last_request_time is None:
-            self.last_request_time = time.time()
-            return
-
-        # Calculate minimum time between requests
-        min_interval = 1.0 / self.rate_limit
-
-        # Calculate time elapsed since last request
-        elapsed = time.time() - self.last_request_time
+        key = self.rate_limit_key or self.__class__.__name__
+        state = self._rate_state.get(key)
+        if state is None:
+            # setdefault so racing first callers end up on the same state
+            state = BaseDataProvider._rate_state.setdefault(
+                key, _RateState(self.rate_burst))
+
+        # Take a token under the lock, then sleep outside it so
+        # concurrent batch fetches queue up behind each other
+        with state.lock:
+            now = time.monotonic()
+            if state.last_refill is not None:
+                refill = (now - state.last_refill) / self._min_interval
+                state.tokens = min(self.rate_burst, state.tokens + refill)
+            state.last_refill = now
+            state.tokens -= 1.0
+            wait = -state.tokens * self._min_interval
 
         # Sleep if needed to enforce rate limit
-        if elapsed < min_interval:
-            sleep_time = min_interval - elapsed
-            self.logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-
-        # Update last request time
-        self.last_request_time = time.time()
-
-    @retry(
-        stop=stop_after_attempt(API_RETRY_MAX_ATTEMPTS),
-        wait=wait_exponential(
-            multiplier=API_RETRY_BACKOFF_SECONDS,
-            min=API_RETRY_BACKOFF_SECONDS,
-            max=60,
-        ),
-        retry=retry_if_exception_type((RateLimitError, ConnectionError)),
-        reraise=True,
-    )
+        if wait > 0:
+            wait += random.uniform(0.0, RATE_LIMIT_JITTER_SECONDS)
+            self.logger.debug("Rate limiting: sleeping %.2fs", wait)
+            time.sleep(wait)
+
     def _retry_on_failure(self, func, *args, **kwargs):
         """Execute function with automatic retry on failure.
 
+        Retries RateLimitError, ConnectionError and the provider's
+        ``rate_limit_errors`` with jittered exponential backoff (capped at
+        60s); anything else is raised immediately.
+
         Args:
             func: Function to execute
             *args: Positional arguments for func
@@ -116,11 +237,17 @@ class BaseDataProvider(ABC):
         Raises:
             Exception: If all retry attempts fail
         """
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            self.logger.warning(f"Request failed, will retry: {e}")
-            raise
+        delay = API_RETRY_BACKOFF_SECONDS
+        for attempt in range(1, API_RETRY_MAX_ATTEMPTS + 1):
+            try:
+                return func(*args, **kwargs)
+            except (RateLimitError, ConnectionError, *self.rate_limit_errors) as e:
+                self.logger.warning("Request failed, will retry: %s", e)
+                if attempt == API_RETRY_MAX_ATTEMPTS:
+                    raise
+                time.sleep(
+                    min(delay, 60) + random.uniform(0.0, RATE_LIMIT_JITTER_SECONDS))
+                delay *= 2
 
     @abstractmethod
     def get_historical_data(
@@ -139,7 +266,10 @@ class BaseDataProvider(ABC):
             **kwargs: Provider-specific parameters
 
         Returns:
-            DataFrame with columns: date, open, high, low, close, volume, adjusted_close
+            DataFrame with columns: date, open, high, low, close, volume and,
+            for providers that apply split/dividend adjustments,
+            adjusted_close (consumers treat a missing one as close). Dates
+            are datetime64[ns] at exchange-local midnight.
 
         Raises:
             DataNotFoundError: If symbol data is not available
@@ -147,6 +277,126 @@ class BaseDataProvider(ABC):
             DataProviderError: For other provider-specific errors
         """
 
+    async def get_historical_data_async(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        **kwargs
+    ) -> pd.DataFrame:
+        """Awaitable form of get_historical_data.
+
+        The default runs the blocking client in a worker thread. Providers
+        with a native async client override this.
+
+        Args:
+            symbol: Ticker symbol
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            **kwargs: Provider-specific parameters
+
+        Returns:
+            DataFrame as returned by get_historical_data
+        """
+        return await asyncio.to_thread(
+            self.get_historical_data, symbol, start_date, end_date, **kwargs
+        )
+
+    async def fetch_historical_data_batch(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch historical data for many symbols concurrently.
+
+        Awaits get_historical_data_async per symbol so network latency
+        overlaps, while _enforce_rate_limit still paces the requests.
+        Symbols that fail with a DataProviderError are logged and left out
+        of the result.
+
+        Args:
+            symbols: Ticker symbols to fetch
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            max_concurrency: Requests in flight at once
+                (default: rate_limit, rounded up)
+            **kwargs: Provider-specific parameters, shared by all symbols
+
+        Returns:
+            Dict of symbol -> DataFrame for the symbols that succeeded
+        """
+        semaphore = asyncio.Semaphore(
+            max_concurrency or max(1, math.ceil(self.rate_limit))
+        )
+
+        async def fetch_one(symbol: str) -> Optional[pd.DataFrame]:
+            async with semaphore:
+                try:
+                    return await self.get_historical_data_async(
+                        symbol, start_date, end_date, **kwargs
+                    )
+                except DataProviderError as e:
+                    self.logger.warning("Batch fetch failed for %s: %s", symbol, e)
+                    return None
+
+        frames = await asyncio.gather(*(fetch_one(s) for s in symbols))
+        return {
+            symbol: df
+            for symbol, df in zip(symbols, frames)
+            if df is not None
+        }
+
+    def get_historical_data_batch(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, pd.DataFrame]:
+        """Blocking counterpart of fetch_historical_data_batch.
+
+        Runs get_historical_data on a thread pool (network I/O releases the
+        GIL), paced by _enforce_rate_limit. Unlike asyncio.run, this is also
+        safe to call from code already running inside an event loop.
+        Symbols that fail with a DataProviderError are logged and left out
+        of the result.
+
+        Args:
+            symbols: Ticker symbols to fetch
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            max_concurrency: Worker threads (default: rate_limit, rounded up)
+            **kwargs: Provider-specific parameters, shared by all symbols
+
+        Returns:
+            Dict of symbol -> DataFrame for the symbols that succeeded,
+            in input order
+        """
+        max_workers = max_concurrency or max(1, math.ceil(self.rate_limit))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                symbol: executor.submit(
+                    self.get_historical_data,
+                    symbol,
+                    start_date,
+                    end_date,
+                    **kwargs
+                )
+                for symbol in symbols
+            }
+
+        results: Dict[str, pd.DataFrame] = {}
+        for symbol, future in futures.items():
+            try:
+                results[symbol] = future.result()
+            except DataProviderError as e:
+                self.logger.warning("Batch fetch failed for %s: %s", symbol, e)
+        return results
+
     @abstractmethod
     def get_symbols_list(self, **kwargs) -> List[Dict[str, str]]:
         """Fetch list of available symbols.
@@ -198,44 +448,100 @@ class BaseDataProvider(ABC):
         Returns:
             True if data passes validation, False otherwise
         """
-        required_columns = ['open', 'high', 'low', 'close', 'volume']
+        required_columns = list(_REQUIRED_COLUMNS)
 
         # Check required columns present
-        if not all(col in df.columns for col in required_columns):
+        if not _REQUIRED_COLUMN_SET.issubset(df.columns):
             self.logger.error(
-                f"Missing required columns. Found: {
-                    df.columns.tolist()}")
+                "Missing required columns. Found: %s", list(df.columns))
+            return False
+
+        # Hand over the columns one by one: projecting with
+        # df[required_columns] would build a throwaway DataFrame first
+        return self.validate_data_arrays(
+            *(df[col] for col in required_columns))
+
+    def validate_data_arrays(
+        self,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+    ) -> bool:
+        """Validate OHLCV data held as separate column arrays.
+
+        Same checks as validate_data, for callers that already have
+        NumPy (or Arrow/Polars-exported) columns and no DataFrame.
+
+        Args:
+            opens: Open prices
+            highs: High prices
+            lows: Low prices
+            closes: Close prices
+            volumes: Volumes
+
+        Returns:
+            True if data passes validation, False otherwise
+        """
+        # One float64 (rows x 5) block; every check below is a view on it
+        try:
+            arr = np.column_stack([
+                np.asarray(col, dtype=np.float64)
+                for col in (opens, highs, lows, closes, volumes)
+            ])
+        except (TypeError, ValueError) as e:
+            self.logger.error("Unusable OHLCV data: %s", e)
             return False
+        return self._validate_block(arr)
+
+    def _validate_block(self, arr: np.ndarray) -> bool:
+        """Run the OHLCV checks on a (rows x 5) float64 block."""
+        required_columns = _REQUIRED_COLUMNS
+        n_rows = arr.shape[0]
+
+        # Pass/fail in one go: a compiled pass that stops at the first bad
+        # row, or a single fused mask without Numba. The per-check masks
+        # below then only run to report what failed.
+        if NUMBA_AVAILABLE:
+            valid = _first_invalid_row(arr) < 0
+        else:
+            valid = not _invalid_row_mask(arr).any()
+        if valid:
+            self.logger.debug("Data validation passed for %d rows", n_rows)
+            return True
+
+        o, h, l, c, v = arr.T
 
         # Check for null values
-        if df[required_columns].isnull().any().any():
-            null_counts = df[required_columns].isnull().sum()
-            self.logger.warning(f"Null values found: {
-                                null_counts[null_counts > 0].to_dict()}")
+        nulls = np.isnan(arr)
+        if nulls.any():
+            if self.logger.isEnabledFor(logging.WARNING):
+                counts = dict(zip(required_columns, nulls.sum(axis=0).tolist()))
+                self.logger.warning(
+                    "Null values found: %s",
+                    {col: n for col, n in counts.items() if n})
             return False
 
-        # Validate OHLC relationships
-        invalid_ohlc = (
-            (df['high'] < df['low']) |
-            (df['high'] < df['open']) |
-            (df['high'] < df['close']) |
-            (df['low'] > df['open']) |
-            (df['low'] > df['close'])
+        # Validate OHLC relationships in a single fused mask
+        invalid_ohlc = np.logical_or.reduce(
+            (h < l, h < o, h < c, l > o, l > c)
         )
 
         if invalid_ohlc.any():
             self.logger.error(
-                f"Invalid OHLC relationships in {
-                    invalid_ohlc.sum()} rows")
+                "Invalid OHLC relationships in %d rows",
+                np.count_nonzero(invalid_ohlc))
             return False
 
         # Check for non-positive volume
-        if (df['volume'] <= 0).any():
+        bad_volume = v <= 0
+        if bad_volume.any():
             self.logger.error(
-                f"Non-positive volume in {(df['volume'] <= 0).sum()} rows")
+                "Non-positive volume in %d rows", np.count_nonzero(bad_volume))
             return False
 
-        self.logger.debug(f"Data validation passed for {len(df)} rows")
+        self.logger.debug("Data validation passed for %d rows", n_rows)
         return True
 
     def __repr__(self) -> str:
@@ -0,0 +1,281 @@
+"""Local cache for provider history.
+
+Repeated loads and backtests request the same symbols over overlapping
+date ranges. CachedHistoryMixin keeps what has been fetched per
+(provider, symbol, options) in two tiers:
+
+- L1: an in-process LRU of DataFrames
+- L2: ``<cache_dir>/<Provider>/<symbol>.pkl`` files that survive restarts
+
+A request fully inside the cached range is answered locally with a
+binary-searched slice. Otherwise only the missing head and/or tail is
+fetched and merged in.
+
+Caching is opt-in: set ``DATA_CACHE_DIR`` in the environment, or assign
+``provider.cache_dir``.
+"""
+
+import hashlib
+import logging
+import pickle
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.core.config import settings
+from backend.core.constants import COL_DATE
+from backend.data_providers.base import BaseDataProvider, DataNotFoundError
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+"""Bump when the cached frame layout changes; older files are refetched.
+
+2: date column is datetime64 instead of datetime.date objects.
+"""
+
+MEMORY_CACHE_SIZE = 256
+"""Maximum number of symbol histories kept in the in-process (L1) cache."""
+
+_memory_cache: "OrderedDict[Path, Dict[str, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()  # batch fetches call in from worker threads
+
+
+def clear_memory_cache() -> None:
+    """Drop all L1 entries (disk entries are left in place)."""
+    with _memory_lock:
+        _memory_cache.clear()
+
+
+class CachedHistoryMixin(BaseDataProvider):
+    """Serve get_historical_data from a local cache where possible.
+
+    Providers implement the network fetch as ``_fetch_history`` (same
+    contract as ``get_historical_data``, bypassing the cache); this mixin
+    supplies ``get_historical_data`` on top of it::
+
+        class YahooFinanceProvider(CachedHistoryMixin, BaseDataProvider):
+            def _fetch_history(self, symbol, start_date, end_date, **kwargs):
+                ...
+
+    Attributes:
+        cache_dir: Cache root directory; None disables caching
+        end_date_inclusive: Whether the provider returns the end_date bar
+    """
+
+    __slots__ = ('cache_dir',)
+
+    end_date_inclusive = True
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.cache_dir: Optional[Path] = (
+            Path(settings.DATA_CACHE_DIR) if settings.DATA_CACHE_DIR else None
+        )
+
+    def get_historical_data(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        **kwargs
+    ) -> pd.DataFrame:
+        """Fetch historical data, reusing and extending the local cache."""
+        fetch = self._fetch_history
+        if self.cache_dir is None:
+            return fetch(symbol, start_date, end_date, **kwargs)
+
+        path = self._cache_path(symbol, kwargs)
+        entry = _load(path)
+
+        if entry is not None and entry["start"] <= start_date \
+                and end_date <= entry["end"]:
+            self.logger.debug(f"Cache hit for {symbol}")
+            return self._slice(entry["data"], start_date, end_date)
+
+        if entry is None:
+            data = fetch(symbol, start_date, end_date, **kwargs)
+            covered = (start_date, end_date)
+        else:
+            # Fetch only the ranges the cache does not cover yet. Inclusive
+            # providers already returned the boundary bars, so their gaps
+            # stop a day short of the cached range; exclusive ones never
+            # returned the bar at `end`, so the tail must start there.
+            frames: List[pd.DataFrame] = [entry["data"]]
+            overlap = timedelta(days=1 if self.end_date_inclusive else 0)
+            if start_date < entry["start"]:
+                frames.append(self._fetch_gap(
+                    fetch, symbol, start_date, entry["start"] - overlap, kwargs))
+            if end_date > entry["end"]:
+                frames.append(self._fetch_gap(
+                    fetch, symbol, entry["end"] + overlap, end_date, kwargs))
+            data = (
+                pd.concat([f for f in frames if not f.empty], ignore_index=True)
+                .drop_duplicates(subset=COL_DATE, keep="last")
+                .sort_values(COL_DATE, ignore_index=True)
+            )
+            covered = (min(start_date, entry["start"]),
+                       max(end_date, entry["end"]))
+
+        _write(path, data, *covered)
+        return self._slice(data, start_date, end_date)
+
+    def _cached_history(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        kwargs: Dict[str, Any],
+    ) -> Optional[pd.DataFrame]:
+        """Cached rows for a fully covered request, without fetching.
+
+        Returns:
+            The rows, or None if caching is off or the range is not covered
+
+        Raises:
+            DataNotFoundError: If the range is covered but has no rows
+        """
+        if self.cache_dir is None:
+            return None
+        entry = _load(self._cache_path(symbol, kwargs))
+        if entry is None or not (
+                entry["start"] <= start_date and end_date <= entry["end"]):
+            return None
+        return self._slice(entry["data"], start_date, end_date)
+
+    def _cache_history(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        data: pd.DataFrame,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Record a frame fetched outside get_historical_data (batch paths).
+
+        The rows are merged into the existing entry when the two ranges
+        overlap or touch; otherwise they replace it, so the covered range
+        never has a hole.
+        """
+        if self.cache_dir is None:
+            return
+        path = self._cache_path(symbol, kwargs)
+        entry = _load(path)
+        day = timedelta(days=1)
+        if entry is not None and start_date <= entry["end"] + day \
+                and end_date >= entry["start"] - day:
+            data = (
+                pd.concat([entry["data"], data], ignore_index=True)
+                .drop_duplicates(subset=COL_DATE, keep="last")
+                .sort_values(COL_DATE, ignore_index=True)
+            )
+            start_date = min(start_date, entry["start"])
+            end_date = max(end_date, entry["end"])
+        _write(path, data, start_date, end_date)
+
+    def _fetch_gap(
+        self,
+        fetch: Any,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        kwargs: Dict[str, Any],
+    ) -> pd.DataFrame:
+        """Fetch one uncovered range; an empty range is not an error."""
+        try:
+            return fetch(symbol, start_date, end_date, **kwargs)
+        except DataNotFoundError:
+            return pd.DataFrame()
+
+    def _slice(
+        self, data: pd.DataFrame, start_date: date, end_date: date
+    ) -> pd.DataFrame:
+        """Rows of a date-sorted frame inside [start_date, end_date]."""
+        dates = data[COL_DATE].to_numpy()
+        if dates.dtype.kind == "M":
+            # datetime64 column: compare against datetime64 bounds
+            start_key, end_key = np.datetime64(start_date), np.datetime64(end_date)
+        else:
+            start_key, end_key = start_date, end_date
+        lo = np.searchsorted(dates, start_key, side="left")
+        hi = np.searchsorted(
+            dates, end_key, side="right" if self.end_date_inclusive else "left"
+        )
+        if lo >= hi:
+            raise DataNotFoundError(
+                f"No data found for requested range {start_date} to {end_date}")
+        # Copy so callers cannot modify the cached frame in place
+        return data.iloc[lo:hi].reset_index(drop=True).copy()
+
+    def _cache_path(self, symbol: str, kwargs: Dict[str, Any]) -> Path:
+        """Cache file for a symbol and its provider-specific options."""
+        name = symbol.replace("/", "_")
+        options = sorted((k, str(v)) for k, v in kwargs.items() if v is not None)
+        if options:
+            digest = hashlib.sha256(repr(options).encode()).hexdigest()[:12]
+            name = f"{name}__{digest}"
+        return self.cache_dir / type(self).__name__ / f"{name}.pkl"
+
+
+def _load(path: Path) -> Optional[Dict[str, Any]]:
+    """Return a cache entry from L1, then L2, or None on a miss."""
+    with _memory_lock:
+        entry = _memory_cache.get(path)
+        if entry is not None:
+            _memory_cache.move_to_end(path)
+            return entry
+
+    if not path.exists():
+        return None
+    try:
+        entry = pickle.loads(path.read_bytes())
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable history cache {path}: {e}")
+        return None
+    if entry.get("version") != CACHE_VERSION:
+        logger.debug(f"Ignoring outdated history cache {path}")
+        return None
+
+    _remember(path, entry)
+    return entry
+
+
+def _write(path: Path, data: pd.DataFrame, start: date, end: date) -> None:
+    """Store data covering [start, end], leaving today's bar uncovered."""
+    # Today's bar may still change, so never mark it as covered
+    end = min(end, date.today() - timedelta(days=1))
+    if end >= start:
+        _store(path, {
+            "version": CACHE_VERSION,
+            "start": start,
+            "end": end,
+            "data": data,
+        })
+
+
+def _store(path: Path, entry: Dict[str, Any]) -> None:
+    """Write a cache entry to both tiers."""
+    _remember(path, entry)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".pkl.tmp")
+        tmp_path.write_bytes(
+            pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.warning(f"Could not persist history cache {path}: {e}")
+
+
+def _remember(path: Path, entry: Dict[str, Any]) -> None:
+    """Insert into the L1 cache, evicting the least recently used entry."""
+    with _memory_lock:
+        _memory_cache[path] = entry
+        _memory_cache.move_to_end(path)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
@@ -5,11 +5,17 @@ to fetch historical data and symbol information for US markets.
 """
 
 import logging
+import pickle
+import time
+from collections import OrderedDict
 from datetime import date
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
 
 from backend.core.constants import (
     COL_ADJ_CLOSE,
@@ -25,6 +31,7 @@ from backend.core.constants import (
     INTERVAL_DAILY,
     MARKET_US,
     URL_SP500_WIKIPEDIA,
+    YAHOO_BATCH_SIZE,
     YAHOO_RATE_LIMIT,
 )
 from backend.data_providers.base import (
@@ -32,11 +39,39 @@ from backend.data_providers.base import (
     DataNotFoundError,
     DataProviderError,
 )
+from backend.data_providers.cache import CachedHistoryMixin
 
 logger = logging.getLogger(__name__)
 
+# Our column -> yfinance column, in output order (date comes from the index)
+_YAHOO_COLUMNS: Dict[str, str] = {
+    COL_OPEN: 'Open',
+    COL_HIGH: 'High',
+    COL_LOW: 'Low',
+    COL_CLOSE: 'Close',
+    COL_VOLUME: 'Volume',
+    COL_ADJ_CLOSE: 'Adj Close',
+}
 
-class YahooFinanceProvider(BaseDataProvider):
+INFO_CACHE_SIZE = 4096
+"""Maximum number of Ticker.info results kept per provider."""
+
+INFO_CACHE_TTL_SECONDS = 60 * 60
+"""How long a Ticker.info result is reused."""
+
+SP500_CACHE_TTL_SECONDS = 24 * 60 * 60
+"""How long a fetched S&P 500 constituent list is reused."""
+
+# (fetched_at, symbols), shared by all provider instances in the process
+_sp500_cache: Optional[Tuple[float, List[Dict[str, str]]]] = None
+
+
+def _trading_days(index: pd.Index) -> np.ndarray:
+    """Naive datetime64[ns] dates (exchange-local midnight) for bar stamps."""
+    return pd.DatetimeIndex(index).tz_localize(None).normalize().to_numpy()
+
+
+class YahooFinanceProvider(CachedHistoryMixin, BaseDataProvider):
     """Yahoo Finance data provider implementation.
 
     Provides access to US market data via yfinance library.
@@ -55,6 +90,12 @@ class YahooFinanceProvider(BaseDataProvider):
         >>> symbols = provider.get_sp500_symbols()
     """
 
+    __slots__ = ('_info_cache',)
+    rate_limit_key = 'yahoo'
+    rate_limit_errors = (YFRateLimitError,)
+
+    end_date_inclusive = False  # yfinance treats `end` as exclusive
+
     def __init__(self, rate_limit: float = YAHOO_RATE_LIMIT):
         """Initialize Yahoo Finance provider.
 
@@ -62,10 +103,12 @@ class YahooFinanceProvider(BaseDataProvider):
             rate_limit: Maximum requests per second (default: 10)
         """
         super().__init__(rate_limit=rate_limit)
+        # symbol -> (fetched_at, Ticker.info), least recently used first
+        self._info_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
         self.logger.info(
             f"Initialized YahooFinanceProvider with rate_limit={rate_limit}/s")
 
-    def get_historical_data(
+    def _fetch_history(
         self,
         symbol: str,
         start_date: date,
@@ -74,6 +117,9 @@ class YahooFinanceProvider(BaseDataProvider):
     ) -> pd.DataFrame:
         """Fetch historical OHLCV data from Yahoo Finance.
 
+        Called through ``get_historical_data``, which serves cached ranges
+        first when a history cache is configured (see CachedHistoryMixin).
+
         Args:
             symbol: US ticker symbol (e.g., 'AAPL', 'MSFT')
             start_date: Start date for historical data
@@ -81,7 +127,8 @@ class YahooFinanceProvider(BaseDataProvider):
             **kwargs: Additional yfinance parameters (e.g., interval='1d')
 
         Returns:
-            DataFrame with columns: date, open, high, low, close, volume, adjusted_close
+            DataFrame with columns: date (datetime64), open, high, low, close,
+            volume, adjusted_close
 
         Raises:
             DataNotFoundError: If symbol data is not available
@@ -92,59 +139,16 @@ class YahooFinanceProvider(BaseDataProvider):
             >>> df = provider.get_historical_data('AAPL', date(2023, 1, 1), date(2023, 12, 31))
             >>> print(df.head())
         """
-        self._enforce_rate_limit()
-
         try:
             self.logger.debug(f"Fetching {symbol} from {
                               start_date} to {end_date}")
 
-            # Create ticker object
-            ticker = yf.Ticker(symbol)
-
-            # Fetch historical data
-            interval = kwargs.get('interval', INTERVAL_DAILY)
-            df = ticker.history(
-                start=start_date,
-                end=end_date,
-                interval=interval,
-                auto_adjust=False,  # Get raw prices and adjusted close separately
-            )
-
-            if df.empty:
+            frames = self._download([symbol], start_date, end_date, **kwargs)
+            df = frames.get(symbol)
+            if df is None:
                 raise DataNotFoundError(f"No data found for symbol {symbol}")
 
-            # Rename columns to match our schema
-            df = df.rename(columns={
-                'Open': COL_OPEN,
-                'High': COL_HIGH,
-                'Low': COL_LOW,
-                'Close': COL_CLOSE,
-                'Volume': COL_VOLUME,
-                'Adj Close': COL_ADJ_CLOSE,
-            })
-
-            # Reset index to have date as column
-            df = df.reset_index()
-            df = df.rename(columns={'Date': COL_DATE})
-
-            # Convert date to date object (remove time component)
-            df[COL_DATE] = pd.to_datetime(df[COL_DATE]).dt.date
-
-            # Select required columns
-            columns = [
-                COL_DATE,
-                COL_OPEN,
-                COL_HIGH,
-                COL_LOW,
-                COL_CLOSE,
-                COL_VOLUME,
-                COL_ADJ_CLOSE]
-            df = df[columns]
-
-            # Validate data
-            if not self.validate_data(df):
-                raise DataProviderError(f"Data validation failed for {symbol}")
-
+            df = self._normalize(df, symbol)
             self.logger.info(f"Fetched {len(df)} rows for {symbol}")
             return df
 
@@ -154,9 +158,146 @@ class YahooFinanceProvider(BaseDataProvider):
             self.logger.error(f"Error fetching data for {symbol}: {e}")
             raise DataProviderError(f"Failed to fetch data for {symbol}: {e}")
 
-    def get_sp500_symbols(self) -> List[Dict[str, str]]:
+    def get_historical_data_batch(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch historical data for many symbols, YAHOO_BATCH_SIZE per request.
+
+        Uses one multi-ticker yf.download call per group instead of one
+        request per symbol. With a history cache configured, symbols whose
+        range is already cached are served locally and only the rest are
+        downloaded (and then cached). Symbols with no data or failing
+        validation are logged and left out.
+
+        Args:
+            symbols: Ticker symbols to fetch
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            max_concurrency: Unused; downloads are batched per request
+            **kwargs: Additional yfinance parameters (e.g., interval='1d')
+
+        Returns:
+            Dict of symbol -> DataFrame for the symbols that succeeded
+        """
+        results: Dict[str, pd.DataFrame] = {}
+        pending: List[str] = []
+        for symbol in symbols:
+            try:
+                cached = self._cached_history(symbol, start_date, end_date, kwargs)
+            except DataNotFoundError:
+                self.logger.warning(f"No data found for symbol {symbol}")
+                continue
+            if cached is None:
+                pending.append(symbol)
+            else:
+                results[symbol] = cached
+        from_cache = len(results)
+
+        for i in range(0, len(pending), YAHOO_BATCH_SIZE):
+            chunk = pending[i:i + YAHOO_BATCH_SIZE]
+            try:
+                frames = self._download(chunk, start_date, end_date, **kwargs)
+            except Exception as e:
+                self.logger.warning(f"Batch download failed for {chunk}: {e}")
+                continue
+
+            for symbol in chunk:
+                if symbol not in frames:
+                    self.logger.warning(f"No data found for symbol {symbol}")
+                    continue
+                try:
+                    df = self._normalize(frames[symbol], symbol)
+                except DataProviderError as e:
+                    self.logger.warning(f"Batch fetch failed for {symbol}: {e}")
+                    continue
+                self._cache_history(symbol, start_date, end_date, df, kwargs)
+                # Callers get their own copy; the cache keeps df
+                results[symbol] = df.copy()
+
+        self.logger.info(
+            f"Fetched {len(results)}/{len(symbols)} symbols in batch "
+            f"({from_cache} from cache)")
+        return results
+
+    def _download(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        **kwargs
+    ) -> Dict[str, pd.DataFrame]:
+        """Download raw yfinance history for several tickers in one request.
+
+        Returns:
+            Dict of symbol -> raw yfinance frame, omitting symbols without data
+        """
+        self._enforce_rate_limit()
+
+        raw = self._retry_on_failure(
+            yf.download,
+            symbols,
+            start=start_date,
+            end=end_date,
+            interval=kwargs.get('interval', INTERVAL_DAILY),
+            group_by='ticker',
+            threads=True,
+            auto_adjust=False,  # Get raw prices and adjusted close separately
+            progress=False,
+        )
+        if raw is None or raw.empty:
+            return {}
+
+        frames = {}
+        for symbol in symbols:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if symbol not in raw.columns.get_level_values(0):
+                    continue
+                df = raw.xs(symbol, axis=1, level=0)
+            else:
+                df = raw  # single-ticker download without a ticker level
+            # Failed tickers come back as all-NaN columns
+            df = df.dropna(how='all')
+            if not df.empty:
+                frames[symbol] = df
+        return frames
+
+    def _normalize(self, df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        """Map a raw yfinance frame onto our schema and validate it."""
+        try:
+            # Build the output frame directly from the source columns: one
+            # allocation instead of rename -> reset_index -> select copies.
+            # Dates come from the index as datetime64 at local midnight.
+            df = pd.DataFrame({
+                COL_DATE: _trading_days(df.index),
+                **{
+                    ours: df[theirs].to_numpy()
+                    for ours, theirs in _YAHOO_COLUMNS.items()
+                },
+            })
+        except KeyError as e:
+            raise DataProviderError(f"Unexpected columns for {symbol}: {e}")
+
+        # Validate data
+        if not self.validate_data(df):
+            raise DataProviderError(f"Data validation failed for {symbol}")
+        return df
+
+    def get_sp500_symbols(
+        self, force_refresh: bool = False
+    ) -> List[Dict[str, str]]:
         """Fetch S&P 500 constituent symbols from Wikipedia.
 
+        The list changes only a few times a year, so it is cached for 24
+        hours in-process and, when ``cache_dir`` is set, on disk.
+
+        Args:
+            force_refresh: Ignore cached copies and fetch again
+
         Returns:
             List of dictionaries with S&P 500 company information
 
@@ -168,6 +309,16 @@ class YahooFinanceProvider(BaseDataProvider):
             >>> symbols = provider.get_sp500_symbols()
             >>> print(f"Found {len(symbols)} S&P 500 companies")
         """
+        global _sp500_cache
+
+        now = time.time()
+        if not force_refresh:
+            symbols = self._cached_sp500_symbols(now)
+            if symbols is not None:
+                self.logger.debug("Using cached S&P 500 list")
+                # Copies, so callers cannot modify the cached entries
+                return [dict(s) for s in symbols]
+
         try:
             self.logger.info("Fetching S&P 500 constituents from Wikipedia")
 
@@ -176,24 +327,65 @@ class YahooFinanceProvider(BaseDataProvider):
             tables = pd.read_html(url)
             sp500_table = tables[0]
 
-            # Extract relevant columns
-            symbols = []
-            for _, row in sp500_table.iterrows():
-                symbols.append({
-                    'symbol': row['Symbol'],
-                    'name': row['Security'],
-                    'exchange': EXCHANGE_NYSE if 'NYSE' in str(row.get('Exchange', '')) else EXCHANGE_NASDAQ,
-                    'market': MARKET_US,
-                    'sector': row.get('GICS Sector', 'Unknown'),
-                })
+            # Build the records column-wise instead of row by row
+            exchange = sp500_table.get('Exchange', pd.Series('', index=sp500_table.index))
+            symbols = pd.DataFrame({
+                'symbol': sp500_table['Symbol'],
+                'name': sp500_table['Security'],
+                'exchange': np.where(
+                    exchange.astype(str).str.contains('NYSE', regex=False),
+                    EXCHANGE_NYSE,
+                    EXCHANGE_NASDAQ,
+                ),
+                'market': MARKET_US,
+                'sector': sp500_table.get('GICS Sector', 'Unknown'),
+            }).to_dict('records')
 
             self.logger.info(f"Fetched {len(symbols)} S&P 500 symbols")
-            return symbols
 
         except Exception as e:
             self.logger.error(f"Error fetching S&P 500 list: {e}")
             raise DataProviderError(f"Failed to fetch S&P 500 list: {e}")
 
+        _sp500_cache = (now, symbols)
+        path = self._sp500_cache_path()
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(pickle.dumps(symbols))
+            except OSError as e:
+                self.logger.warning(f"Could not persist S&P 500 list: {e}")
+
+        return [dict(s) for s in symbols]
+
+    def _cached_sp500_symbols(self, now: float) -> Optional[List[Dict[str, str]]]:
+        """Fresh S&P 500 list from memory, then disk, or None."""
+        global _sp500_cache
+
+        if _sp500_cache is not None and now - _sp500_cache[0] < SP500_CACHE_TTL_SECONDS:
+            return _sp500_cache[1]
+
+        path = self._sp500_cache_path()
+        if path is None or not path.exists():
+            return None
+        fetched_at = path.stat().st_mtime
+        if now - fetched_at >= SP500_CACHE_TTL_SECONDS:
+            return None
+        try:
+            symbols = pickle.loads(path.read_bytes())
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable S&P 500 cache {path}: {e}")
+            return None
+
+        _sp500_cache = (fetched_at, symbols)
+        return symbols
+
+    def _sp500_cache_path(self) -> Optional[Path]:
+        """Disk location of the S&P 500 list, or None without a cache_dir."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / type(self).__name__ / "_sp500.pkl"
+
     def get_symbols_list(self, **kwargs) -> List[Dict[str, str]]:
         """Fetch list of available symbols.
 
@@ -246,11 +438,8 @@ class YahooFinanceProvider(BaseDataProvider):
             >>> provider.validate_symbol('AAPL')  # True
             >>> provider.validate_symbol('INVALID_SYMBOL')  # False
         """
-        self._enforce_rate_limit()
-
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = self._get_info(symbol)
 
             # Check if we got valid info back
             if not info or 'regularMarketPrice' not in info:
@@ -279,11 +468,8 @@ class YahooFinanceProvider(BaseDataProvider):
             >>> info = provider.get_symbol_info('AAPL')
             >>> print(info['name'], info['sector'])
         """
-        self._enforce_rate_limit()
-
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = self._get_info(symbol)
 
             if not info:
                 return None
@@ -299,3 +485,26 @@ class YahooFinanceProvider(BaseDataProvider):
         except Exception as e:
             self.logger.error(f"Error getting info for {symbol}: {e}")
             return None
+
+    def _get_info(self, symbol: str) -> Dict:
+        """Ticker.info for a symbol, reusing recent lookups.
+
+        Ticker.info is a network fetch plus a large JSON parse, and the
+        usual flow (validate_symbol, then get_symbol_info) asks for the same
+        symbol twice. Entries expire after INFO_CACHE_TTL_SECONDS since
+        company details do change (sector reclassification etc.).
+        """
+        now = time.time()
+        cached = self._info_cache.get(symbol)
+        if cached is not None and now - cached[0] < INFO_CACHE_TTL_SECONDS:
+            self._info_cache.move_to_end(symbol)
+            return cached[1]
+
+        self._enforce_rate_limit()
+        info = self._retry_on_failure(lambda: yf.Ticker(symbol).info)
+
+        self._info_cache[symbol] = (now, info)
+        self._info_cache.move_to_end(symbol)
+        while len(self._info_cache) > INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+        return info
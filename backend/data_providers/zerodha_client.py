@@ -6,10 +6,13 @@ to fetch historical data and instrument information for Indian markets.
 
 import logging
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from kiteconnect import KiteConnect
+from kiteconnect.exceptions import NetworkException
 
 from backend.core.config import settings
 from backend.core.constants import (
@@ -29,11 +32,27 @@ from backend.data_providers.base import (
     DataNotFoundError,
     DataProviderError,
 )
+from backend.data_providers.cache import CachedHistoryMixin
+
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    PYARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+INSTRUMENTS_CACHE_TTL = timedelta(hours=24)
+"""How long a downloaded instruments list is reused."""
+
+_CATEGORICAL_INSTRUMENT_COLUMNS = ('exchange', 'instrument_type', 'segment')
+
+# High-cardinality string columns, stored as Arrow strings when available
+_ARROW_STRING_INSTRUMENT_COLUMNS = ('tradingsymbol', 'name')
 
-class ZerodhaProvider(BaseDataProvider):
+
+class ZerodhaProvider(CachedHistoryMixin, BaseDataProvider):
     """Zerodha Kite Connect data provider implementation.
 
     Provides access to Indian market data via Kite Connect API.
@@ -56,6 +75,10 @@ class ZerodhaProvider(BaseDataProvider):
         >>> instruments = provider.get_nse_instruments()
     """
 
+    __slots__ = ('kite', '_instruments_cache', '_cache_timestamp', '_token_index')
+    rate_limit_key = 'zerodha'
+    rate_limit_errors = (NetworkException,)  # Kite raises this for HTTP 429
+
     def __init__(self, rate_limit: float = ZERODHA_RATE_LIMIT):
         """Initialize Zerodha provider.
 
@@ -75,6 +98,8 @@ class ZerodhaProvider(BaseDataProvider):
             # Cache for instrument tokens
             self._instruments_cache: Optional[pd.DataFrame] = None
             self._cache_timestamp: Optional[datetime] = None
+            # (tradingsymbol, exchange) -> instrument_token, rebuilt with the cache
+            self._token_index: Dict[Tuple[str, str], int] = {}
 
             self.logger.info(
                 f"Initialized ZerodhaProvider with rate_limit={rate_limit}/s")
@@ -86,7 +111,9 @@ class ZerodhaProvider(BaseDataProvider):
     def _get_instruments(self, force_refresh: bool = False) -> pd.DataFrame:
         """Get instruments list with caching.
 
-        Instruments are cached for 24 hours to avoid excessive API calls.
+        Instruments are cached for 24 hours to avoid excessive API calls,
+        in memory and, when ``cache_dir`` is set, on disk so that new
+        processes skip the download too.
 
         Args:
             force_refresh: Force refresh of cache
@@ -99,32 +126,102 @@ class ZerodhaProvider(BaseDataProvider):
             not force_refresh
             and self._instruments_cache is not None
             and self._cache_timestamp is not None
-            and (datetime.now() - self._cache_timestamp) < timedelta(hours=24)
+            and (datetime.now() - self._cache_timestamp) < INSTRUMENTS_CACHE_TTL
         ):
             self.logger.debug("Using cached instruments list")
             return self._instruments_cache
 
+        if not force_refresh and self._load_instruments_from_disk():
+            return self._instruments_cache
+
         # Fetch fresh instruments list
         self._enforce_rate_limit()
 
         try:
             self.logger.info("Fetching instruments list from Zerodha")
-            instruments = self.kite.instruments()
+            instruments = self._retry_on_failure(self.kite.instruments)
 
-            # Convert to DataFrame
+            # Convert to DataFrame; the low-cardinality string columns
+            # become categoricals (int codes), which shrinks the cache and
+            # turns the exchange/type filters into integer compares
             df = pd.DataFrame(instruments)
+            for col in _CATEGORICAL_INSTRUMENT_COLUMNS:
+                if col in df:
+                    df[col] = df[col].astype('category')
+            # The rest as contiguous Arrow UTF-8 buffers rather than one
+            # Python str object per row
+            if PYARROW_AVAILABLE:
+                for col in _ARROW_STRING_INSTRUMENT_COLUMNS:
+                    if col in df:
+                        df[col] = df[col].astype('string[pyarrow]')
 
             # Update cache
-            self._instruments_cache = df
-            self._cache_timestamp = datetime.now()
+            self._set_instruments(df, datetime.now())
 
             self.logger.info(f"Cached {len(df)} instruments")
-            return df
 
         except Exception as e:
             self.logger.error(f"Error fetching instruments: {e}")
             raise DataProviderError(f"Failed to fetch instruments: {e}")
 
+        path = self._instruments_cache_path()
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                df.to_pickle(path)
+            except OSError as e:
+                self.logger.warning(f"Could not persist instruments list: {e}")
+
+        return df
+
+    def _set_instruments(self, df: pd.DataFrame, fetched_at: datetime) -> None:
+        """Install an instruments list and its token index as the cache."""
+        self._instruments_cache = df
+        self._token_index = self._build_token_index(df)
+        self._cache_timestamp = fetched_at
+
+    def _load_instruments_from_disk(self) -> bool:
+        """Load a fresh instruments list from disk into the cache.
+
+        Returns:
+            True if a usable copy younger than the TTL was loaded
+        """
+        path = self._instruments_cache_path()
+        if path is None or not path.exists():
+            return False
+        fetched_at = datetime.fromtimestamp(path.stat().st_mtime)
+        if datetime.now() - fetched_at >= INSTRUMENTS_CACHE_TTL:
+            return False
+        try:
+            df = pd.read_pickle(path)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable instruments cache {path}: {e}")
+            return False
+
+        self._set_instruments(df, fetched_at)
+        self.logger.debug(f"Loaded {len(df)} instruments from {path}")
+        return True
+
+    def _instruments_cache_path(self) -> Optional[Path]:
+        """Disk location of the instruments list, or None without a cache_dir."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / type(self).__name__ / "_instruments.pkl"
+
+    @staticmethod
+    def _build_token_index(df: pd.DataFrame) -> Dict[Tuple[str, str], int]:
+        """Map (tradingsymbol, exchange) to instrument token.
+
+        Turns get_instrument_token into a dict lookup instead of a boolean
+        scan of the full instruments table per call. The first listing
+        wins when a pair appears more than once.
+        """
+        if df.empty:
+            return {}
+        firsts = df.drop_duplicates(['tradingsymbol', 'exchange'])
+        keys = zip(firsts['tradingsymbol'].tolist(), firsts['exchange'].tolist())
+        return dict(zip(keys, firsts['instrument_token'].astype('int64').tolist()))
+
     def get_instrument_token(
             self,
             symbol: str,
@@ -143,29 +240,17 @@ class ZerodhaProvider(BaseDataProvider):
             >>> token = provider.get_instrument_token('RELIANCE', 'NSE')
             >>> print(token)  # 738561
         """
-        instruments = self._get_instruments()
+        self._get_instruments()
 
-        # Check if instruments DataFrame is empty
-        if instruments.empty:
-            self.logger.warning(f"No instruments available")
-            return None
-
-        # Filter by symbol and exchange
-        matches = instruments[
-            (instruments['tradingsymbol'] == symbol) &
-            (instruments['exchange'] == exchange)
-        ]
-
-        if matches.empty:
+        token = self._token_index.get((symbol, exchange))
+        if token is None:
             self.logger.warning(f"Instrument {symbol} not found on {exchange}")
             return None
 
-        # Return first match (usually only one)
-        token = int(matches.iloc[0]['instrument_token'])
         self.logger.debug(f"Found token {token} for {symbol} on {exchange}")
         return token
 
-    def get_historical_data(
+    def _fetch_history(
         self,
         symbol: str,
         start_date: date,
@@ -174,6 +259,9 @@ class ZerodhaProvider(BaseDataProvider):
     ) -> pd.DataFrame:
         """Fetch historical OHLCV data from Zerodha.
 
+        Called through ``get_historical_data``, which serves cached ranges
+        first when a history cache is configured (see CachedHistoryMixin).
+
         Args:
             symbol: Indian stock symbol (e.g., 'RELIANCE', 'TCS')
             start_date: Start date for historical data
@@ -184,7 +272,9 @@ class ZerodhaProvider(BaseDataProvider):
                 - continuous: True/False (default: False)
 
         Returns:
-            DataFrame with columns: date, open, high, low, close, volume, adjusted_close
+            DataFrame with columns: date (datetime64), open, high, low,
+            close, volume (no adjusted_close; prices are unadjusted, so it
+            equals close)
 
         Raises:
             DataNotFoundError: If symbol data is not available
@@ -215,7 +305,8 @@ class ZerodhaProvider(BaseDataProvider):
             from_date = datetime.combine(start_date, datetime.min.time())
             to_date = datetime.combine(end_date, datetime.max.time())
 
-            records = self.kite.historical_data(
+            records = self._retry_on_failure(
+                self.kite.historical_data,
                 instrument_token=token,
                 from_date=from_date,
                 to_date=to_date,
@@ -226,36 +317,27 @@ class ZerodhaProvider(BaseDataProvider):
             if not records:
                 raise DataNotFoundError(f"No data found for {symbol}")
 
-            # Convert to DataFrame
-            df = pd.DataFrame(records)
-
-            # Rename columns to match our schema
-            df = df.rename(columns={
-                'date': COL_DATE,
-                'open': COL_OPEN,
-                'high': COL_HIGH,
-                'low': COL_LOW,
-                'close': COL_CLOSE,
-                'volume': COL_VOLUME,
-            })
-
-            # Add adjusted_close (same as close for Indian markets)
-            # TODO: Adjust for splits/bonuses if needed
-            df['adjusted_close'] = df['close']
-
-            # Convert date to date object (remove time component)
-            df[COL_DATE] = pd.to_datetime(df[COL_DATE]).dt.date
-
-            # Select required columns
-            columns = [
-                COL_DATE,
-                COL_OPEN,
-                COL_HIGH,
-                COL_LOW,
-                COL_CLOSE,
-                COL_VOLUME,
-                'adjusted_close']
-            df = df[columns]
+            # Extract typed columns straight from the records: one C-level
+            # fromiter per column instead of pandas' generic
+            # list-of-dicts path, already in our schema
+            n = len(records)
+
+            def column(key: str, dtype: type) -> np.ndarray:
+                return np.fromiter(
+                    (r[key] for r in records), dtype=dtype, count=n)
+
+            df = pd.DataFrame({
+                COL_DATE: pd.DatetimeIndex([r['date'] for r in records])
+                .tz_localize(None).normalize().to_numpy(),
+                COL_OPEN: column('open', np.float64),
+                COL_HIGH: column('high', np.float64),
+                COL_LOW: column('low', np.float64),
+                COL_CLOSE: column('close', np.float64),
+                COL_VOLUME: column('volume', np.int64),
+                # No adjusted_close: Kite prices are not split-adjusted, so
+                # it would only duplicate close (consumers fall back to it)
+                # TODO: Adjust for splits/bonuses if needed
+            }, copy=False)
 
             # Validate data
             if not self.validate_data(df):
@@ -281,24 +363,7 @@ class ZerodhaProvider(BaseDataProvider):
             >>> instruments = provider.get_nse_instruments()
             >>> print(f"Found {len(instruments)} NSE instruments")
         """
-        instruments = self._get_instruments()
-
-        # Filter for NSE equities
-        nse_equities = instruments[
-            (instruments['exchange'] == EXCHANGE_NSE) &
-            (instruments['instrument_type'] == 'EQ')
-        ]
-
-        # Convert to standard format
-        symbols = []
-        for _, row in nse_equities.iterrows():
-            symbols.append({
-                'symbol': row['tradingsymbol'],
-                'name': row['name'],
-                'exchange': EXCHANGE_NSE,
-                'market': MARKET_IN,
-                'sector': row.get('segment', 'Unknown'),
-            })
+        symbols = self._instruments_to_records(EXCHANGE_NSE)
 
         self.logger.info(f"Found {len(symbols)} NSE instruments")
         return symbols
@@ -309,27 +374,44 @@ class ZerodhaProvider(BaseDataProvider):
         Returns:
             List of dictionaries with BSE instrument information
         """
+        symbols = self._instruments_to_records(EXCHANGE_BSE)
+
+        self.logger.info(f"Found {len(symbols)} BSE instruments")
+        return symbols
+
+    def _instruments_to_records(self, exchange: str) -> List[Dict[str, str]]:
+        """Equity instruments of one exchange in the standard symbol format.
+
+        Built column-wise and converted with to_dict('records') rather than
+        looping over ~100k rows with iterrows.
+
+        Args:
+            exchange: Exchange code ('NSE' or 'BSE')
+
+        Returns:
+            List of symbol dictionaries
+        """
         instruments = self._get_instruments()
+        if instruments.empty:
+            return []
 
-        # Filter for BSE equities
-        bse_equities = instruments[
-            (instruments['exchange'] == EXCHANGE_BSE) &
+        # Filter for equities on the exchange
+        equities = instruments[
+            (instruments['exchange'] == exchange) &
             (instruments['instrument_type'] == 'EQ')
         ]
 
-        # Convert to standard format
-        symbols = []
-        for _, row in bse_equities.iterrows():
-            symbols.append({
-                'symbol': row['tradingsymbol'],
-                'name': row['name'],
-                'exchange': EXCHANGE_BSE,
-                'market': MARKET_IN,
-                'sector': row.get('segment', 'Unknown'),
-            })
-
-        self.logger.info(f"Found {len(symbols)} BSE instruments")
-        return symbols
+        sector = (
+            equities['segment'].astype(object).fillna('Unknown')
+            if 'segment' in equities else 'Unknown'
+        )
+        return pd.DataFrame({
+            'symbol': equities['tradingsymbol'],
+            'name': equities['name'],
+            'exchange': exchange,
+            'market': MARKET_IN,
+            'sector': sector,
+        }).to_dict('records')
 
     def get_symbols_list(self, **kwargs) -> List[Dict[str, str]]:
         """Fetch list of available symbols.
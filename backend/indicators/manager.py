@@ -4,37 +4,297 @@ Orchestrates the calculation of all technical indicators for symbols.
 """
 
 import logging
-from typing import Optional
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import delete, select
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
+from backend.core.constants import (
+    BATCH_SIZE_INDICATORS,
+    BATCH_SIZE_METRICS_ROWS,
+    INDICATOR_INCREMENTAL_WARMUP_DAYS,
+)
 from backend.core.database import get_session
 from backend.indicators.momentum import calculate_all_momentum_indicators
-from backend.indicators.moving_averages import calculate_all_moving_averages
+from backend.indicators.moving_averages import calculate_all_moving_averages, continue_ema
 from backend.indicators.price_action import calculate_52_week_high_low
 from backend.indicators.relative_strength import calculate_mansfield_rs
-from backend.indicators.utils import get_price_data
+from backend.indicators.utils import get_price_data, get_price_data_batch
 from backend.indicators.volume import calculate_all_volume_indicators
-from backend.models.db_models import DerivedMetrics, Symbol
+from backend.models.db_models import DerivedMetrics, PriceData, Symbol
 
 logger = logging.getLogger(__name__)
 
+_METRIC_COLUMNS = (
+    "ema_50", "ema_150", "ema_200",
+    "sma_50", "sma_150", "sma_200",
+    "rsi_14", "macd", "macd_signal", "macd_histogram",
+    "mansfield_rs", "week_52_high", "week_52_low", "volume_avg_50",
+)
+"""Indicator columns persisted to the derived_metrics table."""
+
+_METRIC_DECIMALS = {
+    **dict.fromkeys(("ema_50", "ema_150", "ema_200",
+                     "sma_50", "sma_150", "sma_200",
+                     "macd", "macd_signal", "macd_histogram",
+                     "mansfield_rs"), 4),
+    **dict.fromkeys(("rsi_14", "week_52_high", "week_52_low"), 2),
+}
+"""Decimal places stored per float metric (the former Numeric scales)."""
+
+_EMA_PERIODS = (50, 150, 200)
+"""EMA periods whose stored values seed incremental runs."""
+
+MetricState = Tuple[date, Dict[int, float]]
+"""Latest stored metrics date for a symbol and its EMA values by period."""
+
+
+def _metric_records(df: pd.DataFrame, symbol_id: int) -> List[Dict[str, Any]]:
+    """
+    Build derived_metrics insert parameters from an indicator DataFrame.
+
+    NaN becomes None in one vectorized pass and rows are read with
+    itertuples, so there is no per-row Series or per-cell isna check.
+    Values are rounded to their column's scale, so float32 price noise
+    (123.45 read back as 123.4499969...) is not stored.
+
+    Args:
+        df: DataFrame with the indicator columns, indexed by date.
+        symbol_id: ID of the symbol the rows belong to.
+
+    Returns:
+        List[Dict[str, Any]]: One parameter dict per row, NULLs as None.
+    """
+    sub = df.loc[:, list(_METRIC_COLUMNS)]
+    decimals = list(_METRIC_DECIMALS)
+    sub[decimals] = sub[decimals].astype("float64").round(_METRIC_DECIMALS)
+    # Truncated to an integer like the BigInteger column
+    sub["volume_avg_50"] = np.trunc(sub["volume_avg_50"]).astype("Int64")
+    sub = sub.astype(object).where(sub.notna(), None)
+    sub.insert(0, "date", df.index.date)
+    sub.insert(0, "symbol_id", symbol_id)
+
+    names = list(sub.columns)
+    return [dict(zip(names, row))
+            for row in sub.itertuples(index=False, name=None)]
+
+
+def compute_metrics(symbol_id: int,
+                    df: pd.DataFrame,
+                    benchmark_df: Optional[pd.DataFrame],
+                    since: Optional[date] = None,
+                    ema_seed: Optional[Dict[int, float]] = None,
+                    ) -> Optional[List[Dict[str, Any]]]:
+    """
+    Calculate all indicators for one symbol's price history.
+
+    Pure computation with no database access, so it can run in a worker
+    process. Rolling indicators are computed over whatever history ``df``
+    holds; ``since`` only limits which rows are returned. Incremental runs
+    pass a trailing window and the stored EMAs at ``since`` as
+    ``ema_seed``, from which the long EMAs are continued exactly.
+
+    Args:
+        symbol_id: ID of the symbol.
+        df: Price DataFrame for the symbol, indexed by date.
+        benchmark_df: DataFrame of the benchmark symbol (for RS calculation).
+        since: Only return rows dated after this day (incremental runs).
+        ema_seed: EMA value by period on ``since`` (requires ``since``).
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: derived_metrics rows, or None when
+            there is not enough price data.
+    """
+    if df.empty:
+        logger.warning(f"No price data found for symbol {symbol_id}")
+        return None
+
+    if len(df) < 50:  # Minimum data requirement
+        logger.warning(
+            f"Insufficient data for symbol {symbol_id}: {
+                len(df)} rows")
+        return None
+
+    # Moving Averages
+    df = calculate_all_moving_averages(df)
+
+    # Momentum
+    df = calculate_all_momentum_indicators(df)
+
+    # Price Action
+    df = calculate_52_week_high_low(df)
+
+    # Volume
+    df = calculate_all_volume_indicators(df)
+
+    # Relative Strength
+    if benchmark_df is not None and not benchmark_df.empty:
+        df["mansfield_rs"] = calculate_mansfield_rs(df, benchmark_df)
+    else:
+        df["mansfield_rs"] = None
+
+    if since is not None:
+        df = df.loc[df.index > pd.Timestamp(since)].copy()
+        for period, seed in (ema_seed or {}).items():
+            df[f"ema_{period}"] = continue_ema(df["close"], period, seed)
+    return _metric_records(df, symbol_id)
+
+
+def _save_metrics(session: Session, records: List[Dict[str, Any]]) -> None:
+    """Upsert derived_metrics rows keyed on (symbol_id, date)."""
+    if not records:
+        return
+
+    # PostgreSQL in production; SQLite in tests
+    if session.get_bind().dialect.name == "sqlite":
+        stmt = sqlite_insert(DerivedMetrics.__table__)
+    else:
+        stmt = pg_insert(DerivedMetrics.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["symbol_id", "date"],
+        set_={col: stmt.excluded[col] for col in _METRIC_COLUMNS},
+    )
+
+    # Core executemany: no ORM object or unit-of-work bookkeeping per row
+    session.execute(stmt, records)
+
+
+def _last_metric_states(session: Session,
+                        symbol_ids: Iterable[int]) -> Dict[int, MetricState]:
+    """Latest stored derived_metrics date and EMAs per symbol, in one query."""
+    latest = (
+        select(DerivedMetrics.symbol_id,
+               func.max(DerivedMetrics.date).label("date"))
+        .where(DerivedMetrics.symbol_id.in_(list(symbol_ids)))
+        .group_by(DerivedMetrics.symbol_id)
+        .subquery()
+    )
+    ema_columns = [getattr(DerivedMetrics, f"ema_{p}") for p in _EMA_PERIODS]
+    rows = session.execute(
+        select(DerivedMetrics.symbol_id, DerivedMetrics.date, *ema_columns)
+        .join(latest, and_(DerivedMetrics.symbol_id == latest.c.symbol_id,
+                           DerivedMetrics.date == latest.c.date))
+    ).all()
+
+    states: Dict[int, MetricState] = {}
+    for symbol_id, last_date, *emas in rows:
+        seeds = {p: float(v) for p, v in zip(_EMA_PERIODS, emas) if v is not None}
+        states[symbol_id] = (last_date, seeds)
+    return states
+
+
+def _stale_symbol_ids(session: Session, symbol_ids: Iterable[int]) -> Set[int]:
+    """
+    Symbols whose price history has changed since metrics were stored.
+
+    Metrics are written for every price row, so a symbol is up to date when
+    its derived_metrics row count and latest date match price_data's. New
+    days and backfills are caught; in-place corrections of existing prices
+    are not (recalculate with ``force`` after those).
+    """
+    ids = list(symbol_ids)
+    prices = (
+        select(PriceData.symbol_id,
+               func.count().label("rows"),
+               func.max(PriceData.date).label("last_date"))
+        .where(PriceData.symbol_id.in_(ids))
+        .group_by(PriceData.symbol_id)
+        .subquery()
+    )
+    metrics = (
+        select(DerivedMetrics.symbol_id,
+               func.count().label("rows"),
+               func.max(DerivedMetrics.date).label("last_date"))
+        .where(DerivedMetrics.symbol_id.in_(ids))
+        .group_by(DerivedMetrics.symbol_id)
+        .subquery()
+    )
+    return set(session.execute(
+        select(prices.c.symbol_id)
+        .outerjoin(metrics, metrics.c.symbol_id == prices.c.symbol_id)
+        .where(or_(metrics.c.symbol_id.is_(None),
+                   metrics.c.rows != prices.c.rows,
+                   metrics.c.last_date != prices.c.last_date))
+    ).scalars())
+
+
+def _warmup_start(last_date: date) -> date:
+    """First price date to read when updating metrics after ``last_date``."""
+    return last_date - timedelta(days=INDICATOR_INCREMENTAL_WARMUP_DAYS)
+
+
+def _warm_up_kernels() -> None:
+    """
+    Compile the Numba indicator kernels once in the parent process.
+
+    The kernels use ``cache=True``, so this writes (or just loads) their
+    machine code in the on-disk cache for both float32 and float64 input.
+    Worker processes then load cached code instead of each compiling
+    the same kernels concurrently at startup.
+    """
+    close = np.linspace(100.0, 110.0, 60)
+    for dtype in (np.float64, np.float32):
+        prices = pd.DataFrame(
+            {"open": close, "high": close, "low": close, "close": close,
+             "volume": np.ones(60, dtype=np.int64)},
+            index=pd.date_range("2000-01-03", periods=60),
+        ).astype({"open": dtype, "high": dtype, "low": dtype, "close": dtype})
+        compute_metrics(0, prices, None)
+
+
+_worker_benchmark: Optional[pd.DataFrame] = None
+"""Benchmark frame installed once per worker process by _init_worker."""
+
+
+def _init_worker(benchmark_df: Optional[pd.DataFrame]) -> None:
+    """Worker initializer: receive the shared, read-only benchmark once."""
+    global _worker_benchmark
+    _worker_benchmark = benchmark_df
+
+
+def _compute_in_worker(symbol_id: int,
+                       price_df: pd.DataFrame,
+                       state: Optional[MetricState]) -> Optional[List[Dict[str, Any]]]:
+    """Worker entry point: compute one symbol against the worker's benchmark."""
+    since, ema_seed = state if state else (None, None)
+    return compute_metrics(symbol_id, price_df, _worker_benchmark, since, ema_seed)
+
+
+def _load_price_batch(session: Session, symbol_ids: List[int],
+                      states: Dict[int, MetricState]) -> Dict[int, pd.DataFrame]:
+    """Full history for new symbols; a trailing window for the rest."""
+    fresh = [sid for sid in symbol_ids if sid not in states]
+    prices = get_price_data_batch(fresh, session) if fresh else {}
+    if states:
+        start = _warmup_start(min(last_date for last_date, _ in states.values()))
+        prices.update(get_price_data_batch(list(states), session, start_date=start))
+    return prices
+
 
 class IndicatorManager:
     """
     Manager class to handle technical indicator calculations.
     """
 
-    def __init__(self, session: Session = None):
+    def __init__(self, session: Session = None, incremental: bool = False):
         """
         Initialize the manager.
 
         Args:
             session: Optional SQLAlchemy session. If not provided, methods will create their own.
+            incremental: Only write rows dated after each symbol's latest stored
+                metrics, computed from a trailing window of prices, instead of
+                recomputing and upserting the full history.
         """
         self.session = session
+        self.incremental = incremental
 
     def calculate_for_symbol(self, symbol_id: int,
                              benchmark_df: Optional[pd.DataFrame] = None) -> bool:
@@ -65,86 +325,31 @@ class IndicatorManager:
     def _calculate_with_session(self,
                                 session: Session,
                                 symbol_id: int,
-                                benchmark_df: Optional[pd.DataFrame]) -> bool:
-        """Internal method to calculate using a specific session."""
-        # 1. Fetch price data
-        df = get_price_data(symbol_id, session)
-
-        if df.empty:
-            logger.warning(f"No price data found for symbol {symbol_id}")
-            return False
+                                benchmark_df: Optional[pd.DataFrame],
+                                price_df: Optional[pd.DataFrame] = None) -> bool:
+        """Internal method to calculate using a specific session.
 
-        if len(df) < 50:  # Minimum data requirement
-            logger.warning(
-                f"Insufficient data for symbol {symbol_id}: {
-                    len(df)} rows")
+        ``price_df`` is the symbol's already-loaded price history; it is
+        read from the database when not given.
+        """
+        state = None
+        if self.incremental:
+            state = _last_metric_states(session, [symbol_id]).get(symbol_id)
+        since, ema_seed = state if state else (None, None)
+
+        # 1. Fetch price data (only the trailing window when incremental)
+        df = price_df
+        if df is None:
+            start = _warmup_start(since) if since else None
+            df = get_price_data(symbol_id, session, start_date=start)
+
+        # 2. Calculate indicators
+        records = compute_metrics(symbol_id, df, benchmark_df, since, ema_seed)
+        if records is None:
             return False
 
-        # 2. Calculate Indicators
-        # Moving Averages
-        df = calculate_all_moving_averages(df)
-
-        # Momentum
-        df = calculate_all_momentum_indicators(df)
-
-        # Price Action
-        df = calculate_52_week_high_low(df)
-
-        # Volume
-        df = calculate_all_volume_indicators(df)
-
-        # Relative Strength
-        if benchmark_df is not None and not benchmark_df.empty:
-            df["mansfield_rs"] = calculate_mansfield_rs(df, benchmark_df)
-        else:
-            df["mansfield_rs"] = None
-
-        # 3. Prepare data for insertion
-        # We want to save the calculated metrics to DerivedMetrics table.
-        # We should probably clear existing metrics for this symbol to avoid duplicates or use upsert.
-        # For simplicity/performance in batch, we might delete and re-insert or use merge.
-        # Given the volume of data, upsert is better.
-
-        metrics_objects = []
-        for date, row in df.iterrows():
-            # Skip rows where critical indicators might be NaN if we want to save space,
-            # but usually we want to save what we have.
-            # However, DerivedMetrics table has nullable columns for
-            # indicators.
-
-            # Check if we have at least some data calculated (e.g. SMA_50)
-            # if pd.isna(row["sma_50"]): continue
-
-            metrics = DerivedMetrics(
-                symbol_id=symbol_id,
-                date=date.date(),
-                ema_50=row.get("ema_50") if not pd.isna(row.get("ema_50")) else None,
-                ema_150=row.get("ema_150") if not pd.isna(row.get("ema_150")) else None,
-                ema_200=row.get("ema_200") if not pd.isna(row.get("ema_200")) else None,
-                sma_50=row.get("sma_50") if not pd.isna(row.get("sma_50")) else None,
-                sma_150=row.get("sma_150") if not pd.isna(row.get("sma_150")) else None,
-                sma_200=row.get("sma_200") if not pd.isna(row.get("sma_200")) else None,
-                rsi_14=row.get("rsi_14") if not pd.isna(row.get("rsi_14")) else None,
-                macd=row.get("macd") if not pd.isna(row.get("macd")) else None,
-                macd_signal=row.get("macd_signal") if not pd.isna(row.get("macd_signal")) else None,
-                macd_histogram=row.get("macd_histogram") if not pd.isna(row.get("macd_histogram")) else None,
-                mansfield_rs=row.get("mansfield_rs") if not pd.isna(row.get("mansfield_rs")) else None,
-                week_52_high=row.get("week_52_high") if not pd.isna(row.get("week_52_high")) else None,
-                week_52_low=row.get("week_52_low") if not pd.isna(row.get("week_52_low")) else None,
-                volume_avg_50=int(row.get("volume_avg_50")) if not pd.isna(row.get("volume_avg_50")) else None,
-            )
-            metrics_objects.append(metrics)
-
-        # 4. Save to DB
-        # Delete existing for this symbol to avoid conflicts (simplest approach for full recalc)
-        # In production with incremental updates, we would only calculate new days.
-        # For MVP full recalc, delete-insert is fine.
-        session.execute(
-            delete(DerivedMetrics).where(
-                DerivedMetrics.symbol_id == symbol_id))
-
-        # Bulk save
-        session.add_all(metrics_objects)
+        # 3. Save to DB
+        _save_metrics(session, records)
         # Commit is handled by the context manager in the caller if not
         # provided
         if not self.session:
@@ -152,20 +357,32 @@ class IndicatorManager:
 
         return True
 
-    def calculate_all(self, benchmark_symbol: str = "^NSEI") -> None:
+    def calculate_all(self, benchmark_symbol: str = "^NSEI",
+                      max_workers: Optional[int] = None,
+                      force: bool = False) -> None:
         """
         Calculate indicators for all active symbols.
 
+        Symbols whose price history is unchanged since their metrics were
+        stored are skipped unless ``force`` is set.
+
         Args:
             benchmark_symbol: Ticker of the benchmark symbol.
+            max_workers: Worker processes for indicator computation
+                (default: os.cpu_count()).
+            force: Recalculate every symbol, e.g. after price corrections or
+                indicator changes.
         """
         with get_session() as session:
             # 1. Get benchmark data
-            benchmark = session.execute(select(Symbol).where(
+            # Plain column rows rather than ORM entities throughout: the
+            # periodic commits below would otherwise expire every Symbol
+            # and reload each one with its own SELECT on next access.
+            benchmark_id = session.execute(select(Symbol.id).where(
                 Symbol.symbol == benchmark_symbol)).scalar_one_or_none()
             benchmark_df = None
-            if benchmark:
-                benchmark_df = get_price_data(benchmark.id, session)
+            if benchmark_id is not None:
+                benchmark_df = get_price_data(benchmark_id, session)
                 logger.info(
                     f"Loaded benchmark data for {benchmark_symbol}: {
                         len(benchmark_df)} rows")
@@ -175,25 +392,58 @@ class IndicatorManager:
 
             # 2. Get all active symbols
             symbols = session.execute(
-                select(Symbol).where(
-                    Symbol.active)).scalars().all()
+                select(Symbol.id, Symbol.symbol).where(
+                    Symbol.active)).all()
             logger.info(f"Found {len(symbols)} active symbols")
+            symbols = [s for s in symbols if s.symbol != benchmark_symbol]
 
-            # 3. Process each symbol
+            # 3. Process each symbol, reading prices one batch at a time.
+            # Compute is CPU-bound and independent per symbol, so it runs in
+            # worker processes; writes stay on this session, buffered
+            # across symbols into large upserts.
+            pending: List[Dict[str, Any]] = []
             count = 0
-            for symbol in symbols:
-                if symbol.symbol == benchmark_symbol:
-                    continue
-
-                logger.info(f"Processing {symbol.symbol}...")
-                success = self._calculate_with_session(
-                    session, symbol.id, benchmark_df)
-                if success:
-                    count += 1
-
-                # Commit every 10 symbols to avoid huge transaction
-                if count % 10 == 0:
-                    session.commit()
-
+            skipped = 0
+            workers = max_workers or os.cpu_count() or 1
+            _warm_up_kernels()
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_worker,
+                                     initargs=(benchmark_df,)) as executor:
+                for start in range(0, len(symbols), BATCH_SIZE_INDICATORS):
+                    batch = symbols[start:start + BATCH_SIZE_INDICATORS]
+                    if not force:
+                        stale = _stale_symbol_ids(session, [s.id for s in batch])
+                        skipped += len(batch) - len(stale)
+                        batch = [s for s in batch if s.id in stale]
+                        if not batch:
+                            continue
+                    ids = [s.id for s in batch]
+                    states = (_last_metric_states(session, ids)
+                              if self.incremental else {})
+                    prices = _load_price_batch(session, ids, states)
+
+                    futures = []
+                    for symbol in batch:
+                        logger.info(f"Processing {symbol.symbol}...")
+                        futures.append(executor.submit(
+                            _compute_in_worker, symbol.id,
+                            prices.get(symbol.id, pd.DataFrame()),
+                            states.get(symbol.id)))
+
+                    for future in as_completed(futures):
+                        records = future.result()
+                        if records is None:
+                            continue
+                        pending.extend(records)
+                        count += 1
+
+                        # Flush in large batches to bound transaction size
+                        if len(pending) >= BATCH_SIZE_METRICS_ROWS:
+                            _save_metrics(session, pending)
+                            session.commit()
+                            pending.clear()
+
+            _save_metrics(session, pending)
             session.commit()
-            logger.info(f"Completed indicator calculation for {count} symbols")
+            logger.info(f"Completed indicator calculation for {count} symbols "
+                        f"({skipped} unchanged symbols skipped)")
@@ -2,9 +2,17 @@
 Momentum indicators calculation module.
 """
 
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
+try:
+    import talib
+
+    TALIB_AVAILABLE = True
+except ImportError:  # TA-Lib needs its C library; pandas_ta is the fallback
+    TALIB_AVAILABLE = False
+
 
 def calculate_rsi(series: pd.Series, period: int = 14) -> pd.Series:
     """
@@ -17,6 +25,9 @@ def calculate_rsi(series: pd.Series, period: int = 14) -> pd.Series:
     Returns:
         pd.Series: RSI series.
     """
+    if TALIB_AVAILABLE:
+        rsi = talib.RSI(series.to_numpy(dtype=np.float64), timeperiod=period)
+        return pd.Series(rsi, index=series.index)
     return ta.rsi(series, length=period)
 
 
@@ -35,6 +46,14 @@ def calculate_macd(
     Returns:
         pd.DataFrame: DataFrame with columns ['macd', 'macd_signal', 'macd_histogram'].
     """
+    if TALIB_AVAILABLE:
+        macd, macd_signal, macd_hist = talib.MACD(
+            series.to_numpy(dtype=np.float64),
+            fastperiod=fast, slowperiod=slow, signalperiod=signal)
+        return pd.DataFrame(
+            {"macd": macd, "macd_signal": macd_signal, "macd_histogram": macd_hist},
+            index=series.index)
+
     macd_df = ta.macd(series, fast=fast, slow=slow, signal=signal)
 
     # pandas_ta returns columns like MACD_12_26_9, MACDs_12_26_9, MACDh_12_26_9
@@ -67,6 +86,14 @@ def calculate_all_momentum_indicators(df: pd.DataFrame) -> pd.DataFrame:
     if "close" not in df.columns:
         raise ValueError("DataFrame must contain 'close' column")
 
+    if TALIB_AVAILABLE:
+        # Arrays straight into the columns; no intermediate Series/DataFrame
+        close = df["close"].to_numpy(dtype=np.float64)
+        df["rsi_14"] = talib.RSI(close, timeperiod=14)
+        df["macd"], df["macd_signal"], df["macd_histogram"] = talib.MACD(
+            close, fastperiod=12, slowperiod=26, signalperiod=9)
+        return df
+
     df["rsi_14"] = calculate_rsi(df["close"], 14)
 
     macd_data = calculate_macd(df["close"])
@@ -2,8 +2,35 @@
 Moving averages calculation module.
 """
 
+import math
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 
+from backend.core.jit import NUMBA_AVAILABLE, njit
+
+_SMA_PERIODS: Tuple[int, ...] = (50, 150, 200)
+_EMA_PERIODS: Tuple[int, ...] = (50, 150, 200)
+
+
+def kernel_input(series: pd.Series) -> np.ndarray:
+    """
+    Series values as an array for the Numba kernels.
+
+    float32 input stays float32, halving the bytes the kernels read; the
+    kernels accumulate and write in float64 either way. Anything else
+    becomes float64, with missing values (e.g. nullable Int64) as NaN.
+
+    Args:
+        series: Input series.
+
+    Returns:
+        np.ndarray: float32 or float64 values.
+    """
+    dtype = np.float32 if series.dtype == np.float32 else np.float64
+    return series.to_numpy(dtype=dtype, na_value=np.nan)
+
 
 def calculate_sma(series: pd.Series, period: int) -> pd.Series:
     """
@@ -16,7 +43,8 @@ def calculate_sma(series: pd.Series, period: int) -> pd.Series:
     Returns:
         pd.Series: SMA series.
     """
-    return series.rolling(window=period).mean()
+    return pd.Series(rolling_mean(kernel_input(series), period),
+                     index=series.index, name=series.name)
 
 
 def calculate_ema(series: pd.Series, period: int) -> pd.Series:
@@ -30,7 +58,122 @@ def calculate_ema(series: pd.Series, period: int) -> pd.Series:
     Returns:
         pd.Series: EMA series.
     """
-    return series.ewm(span=period, adjust=False).mean()
+    if not NUMBA_AVAILABLE:
+        return series.ewm(span=period, adjust=False).mean()
+    _, ema = _moving_averages_core(
+        kernel_input(series),
+        np.empty(0, dtype=np.int64),
+        np.array([period], dtype=np.int64),
+    )
+    return pd.Series(ema[0], index=series.index, name=series.name)
+
+
+@njit(cache=True)
+def _moving_averages_core(
+    close: np.ndarray, sma_periods: np.ndarray, ema_periods: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fused SMA + EMA kernel: every average is updated in one pass over close.
+
+    SMAs keep a running window sum and a count of NaN entries in the
+    window, matching ``rolling(period).mean()``. EMAs follow the
+    ``ewm(span=period, adjust=False).mean()`` recurrence, including its
+    handling of NaN gaps.
+    """
+    n = close.shape[0]
+    n_sma = sma_periods.shape[0]
+    n_ema = ema_periods.shape[0]
+    sma = np.full((n_sma, n), np.nan)
+    ema = np.full((n_ema, n), np.nan)
+
+    sums = np.zeros(n_sma)
+    nans = np.zeros(n_sma, dtype=np.int64)
+    alphas = 2.0 / (ema_periods.astype(np.float64) + 1.0)
+    weighted = np.full(n_ema, np.nan)
+    old_wt = np.ones(n_ema)
+
+    for i in range(n):
+        value = close[i]
+        is_obs = not math.isnan(value)
+
+        for k in range(n_sma):
+            period = sma_periods[k]
+            if is_obs:
+                sums[k] += value
+            else:
+                nans[k] += 1
+            if i >= period:
+                leaving = close[i - period]
+                if math.isnan(leaving):
+                    nans[k] -= 1
+                else:
+                    sums[k] -= leaving
+            if i >= period - 1 and nans[k] == 0:
+                sma[k, i] = sums[k] / period
+
+        for k in range(n_ema):
+            alpha = alphas[k]
+            if not math.isnan(weighted[k]):
+                old_wt[k] *= 1.0 - alpha
+                if is_obs:
+                    if weighted[k] != value:
+                        weighted[k] = ((old_wt[k] * weighted[k] + alpha * value)
+                                       / (old_wt[k] + alpha))
+                    old_wt[k] = 1.0
+            elif is_obs:
+                weighted[k] = value
+            ema[k, i] = weighted[k]
+
+    return sma, ema
+
+
+def continue_ema(series: pd.Series, period: int, seed: float) -> pd.Series:
+    """
+    Continue an EMA from a previously computed value.
+
+    Equivalent to the tail of ``calculate_ema`` over the full history when
+    ``seed`` is the EMA on the day before ``series`` starts, so incremental
+    runs need not replay the whole history.
+
+    Args:
+        series: Price series following the seeded day.
+        period: The period for EMA calculation.
+        seed: EMA value on the day before the first element of ``series``.
+
+    Returns:
+        pd.Series: EMA series aligned with ``series``.
+    """
+    # The adjust=False recurrence from the seed is that of a series
+    # starting with the seed itself
+    values = np.concatenate(([seed], series.to_numpy(dtype=np.float64)))
+    if NUMBA_AVAILABLE:
+        _, ema = _moving_averages_core(
+            values, np.empty(0, dtype=np.int64), np.array([period], dtype=np.int64))
+        result = ema[0]
+    else:
+        result = pd.Series(values).ewm(span=period, adjust=False).mean().to_numpy()
+    return pd.Series(result[1:], index=series.index)
+
+
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling mean of a float array, NaN until the window is full.
+
+    Same result as ``pd.Series(values).rolling(period).mean()`` without
+    building a Series when Numba is available.
+
+    Args:
+        values: Input values.
+        period: Window length.
+
+    Returns:
+        np.ndarray: Rolling mean array.
+    """
+    if not NUMBA_AVAILABLE:
+        return pd.Series(values).rolling(window=period).mean().to_numpy()
+    sma, _ = _moving_averages_core(
+        values, np.array([period], dtype=np.int64), np.empty(0, dtype=np.int64))
+    return sma[0]
 
 
 def calculate_all_moving_averages(df: pd.DataFrame) -> pd.DataFrame:
@@ -47,12 +190,22 @@ def calculate_all_moving_averages(df: pd.DataFrame) -> pd.DataFrame:
     if "close" not in df.columns:
         raise ValueError("DataFrame must contain 'close' column")
 
-    df["sma_50"] = calculate_sma(df["close"], 50)
-    df["sma_150"] = calculate_sma(df["close"], 150)
-    df["sma_200"] = calculate_sma(df["close"], 200)
-
-    df["ema_50"] = calculate_ema(df["close"], 50)
-    df["ema_150"] = calculate_ema(df["close"], 150)
-    df["ema_200"] = calculate_ema(df["close"], 200)
+    if not NUMBA_AVAILABLE:
+        for period in _SMA_PERIODS:
+            df[f"sma_{period}"] = calculate_sma(df["close"], period)
+        for period in _EMA_PERIODS:
+            df[f"ema_{period}"] = calculate_ema(df["close"], period)
+        return df
+
+    # One pass over close for all six averages instead of six
+    sma, ema = _moving_averages_core(
+        kernel_input(df["close"]),
+        np.array(_SMA_PERIODS, dtype=np.int64),
+        np.array(_EMA_PERIODS, dtype=np.int64),
+    )
+    for k, period in enumerate(_SMA_PERIODS):
+        df[f"sma_{period}"] = sma[k]
+    for k, period in enumerate(_EMA_PERIODS):
+        df[f"ema_{period}"] = ema[k]
 
     return df
@@ -2,8 +2,64 @@
 Price action indicators calculation module.
 """
 
+import math
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 
+from backend.core.jit import NUMBA_AVAILABLE, njit
+from backend.indicators.moving_averages import kernel_input
+
+
+@njit(cache=True)
+def _rolling_high_low_core(
+    high: np.ndarray, low: np.ndarray, window: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fused rolling max(high) / min(low) kernel using monotonic queues.
+
+    Each queue holds indices whose values are strictly decreasing (max) or
+    increasing (min), so every element is pushed and popped at most once:
+    O(n) for both outputs in a single pass. NaN values are skipped and a
+    partial window still yields a value, matching
+    ``rolling(window, min_periods=1).max()/.min()``.
+    """
+    n = high.shape[0]
+    out_high = np.full(n, np.nan)
+    out_low = np.full(n, np.nan)
+    # Queues never exceed n entries, so plain arrays with head/tail
+    # pointers suffice (no wrap-around)
+    max_q = np.empty(n, dtype=np.int64)
+    min_q = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+
+    for i in range(n):
+        value = high[i]
+        if not math.isnan(value):
+            while max_tail > max_head and high[max_q[max_tail - 1]] <= value:
+                max_tail -= 1
+            max_q[max_tail] = i
+            max_tail += 1
+        while max_tail > max_head and max_q[max_head] <= i - window:
+            max_head += 1
+        if max_tail > max_head:
+            out_high[i] = high[max_q[max_head]]
+
+        value = low[i]
+        if not math.isnan(value):
+            while min_tail > min_head and low[min_q[min_tail - 1]] >= value:
+                min_tail -= 1
+            min_q[min_tail] = i
+            min_tail += 1
+        while min_tail > min_head and min_q[min_head] <= i - window:
+            min_head += 1
+        if min_tail > min_head:
+            out_low[i] = low[min_q[min_head]]
+
+    return out_high, out_low
+
 
 def calculate_52_week_high_low(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -23,7 +79,15 @@ def calculate_52_week_high_low(df: pd.DataFrame) -> pd.DataFrame:
     # Using 252 trading days is standard for a year
     window = 252
 
-    df["week_52_high"] = df["high"].rolling(window=window, min_periods=1).max()
-    df["week_52_low"] = df["low"].rolling(window=window, min_periods=1).min()
+    if not NUMBA_AVAILABLE:
+        df["week_52_high"] = df["high"].rolling(window=window, min_periods=1).max()
+        df["week_52_low"] = df["low"].rolling(window=window, min_periods=1).min()
+        return df
+
+    df["week_52_high"], df["week_52_low"] = _rolling_high_low_core(
+        kernel_input(df["high"]),
+        kernel_input(df["low"]),
+        window,
+    )
 
     return df
@@ -2,8 +2,11 @@
 Relative strength indicators calculation module.
 """
 
+import numpy as np
 import pandas as pd
 
+from backend.indicators.moving_averages import rolling_mean
+
 
 def calculate_mansfield_rs(
         symbol_df: pd.DataFrame,
@@ -32,30 +35,28 @@ def calculate_mansfield_rs(
     if "close" not in benchmark_df.columns:
         raise ValueError("Benchmark DataFrame must contain 'close' column")
 
-    # Align dates
-    # We need to ensure both series share the same index
-    common_index = symbol_df.index.intersection(benchmark_df.index)
-
-    if len(common_index) == 0:
-        # Return empty series with correct index
-        return pd.Series(index=symbol_df.index, dtype=float)
-
-    s_close = symbol_df.loc[common_index, "close"]
-    b_close = benchmark_df.loc[common_index, "close"]
+    # Align the benchmark to the symbol's dates with one hash lookup; the
+    # RP series only covers dates present in both (NaN benchmark days are
+    # skipped, not averaged in)
+    s_close = symbol_df["close"].to_numpy(dtype=np.float64)
+    b_close = benchmark_df["close"].reindex(symbol_df.index).to_numpy(dtype=np.float64)
+    common = ~np.isnan(b_close)
 
-    # 1. Relative Performance
-    rp = s_close / b_close
+    mansfield_rs = np.full(len(s_close), np.nan)
+    if common.any():
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # 1. Relative Performance
+            rp = s_close[common] / b_close[common]
 
-    # 2. SMA of RP
-    # 52 weeks * 5 days = 260 days. Standard is often 52 weeks.
-    # If we assume daily data, 252 is a trading year.
-    sma_rp = rp.rolling(window=252).mean()
+            # 2. SMA of RP
+            # 52 weeks * 5 days = 260 days. Standard is often 52 weeks.
+            # If we assume daily data, 252 is a trading year.
+            sma_rp = rolling_mean(rp, 252)
 
-    # 3. Mansfield RS
-    mansfield_rs = ((rp / sma_rp) - 1) * 10
+            # 3. Mansfield RS
+            mansfield_rs[common] = ((rp / sma_rp) - 1) * 10
 
-    # Reindex to original symbol index to keep shape (fill missing with NaN)
-    return mansfield_rs.reindex(symbol_df.index)
+    return pd.Series(mansfield_rs, index=symbol_df.index)
 
 
 def calculate_all_rs_indicators(
@@ -2,60 +2,115 @@
 Utility functions for indicator calculations.
 """
 
+from datetime import date
+from typing import Dict, Iterable, Optional
+
 import pandas as pd
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from backend.core.database import get_session
+from backend.core.config import settings
+from backend.core.database import bulk_read
+from backend.data_providers.base import downcast_ohlcv
 from backend.models.db_models import PriceData
 
 
-def get_price_data(symbol_id: int, session: Session = None) -> pd.DataFrame:
+_PRICE_COLUMNS = (
+    PriceData.date,
+    PriceData.open,
+    PriceData.high,
+    PriceData.low,
+    PriceData.close,
+    PriceData.volume,
+    PriceData.adjusted_close,
+)
+
+_PRICE_DTYPES = {
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "adjusted_close": "float64",
+    "volume": "Int64",
+}
+
+
+def get_price_data(symbol_id: int, session: Session = None,
+                   start_date: Optional[date] = None) -> pd.DataFrame:
     """
     Fetch historical price data for a symbol and return as a DataFrame.
 
     Args:
         symbol_id: The ID of the symbol to fetch data for.
         session: Optional SQLAlchemy session. If not provided, a new one will be created.
+        start_date: Only fetch rows on or after this date (default: full history).
 
     Returns:
         pd.DataFrame: DataFrame with columns [open, high, low, close, volume, adjusted_close]
                       indexed by date.
     """
-    query = select(PriceData).where(
-        PriceData.symbol_id == symbol_id).order_by(
-        PriceData.date)
+    query = select(*_PRICE_COLUMNS).where(
+        PriceData.symbol_id == symbol_id).order_by(PriceData.date)
+    if start_date is not None:
+        query = query.where(PriceData.date >= start_date)
 
-    if session:
-        result = session.execute(query).scalars().all()
-        data = [
-            {
-                "date": r.date, "open": float(
-                    r.open), "high": float(
-                    r.high), "low": float(
-                    r.low), "close": float(
-                        r.close), "volume": int(
-                            r.volume), "adjusted_close": float(
-                                r.adjusted_close) if r.adjusted_close else float(
-                                    r.close), } for r in result]
-    else:
-        with get_session() as sess:
-            result = sess.execute(query).scalars().all()
-            data = [
-                {
-                    "date": r.date, "open": float(
-                        r.open), "high": float(
-                        r.high), "low": float(
-                        r.low), "close": float(
-                        r.close), "volume": int(
-                            r.volume), "adjusted_close": float(
-                                r.adjusted_close) if r.adjusted_close else float(
-                                    r.close), } for r in result]
-
-    if not data:
+    df = _read(query, session)
+    if df.empty:
         return pd.DataFrame()
+    return _to_price_frame(df)
+
+
+def get_price_data_batch(symbol_ids: Iterable[int],
+                         session: Session = None,
+                         start_date: Optional[date] = None) -> Dict[int, pd.DataFrame]:
+    """
+    Fetch historical price data for many symbols in a single query.
+
+    Args:
+        symbol_ids: IDs of the symbols to fetch data for.
+        session: Optional SQLAlchemy session. If not provided, a new one will be created.
+        start_date: Only fetch rows on or after this date (default: full history).
+
+    Returns:
+        Dict[int, pd.DataFrame]: Price DataFrame per symbol ID, shaped like
+            get_price_data. Symbols without any rows are absent.
+    """
+    query = select(PriceData.symbol_id, *_PRICE_COLUMNS).where(
+        PriceData.symbol_id.in_(list(symbol_ids))
+    ).order_by(PriceData.symbol_id, PriceData.date)
+    if start_date is not None:
+        query = query.where(PriceData.date >= start_date)
+
+    df = _read(query, session)
+    return {
+        int(symbol_id): _to_price_frame(group.drop(columns="symbol_id"))
+        for symbol_id, group in df.groupby("symbol_id", sort=False)
+    }
+
+
+def _read(query, session: Session = None) -> pd.DataFrame:
+    """Column select read by pandas directly: no ORM object per row.
+
+    Numeric columns are typed as the frame is built rather than cast one
+    column at a time afterwards. Volume is nullable (Int64) so one symbol
+    with a missing volume cannot fail a whole batch read.
+    """
+    if session:
+        return pd.read_sql(query, session.connection(), dtype=_PRICE_DTYPES)
+    return bulk_read(query, dtype=_PRICE_DTYPES)
+
+
+def _to_price_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Index typed price rows by date, narrowing them for computation."""
+    # Missing (or zero) adjusted close falls back to close
+    adjusted = df["adjusted_close"]
+    df["adjusted_close"] = adjusted.mask(
+        adjusted.isna() | (adjusted == 0), df["close"])
 
-    df = pd.DataFrame(data)
     df["date"] = pd.to_datetime(df["date"])
     df.set_index("date", inplace=True)
+    # Indicator kernels read float32 prices (half the memory traffic) but
+    # accumulate in float64
+    if settings.USE_FLOAT32_OHLC:
+        downcast_ohlcv(df)
     return df
@@ -4,6 +4,8 @@ Volume indicators calculation module.
 
 import pandas as pd
 
+from backend.indicators.moving_averages import kernel_input, rolling_mean
+
 
 def calculate_average_volume(series: pd.Series, period: int = 50) -> pd.Series:
     """
@@ -16,7 +18,8 @@ def calculate_average_volume(series: pd.Series, period: int = 50) -> pd.Series:
     Returns:
         pd.Series: Average volume series.
     """
-    return series.rolling(window=period).mean()
+    return pd.Series(rolling_mean(kernel_input(series), period),
+                     index=series.index, name=series.name)
 
 
 def calculate_all_volume_indicators(df: pd.DataFrame) -> pd.DataFrame:
@@ -33,6 +36,6 @@ def calculate_all_volume_indicators(df: pd.DataFrame) -> pd.DataFrame:
     if "volume" not in df.columns:
         raise ValueError("DataFrame must contain 'volume' column")
 
-    df["volume_avg_50"] = calculate_average_volume(df["volume"], 50)
+    df["volume_avg_50"] = rolling_mean(kernel_input(df["volume"]), 50)
 
     return df
@@ -21,15 +21,21 @@ from sqlalchemy import (
     Column,
     Date,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
     Numeric,
     String,
     Text,
+    desc,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, relationship
 
+# JSONB on PostgreSQL (indexable with GIN); plain JSON elsewhere (SQLite tests)
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
 
 # Base class for all ORM models
 class Base(DeclarativeBase):
@@ -130,13 +136,13 @@ class PriceData(Base):
     symbol_id = Column(Integer, ForeignKey("symbols.id"), primary_key=True)
     date = Column(Date, primary_key=True, index=True)
 
-    # OHLCV data
-    open = Column(Numeric(12, 2))
-    high = Column(Numeric(12, 2))
-    low = Column(Numeric(12, 2))
-    close = Column(Numeric(12, 2))
+    # OHLCV data (double precision: read straight into float64 frames)
+    open = Column(Float)
+    high = Column(Float)
+    low = Column(Float)
+    close = Column(Float)
     volume = Column(BigInteger)
-    adjusted_close = Column(Numeric(12, 2))
+    adjusted_close = Column(Float)
 
     # Relationships
     symbol = relationship("Symbol", back_populates="price_data")
@@ -144,6 +150,15 @@ class PriceData(Base):
     # Additional indexes for common queries
     __table_args__ = (
         Index("ix_price_data_date_symbol", "date", "symbol_id"),
+        # Per-symbol time-range reads; INCLUDE makes them index-only scans
+        # on PostgreSQL (ignored by other dialects)
+        Index(
+            "ix_price_data_symbol_date_desc",
+            "symbol_id",
+            desc("date"),
+            postgresql_include=[
+                "open", "high", "low", "close", "volume", "adjusted_close"],
+        ),
     )
 
     def __repr__(self) -> str:
@@ -188,25 +203,25 @@ class DerivedMetrics(Base):
     date = Column(Date, primary_key=True, index=True)
 
     # Moving averages
-    ema_50 = Column(Numeric(12, 4))
-    ema_150 = Column(Numeric(12, 4))
-    ema_200 = Column(Numeric(12, 4))
-    sma_50 = Column(Numeric(12, 4))
-    sma_150 = Column(Numeric(12, 4))
-    sma_200 = Column(Numeric(12, 4))
+    ema_50 = Column(Float)
+    ema_150 = Column(Float)
+    ema_200 = Column(Float)
+    sma_50 = Column(Float)
+    sma_150 = Column(Float)
+    sma_200 = Column(Float)
 
     # Momentum indicators
-    rsi_14 = Column(Numeric(6, 2))
-    macd = Column(Numeric(12, 4))
-    macd_signal = Column(Numeric(12, 4))
-    macd_histogram = Column(Numeric(12, 4))
+    rsi_14 = Column(Float)
+    macd = Column(Float)
+    macd_signal = Column(Float)
+    macd_histogram = Column(Float)
 
     # Relative strength
-    mansfield_rs = Column(Numeric(12, 4))
+    mansfield_rs = Column(Float)
 
     # 52-week high/low
-    week_52_high = Column(Numeric(12, 2))
-    week_52_low = Column(Numeric(12, 2))
+    week_52_high = Column(Float)
+    week_52_low = Column(Float)
 
     # Volume
     volume_avg_50 = Column(BigInteger)
@@ -268,17 +283,20 @@ class PatternDetection(Base):
     meets_trend_template = Column(Boolean, default=False)
 
     # Pattern-specific details stored as JSON
-    pattern_metadata = Column(JSON)
+    pattern_metadata = Column(JSONDocument)
 
     # Audit
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     symbol = relationship("Symbol", back_populates="pattern_detections")
+    # Detections are listed with their recommendations: load them for a
+    # whole result set in one IN (...) query instead of one per detection
     trade_recommendations = relationship(
         "TradeRecommendation",
         back_populates="pattern_detection",
-        cascade="all, delete-orphan")
+        cascade="all, delete-orphan",
+        lazy="selectin")
 
     # Additional indexes
     __table_args__ = (
@@ -416,7 +434,7 @@ class BacktestResult(Base):
     backtest_name = Column(String(200), index=True)
     start_date = Column(Date)
     end_date = Column(Date)
-    strategy_config = Column(JSON)
+    strategy_config = Column(JSONDocument)
 
     # Performance metrics
     total_return = Column(Numeric(10, 4))
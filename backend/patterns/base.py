@@ -5,6 +5,8 @@ from typing import Any, Dict, Optional
 
 import pandas as pd
 
+from .utils import Extrema
+
 
 @dataclass
 class PatternResult:
@@ -31,7 +33,8 @@ class PatternDetector(ABC):
     def detect(
             self,
             symbol: str,
-            data: pd.DataFrame) -> Optional[PatternResult]:
+            data: pd.DataFrame,
+            extrema: Optional[Extrema] = None) -> Optional[PatternResult]:
         """
         Detects the pattern in the provided historical data.
 
@@ -40,6 +43,8 @@ class PatternDetector(ABC):
             data: DataFrame containing OHLCV data.
                   Expected columns: 'open', 'high', 'low', 'close', 'volume'.
                   Index should be DatetimeIndex.
+            extrema: Local extrema of ``data`` precomputed by the scanner.
+                     Detectors that need them compute on demand when None.
 
         Returns:
             PatternResult if pattern is detected and meets minimum criteria,
@@ -1,9 +1,143 @@
-from typing import Optional
+import math
+from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from backend.core.jit import NUMBA_AVAILABLE, njit
+
 from .base import PatternDetector, PatternResult
-from .utils import calculate_percentage_change, find_local_extrema
+from .utils import Extrema, calculate_percentage_change, get_extrema
+
+
+def _pct_change(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Element-wise ``calculate_percentage_change`` (0.0 where start is 0)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (end - start) / start * 100.0
+    return np.where(start == 0, 0.0, change)
+
+
+@njit(cache=True)
+def _scan_cup_core(
+    high: np.ndarray,
+    low: np.ndarray,
+    peak_idx: np.ndarray,
+    trough_idx: np.ndarray,
+    min_length: int,
+    min_depth_pct: float,
+    max_depth_pct: float,
+) -> Tuple[int, int, float]:
+    """
+    Finds the first peak pair that forms a valid cup.
+
+    Pairs are visited row-major over ``peak_idx``, which must be sorted by
+    height (tallest first), stopping at the first pair that passes the
+    length, depth, symmetry and handle checks. Because later partners are
+    never taller, the inner loop stops as soon as a partner is too short to
+    pass the 10% symmetry check in either orientation.
+
+    Returns:
+        ``(left, right, bottom)`` positions/value, or ``(-1, -1, nan)``.
+    """
+    n = high.shape[0]
+    # Lowest low from each position to the end (the handle low), NaN-skipping
+    handle_low = np.empty(n)
+    running = np.nan
+    for i in range(n - 1, -1, -1):
+        value = low[i]
+        if not math.isnan(value) and (math.isnan(running) or value < running):
+            running = value
+        handle_low[i] = running
+
+    n_peaks = peak_idx.shape[0]
+    n_troughs = trough_idx.shape[0]
+    for i in range(n_peaks - 1):
+        tall = high[peak_idx[i]]
+        for j in range(i + 1, n_peaks):
+            short = high[peak_idx[j]]
+            if (
+                tall > 0
+                and short > 0
+                and (tall - short) / tall * 100.0 > 10.0
+                and (tall - short) / short * 100.0 > 10.0
+            ):
+                break
+
+            left = min(peak_idx[i], peak_idx[j])
+            right = max(peak_idx[i], peak_idx[j])
+            if right - left < min_length:
+                continue
+
+            bottom = np.inf
+            found = False
+            for t in range(n_troughs):
+                m = trough_idx[t]
+                if m <= left:
+                    continue
+                if m >= right:
+                    break
+                if not found or low[m] < bottom:
+                    bottom = low[m]
+                    found = True
+            if not found:
+                continue
+
+            left_val = high[left]
+            depth = 0.0 if left_val == 0 else abs((bottom - left_val) / left_val * 100.0)
+            if not (min_depth_pct <= depth <= max_depth_pct):
+                continue
+            diff = 0.0 if left_val == 0 else abs((high[right] - left_val) / left_val * 100.0)
+            if diff > 10.0:
+                continue
+            if n - right >= 5 and handle_low[right] < (left_val + bottom) / 2:
+                continue
+            return left, right, bottom
+
+    return -1, -1, np.nan
+
+
+def _scan_cup_vectorized(
+    high: np.ndarray,
+    low: np.ndarray,
+    peak_idx: np.ndarray,
+    trough_idx: np.ndarray,
+    min_length: int,
+    min_depth_pct: float,
+    max_depth_pct: float,
+) -> Tuple[int, int, float]:
+    """NumPy equivalent of ``_scan_cup_core`` used when Numba is unavailable."""
+    # Row-major upper triangle keeps the kernel's pair order
+    first, second = np.triu_indices(len(peak_idx), k=1)
+    left = np.minimum(peak_idx[first], peak_idx[second])
+    right = np.maximum(peak_idx[first], peak_idx[second])
+    left_val = high[left]
+
+    # Cup bottom: lowest trough strictly between the peaks. argmin keeps
+    # the earliest trough on ties.
+    between = (trough_idx > left[:, None]) & (trough_idx < right[:, None])
+    bottom_pos = np.where(between, low[trough_idx], np.inf).argmin(axis=1)
+    bottom_val = low[trough_idx[bottom_pos]]
+
+    cup_depth_pct = np.abs(_pct_change(left_val, bottom_val))
+    peak_diff_pct = np.abs(_pct_change(left_val, high[right]))
+
+    # Handle: everything after the right peak; fmin skips NaN like min()
+    handle_len = len(high) - right
+    handle_low = np.fmin.accumulate(low[::-1])[::-1][right]
+
+    valid = (
+        (right - left >= min_length)
+        & between.any(axis=1)
+        & (cup_depth_pct >= min_depth_pct)
+        & (cup_depth_pct <= max_depth_pct)
+        & (peak_diff_pct <= 10.0)
+        & ((handle_len < 5) | (handle_low >= (left_val + bottom_val) / 2))
+    )
+    matches = np.flatnonzero(valid)
+    if len(matches) == 0:
+        return -1, -1, np.nan
+    k = matches[0]
+    return int(left[k]), int(right[k]), float(bottom_val[k])
 
 
 class CupWithHandleDetector(PatternDetector):
@@ -34,110 +168,78 @@ class CupWithHandleDetector(PatternDetector):
     def detect(
             self,
             symbol: str,
-            data: pd.DataFrame) -> Optional[PatternResult]:
+            data: pd.DataFrame,
+            extrema: Optional[Extrema] = None) -> Optional[PatternResult]:
         if len(data) < self.min_cup_length_days:
             return None
 
-        highs = data["high"]
-        lows = data["low"]
-
-        max_indices, min_indices = find_local_extrema(highs, order=5)
+        max_indices, min_indices = get_extrema(data, "high", extrema)
 
         if len(max_indices) < 2 or not min_indices:
             return None
 
         # Look for cup structure: High -> Low -> High (approximately same level)
-        # Find the two highest peaks in the window
         recent_cutoff = max(0, len(data) - self.max_cup_length_days)
-        max_indices = [i for i in max_indices if i >= recent_cutoff]
-        min_indices = [i for i in min_indices if i >= recent_cutoff]
+        peak_idx = np.asarray(max_indices, dtype=np.int64)
+        trough_idx = np.asarray(min_indices, dtype=np.int64)
+        peak_idx = peak_idx[peak_idx >= recent_cutoff]
+        trough_idx = trough_idx[trough_idx >= recent_cutoff]
 
-        if len(max_indices) < 2:
+        if len(peak_idx) < 2 or len(trough_idx) == 0:
             return None
 
-        # Sort by value to find the two highest peaks
-        peak_values = [(i, highs.iloc[i]) for i in max_indices]
-        peak_values.sort(key=lambda x: x[1], reverse=True)
-
-        # Try pairs of peaks to find a cup
-        for i in range(len(peak_values) - 1):
-            left_peak_idx, left_peak_val = peak_values[i]
-            for j in range(i + 1, len(peak_values)):
-                right_peak_idx, right_peak_val = peak_values[j]
-
-                # Ensure left is before right
-                if left_peak_idx > right_peak_idx:
-                    left_peak_idx, right_peak_idx = right_peak_idx, left_peak_idx
-                    left_peak_val, right_peak_val = right_peak_val, left_peak_val
-
-                # Check cup length
-                cup_length = right_peak_idx - left_peak_idx
-                if cup_length < self.min_cup_length_days:
-                    continue
-
-                # Find lowest point between peaks (cup bottom)
-                interval_mins = [
-                    m for m in min_indices if left_peak_idx < m < right_peak_idx]
-                if not interval_mins:
-                    continue
-
-                cup_bottom_idx = min(interval_mins, key=lambda x: lows.iloc[x])
-                cup_bottom_val = lows.iloc[cup_bottom_idx]
-
-                # Calculate cup depth
-                cup_depth_pct = abs(
-                    calculate_percentage_change(left_peak_val, cup_bottom_val)
-                )
-
-                if not (self.min_cup_depth_pct <=
-                        cup_depth_pct <= self.max_cup_depth_pct):
-                    continue
-
-                # Check if right peak is within 5% of left peak (symmetry)
-                peak_diff_pct = abs(
-                    calculate_percentage_change(left_peak_val, right_peak_val)
-                )
-                if peak_diff_pct > 10.0:
-                    continue
+        high_arr = data["high"].to_numpy(dtype=np.float64)
+        low_arr = data["low"].to_numpy(dtype=np.float64)
+
+        # Candidate pairs are tried in the order of peaks sorted by height
+        peak_idx = peak_idx[np.argsort(-high_arr[peak_idx], kind="stable")]
+        scan = _scan_cup_core if NUMBA_AVAILABLE else _scan_cup_vectorized
+        left, right, bottom_val = scan(
+            high_arr,
+            low_arr,
+            peak_idx,
+            trough_idx,
+            self.min_cup_length_days,
+            self.min_cup_depth_pct,
+            self.max_cup_depth_pct,
+        )
+        if left < 0:
+            return None
 
-                # Look for handle after right peak
-                handle_data = data.iloc[right_peak_idx:]
-                if len(handle_data) < 5:
-                    # No handle yet, but cup is forming
-                    return PatternResult(
-                        pattern_type="CUP_FORMING",
-                        symbol=symbol,
-                        detection_date=data.index[-1].date(),
-                        confidence_score=60.0,
-                        confirmed=False,
-                        meta_data={
-                            "cup_depth_pct": cup_depth_pct,
-                            "cup_length_days": cup_length,
-                            "left_peak": float(left_peak_val),
-                            "right_peak": float(right_peak_val),
-                        },
-                    )
-
-                # Check handle characteristics
-                handle_low = handle_data["low"].min()
-                cup_midpoint = (left_peak_val + cup_bottom_val) / 2
-
-                if handle_low < cup_midpoint:
-                    continue  # Handle too deep
-
-                return PatternResult(
-                    pattern_type="CUP_AND_HANDLE",
-                    symbol=symbol,
-                    detection_date=data.index[-1].date(),
-                    confidence_score=80.0,
-                    confirmed=True,
-                    meta_data={
-                        "cup_depth_pct": cup_depth_pct,
-                        "cup_length_days": cup_length,
-                        "handle_depth": float(
-                            abs(calculate_percentage_change(right_peak_val, handle_low))
-                        ),
-                    },
-                )
-
-        return None
+        left_val = float(high_arr[left])
+        right_val = float(high_arr[right])
+        cup_length = int(right - left)
+        cup_depth_pct = abs(calculate_percentage_change(left_val, bottom_val))
+
+        handle_data = data.iloc[right:]
+        if len(handle_data) < 5:
+            # No handle yet, but cup is forming
+            return PatternResult(
+                pattern_type="CUP_FORMING",
+                symbol=symbol,
+                detection_date=data.index[-1].date(),
+                confidence_score=60.0,
+                confirmed=False,
+                meta_data={
+                    "cup_depth_pct": cup_depth_pct,
+                    "cup_length_days": cup_length,
+                    "left_peak": left_val,
+                    "right_peak": right_val,
+                },
+            )
+
+        handle_low = handle_data["low"].min()
+        return PatternResult(
+            pattern_type="CUP_AND_HANDLE",
+            symbol=symbol,
+            detection_date=data.index[-1].date(),
+            confidence_score=80.0,
+            confirmed=True,
+            meta_data={
+                "cup_depth_pct": cup_depth_pct,
+                "cup_length_days": cup_length,
+                "handle_depth": float(
+                    abs(calculate_percentage_change(right_val, handle_low))
+                ),
+            },
+        )
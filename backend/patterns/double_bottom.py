@@ -1,9 +1,64 @@
-from typing import Optional
+import math
+from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from backend.core.jit import njit
+
 from .base import PatternDetector, PatternResult
-from .utils import calculate_percentage_change, find_local_extrema
+from .utils import Extrema, calculate_percentage_change, get_extrema
+
+
+@njit(cache=True)
+def _scan_double_bottom_core(
+    lows: np.ndarray,
+    highs: np.ndarray,
+    min_idx: np.ndarray,
+    max_low_diff_pct: float,
+    min_separation: int,
+    max_separation: int,
+) -> Tuple[int, int, float]:
+    """
+    Finds the first pair of local lows that forms a double bottom.
+
+    Pairs are visited in the order of ``min_idx`` (first low, then second
+    low), stopping at the first pair whose separation and low difference are
+    within bounds.
+
+    Returns:
+        ``(first, second, middle_peak)`` or ``(-1, -1, nan)`` if none match.
+    """
+    n_lows = min_idx.shape[0]
+    for i in range(n_lows - 1):
+        first = min_idx[i]
+        for j in range(i + 1, n_lows):
+            second = min_idx[j]
+
+            separation = second - first
+            if not (min_separation <= separation <= max_separation):
+                continue
+
+            first_val = lows[first]
+            if first_val == 0:
+                low_diff_pct = 0.0
+            else:
+                low_diff_pct = abs((lows[second] - first_val) / first_val * 100.0)
+            if low_diff_pct > max_low_diff_pct:
+                continue
+
+            # Highest high between the two lows (the "middle" of the W),
+            # skipping NaN like Series.max()
+            middle_peak = np.nan
+            for k in range(first, second):
+                value = highs[k]
+                if not math.isnan(value) and (
+                    math.isnan(middle_peak) or value > middle_peak
+                ):
+                    middle_peak = value
+            return first, second, middle_peak
+
+    return -1, -1, np.nan
 
 
 class DoubleBottomDetector(PatternDetector):
@@ -31,75 +86,57 @@ class DoubleBottomDetector(PatternDetector):
     def detect(
             self,
             symbol: str,
-            data: pd.DataFrame) -> Optional[PatternResult]:
+            data: pd.DataFrame,
+            extrema: Optional[Extrema] = None) -> Optional[PatternResult]:
         if len(data) < self.min_separation_days * 2:
             return None
 
-        lows = data["low"]
-        highs = data["high"]
-
-        _, min_indices = find_local_extrema(lows, order=5)
+        _, min_indices = get_extrema(data, "low", extrema)
 
         if len(min_indices) < 2:
             return None
 
         # Look for two lows at similar levels
         recent_cutoff = max(0, len(data) - 100)
-        min_indices = [i for i in min_indices if i >= recent_cutoff]
+        min_idx = np.asarray(min_indices, dtype=np.int64)
+        min_idx = min_idx[min_idx >= recent_cutoff]
 
-        if len(min_indices) < 2:
+        if len(min_idx) < 2:
+            return None
+
+        lows = data["low"].to_numpy(dtype=np.float64)
+        first_low_idx, second_low_idx, middle_peak_val = _scan_double_bottom_core(
+            lows,
+            data["high"].to_numpy(dtype=np.float64),
+            min_idx,
+            self.max_low_diff_pct,
+            self.min_separation_days,
+            self.max_separation_days,
+        )
+        if first_low_idx < 0:
             return None
 
-        # Check pairs of lows
-        for i in range(len(min_indices) - 1):
-            first_low_idx = min_indices[i]
-            for j in range(i + 1, len(min_indices)):
-                second_low_idx = min_indices[j]
-
-                separation = second_low_idx - first_low_idx
-                if not (self.min_separation_days <=
-                        separation <= self.max_separation_days):
-                    continue
-
-                first_low_val = lows.iloc[first_low_idx]
-                second_low_val = lows.iloc[second_low_idx]
-
-                # Check if lows are at similar levels
-                low_diff_pct = abs(
-                    calculate_percentage_change(first_low_val, second_low_val)
-                )
-                if low_diff_pct > self.max_low_diff_pct:
-                    continue
-
-                # Find the peak between the two lows (the "middle" of the W)
-                interval_highs = highs.iloc[first_low_idx:second_low_idx]
-                if interval_highs.empty:
-                    continue
-
-                middle_peak_val = interval_highs.max()
-                interval_highs.idxmax()
-
-                # Calculate pattern depth
-                depth_pct = calculate_percentage_change(
-                    middle_peak_val, first_low_val)
-
-                # Undercut check (second low slightly below first is bullish)
-                is_undercut = bool(second_low_val < first_low_val)
-
-                return PatternResult(
-                    pattern_type="DOUBLE_BOTTOM",
-                    symbol=symbol,
-                    detection_date=data.index[-1].date(),
-                    confidence_score=85.0 if is_undercut else 75.0,
-                    confirmed=True,
-                    meta_data={
-                        "first_low": float(first_low_val),
-                        "second_low": float(second_low_val),
-                        "middle_peak": float(middle_peak_val),
-                        "depth_pct": abs(depth_pct),
-                        "separation_days": separation,
-                        "is_undercut": is_undercut,
-                    },
-                )
-
-        return None
+        first_low_val = float(lows[first_low_idx])
+        second_low_val = float(lows[second_low_idx])
+
+        # Calculate pattern depth
+        depth_pct = calculate_percentage_change(middle_peak_val, first_low_val)
+
+        # Undercut check (second low slightly below first is bullish)
+        is_undercut = bool(second_low_val < first_low_val)
+
+        return PatternResult(
+            pattern_type="DOUBLE_BOTTOM",
+            symbol=symbol,
+            detection_date=data.index[-1].date(),
+            confidence_score=85.0 if is_undercut else 75.0,
+            confirmed=True,
+            meta_data={
+                "first_low": first_low_val,
+                "second_low": second_low_val,
+                "middle_peak": float(middle_peak_val),
+                "depth_pct": abs(depth_pct),
+                "separation_days": int(second_low_idx - first_low_idx),
+                "is_undercut": is_undercut,
+            },
+        )
@@ -1,9 +1,10 @@
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from .base import PatternDetector, PatternResult
-from .utils import calculate_percentage_change
+from .utils import Extrema, calculate_percentage_change
 
 
 class HighTightFlagDetector(PatternDetector):
@@ -33,16 +34,22 @@ class HighTightFlagDetector(PatternDetector):
     def detect(
             self,
             symbol: str,
-            data: pd.DataFrame) -> Optional[PatternResult]:
+            data: pd.DataFrame,
+            extrema: Optional[Extrema] = None) -> Optional[PatternResult]:
         min_days = self.min_prior_gain_weeks * 5  # 5 trading days per week
         max_days = self.max_prior_gain_weeks * 5
 
         if len(data) < max_days + 25:  # Need enough history
             return None
 
-        closes = data["close"]
-        highs = data["high"]
-        data["low"]
+        close_arr = data["close"].to_numpy(dtype=np.float64)
+        high_arr = data["high"].to_numpy(dtype=np.float64)
+        low_arr = data["low"].to_numpy(dtype=np.float64)
+
+        # Flag range from each position to the end (NaN-skipping like
+        # Series.max/min), shared by every pole candidate below
+        flag_highs = np.fmax.accumulate(high_arr[::-1])[::-1]
+        flag_lows = np.fmin.accumulate(low_arr[::-1])[::-1]
 
         # Look for the pattern ending recently
         # Find potential flag pole (100%+ move)
@@ -55,9 +62,10 @@ class HighTightFlagDetector(PatternDetector):
                 if pole_start_idx < 0 or recent_high_idx < 0:
                     continue
 
-                pole_start_price = closes.iloc[pole_start_idx]
-                pole_end_price = highs.iloc[pole_start_idx:recent_high_idx + 1].max()
-                pole_end_idx = highs.iloc[pole_start_idx:recent_high_idx + 1].idxmax()
+                pole_start_price = close_arr[pole_start_idx]
+                pole_highs = high_arr[pole_start_idx:recent_high_idx + 1]
+                pole_end_pos = pole_start_idx + int(np.nanargmax(pole_highs))
+                pole_end_price = high_arr[pole_end_pos]
 
                 gain_pct = calculate_percentage_change(
                     pole_start_price, pole_end_price
@@ -67,14 +75,12 @@ class HighTightFlagDetector(PatternDetector):
                     continue
 
                 # Check consolidation (flag) after the pole
-                pole_end_pos = data.index.get_loc(pole_end_idx)
-                flag_data = data.iloc[pole_end_pos:]
-
-                if len(flag_data) < 10:
+                flag_length = len(data) - pole_end_pos
+                if flag_length < 10:
                     continue
 
-                flag_high = flag_data["high"].max()
-                flag_low = flag_data["low"].min()
+                flag_high = flag_highs[pole_end_pos]
+                flag_low = flag_lows[pole_end_pos]
                 consolidation_pct = abs(
                     calculate_percentage_change(flag_high, flag_low)
                 )
@@ -93,7 +99,7 @@ class HighTightFlagDetector(PatternDetector):
                         "prior_gain_pct": gain_pct,
                         "consolidation_pct": consolidation_pct,
                         "pole_length_days": lookback,
-                        "flag_length_days": len(flag_data),
+                        "flag_length_days": flag_length,
                     },
                 )
 
@@ -1,3 +1,6 @@
+import inspect
+import logging
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import pandas as pd
@@ -8,8 +11,25 @@ from .double_bottom import DoubleBottomDetector
 from .high_tight_flag import HighTightFlagDetector
 from .stage_analysis import WeinsteinStageAnalyzer
 from .trend_template import TrendTemplateDetector
+from .utils import compute_extrema
 from .vcp import VCPDetector
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _accepts_extrema(detector_cls: type) -> bool:
+    """Whether a detector's detect() takes the shared extrema argument.
+
+    Custom detectors written against the older detect(symbol, data)
+    signature are still called, just without the precomputed extrema.
+    """
+    params = inspect.signature(detector_cls.detect).parameters.values()
+    return any(
+        p.name == "extrema" or p.kind is inspect.Parameter.VAR_KEYWORD
+        for p in params
+    )
+
 
 class PatternScanner:
     """
@@ -57,14 +77,20 @@ class PatternScanner:
             List of detected patterns
         """
         results = []
+        # Shared by every detector that scans peaks/troughs
+        extrema = compute_extrema(data)
         for detector in self.detectors:
             try:
-                result = detector.detect(symbol, data)
+                if _accepts_extrema(type(detector)):
+                    result = detector.detect(symbol, data, extrema=extrema)
+                else:
+                    result = detector.detect(symbol, data)
                 if result is not None:
                     results.append(result)
             except Exception:
                 # Log error but continue with other detectors
-                pass
+                logger.exception(
+                    "%s failed on %s", type(detector).__name__, symbol)
         return results
 
     def scan_universe(
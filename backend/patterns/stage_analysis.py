@@ -3,6 +3,7 @@ from typing import Optional
 import pandas as pd
 
 from .base import PatternDetector, PatternResult
+from .utils import Extrema
 
 
 class WeinsteinStageAnalyzer(PatternDetector):
@@ -26,7 +27,8 @@ class WeinsteinStageAnalyzer(PatternDetector):
     def detect(
             self,
             symbol: str,
-            data: pd.DataFrame) -> Optional[PatternResult]:
+            data: pd.DataFrame,
+            extrema: Optional[Extrema] = None) -> Optional[PatternResult]:
         if len(data) < self.ma_period + self.slope_window:
             return None
 
@@ -3,7 +3,10 @@ from typing import Optional
 
 import pandas as pd
 
+from backend.core.constants import TREND_TEMPLATE
+
 from .base import PatternDetector, PatternResult
+from .utils import Extrema
 
 
 class TrendTemplateDetector(PatternDetector):
@@ -27,7 +30,8 @@ class TrendTemplateDetector(PatternDetector):
     def detect(
             self,
             symbol: str,
-            data: pd.DataFrame) -> Optional[PatternResult]:
+            data: pd.DataFrame,
+            extrema: Optional[Extrema] = None) -> Optional[PatternResult]:
         """
         Checks if the latest data point meets the Trend Template criteria.
         Expects data to contain pre-calculated metrics keys:
@@ -70,11 +74,13 @@ class TrendTemplateDetector(PatternDetector):
         # 2. 150-day MA > 200-day MA
         c2 = (sma_150 > sma_200)
 
-        # 3. 200-day MA trending up for at least 1 month (20 days)
+        tt = TREND_TEMPLATE
+
+        # 3. 200-day MA trending up for at least 1 month
         # We need historical data for this. Check if data length supports it.
         c3 = False
-        if len(data) >= 20:
-            past_sma_200 = data['sma_200'].iloc[-20]
+        if len(data) >= tt.ma_200_trend_days:
+            past_sma_200 = data['sma_200'].iloc[-tt.ma_200_trend_days]
             if not pd.isna(past_sma_200):
                 c3 = (sma_200 > past_sma_200)
 
@@ -85,11 +91,11 @@ class TrendTemplateDetector(PatternDetector):
         c5 = (close > sma_50)
 
         # 6. Price >= 1.30 * 52-week low (30% above low)
-        c6 = (close >= (1.30 * week_52_low))
+        c6 = (close >= (tt.price_above_52w_low_pct * week_52_low))
 
         # 7. Price >= 0.75 * 52-week high (Within 25% of high)
         # "Within 25% of high" usually means price is >= 75% of the high.
-        c7 = (close >= (0.75 * week_52_high))
+        c7 = (close >= (tt.price_within_52w_high_pct * week_52_high))
 
         # 8. RS Rating > 70
         # If mansfield_rs is not present to proxy RS Rating, we might skip or fail.
@@ -1,8 +1,14 @@
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+# Local extrema per price column: column -> (indices_of_maxima, indices_of_minima)
+Extrema = Dict[str, Tuple[List[int], List[int]]]
+
+EXTREMA_ORDER = 5
+EXTREMA_COLUMNS = ("high", "low")
+
 
 def find_local_extrema(
         data: pd.Series, order: int = 5) -> Tuple[List[int], List[int]]:
@@ -40,6 +46,44 @@ def find_local_extrema(
     return local_max_indices.tolist(), local_min_indices.tolist()
 
 
+def compute_extrema(data: pd.DataFrame, order: int = EXTREMA_ORDER) -> Extrema:
+    """
+    Computes local extrema once for every price column detectors scan.
+
+    Args:
+        data: OHLCV DataFrame
+        order: Number of points on each side to use for comparison
+
+    Returns:
+        Extrema keyed by column, for the columns present in ``data``
+    """
+    return {
+        column: find_local_extrema(data[column], order=order)
+        for column in EXTREMA_COLUMNS
+        if column in data.columns
+    }
+
+
+def get_extrema(
+        data: pd.DataFrame,
+        column: str,
+        extrema: Optional[Extrema] = None) -> Tuple[List[int], List[int]]:
+    """
+    Returns local extrema of ``data[column]``, reusing precomputed ones.
+
+    Args:
+        data: OHLCV DataFrame
+        column: Price column to analyze
+        extrema: Extrema precomputed by ``compute_extrema``, if any
+
+    Returns:
+        Tuple of (indices_of_maxima, indices_of_minima)
+    """
+    if extrema is not None and column in extrema:
+        return extrema[column]
+    return find_local_extrema(data[column], order=EXTREMA_ORDER)
+
+
 def calculate_slope(series: pd.Series) -> float:
     """
     Calculates the linear regression slope of a series.
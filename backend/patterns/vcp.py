@@ -1,9 +1,10 @@
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from .base import PatternDetector, PatternResult
-from .utils import calculate_percentage_change, find_local_extrema, is_volume_drying_up
+from .utils import Extrema, calculate_percentage_change, get_extrema, is_volume_drying_up
 
 
 class VCPDetector(PatternDetector):
@@ -25,7 +26,8 @@ class VCPDetector(PatternDetector):
     def detect(
             self,
             symbol: str,
-            data: pd.DataFrame) -> Optional[PatternResult]:
+            data: pd.DataFrame,
+            extrema: Optional[Extrema] = None) -> Optional[PatternResult]:
         if len(data) < 50:
             return None
 
@@ -37,11 +39,12 @@ class VCPDetector(PatternDetector):
 
         # 1. Start with high/low analysis on highs
         # We need local maxima to identify the "tops" of the contractions.
-        highs = data['high']
-        lows = data['low']
+        # Plain arrays: the loops below index single positions repeatedly
+        high_arr = data['high'].to_numpy(dtype=np.float64)
+        low_arr = data['low'].to_numpy(dtype=np.float64)
 
         # Get local extrema
-        max_indices, min_indices = find_local_extrema(highs, order=5)
+        max_indices, min_indices = get_extrema(data, "high", extrema)
 
         # We need to parse these extrema to find a VCP structure ending near the current date.
         # Heuristic:
@@ -68,31 +71,13 @@ class VCPDetector(PatternDetector):
 
         # Find the global high in this window - identifying the "Left Side" of the base
         # This naive approach assumes the base started at the highest point in
-        # the window.
-        window_highs = highs.iloc[max_indices]
-        if window_highs.empty:
-            return None
-        base_start_idx = window_highs.idxmax()  # Index in data (datetime or integer?)
-        # data index is datetime usually, but max_indices are integer positions
-        # Let's map back to integer index
-        try:
-            # window_highs index is the integer position from iloc? No.
-            # highs.iloc[max_indices] keeps the original index (datetime).
-            # We want the integer location.
-            # improved:
-            base_start_pos = -1
-            base_high_val = -1.0
-
-            for idx in max_indices:
-                val = highs.iloc[idx]
-                if val > base_high_val:
-                    base_high_val = val
-                    base_start_pos = idx
-        except Exception:
-            return None
-
-        if base_start_pos == -1:
+        # the window (earliest one on ties).
+        peak_vals = high_arr[max_indices]
+        valid_peaks = ~np.isnan(peak_vals)
+        if not valid_peaks.any():
             return None
+        base_start_pos = max_indices[
+            int(np.argmax(np.where(valid_peaks, peak_vals, -np.inf)))]
 
         # Now look for contractions after base_start_pos
         # A contraction is defined by a High -> Low -> High (next pivot)
@@ -117,26 +102,24 @@ class VCPDetector(PatternDetector):
             if not interval_mins:
                 continue
 
-            # Find the minimum value in this interval
-            # interval_mins contains indices.
-            min_pos = -1
-            min_val = float('inf')
-            for m in interval_mins:
-                val = lows.iloc[m]
-                if val < min_val:
-                    min_val = val
-                    min_pos = m
-
-            if min_pos != -1:
-                # Calculate depth
-                high_val = highs.iloc[h1_pos]
-                depth_pct = abs(calculate_percentage_change(high_val, min_val))
-                contractions.append({
-                    'start_high_idx': h1_pos,
-                    'low_idx': min_pos,
-                    'end_high_idx': h2_pos,
-                    'depth': depth_pct
-                })
+            # Find the minimum value in this interval (earliest on ties)
+            interval_lows = low_arr[interval_mins]
+            valid_lows = ~np.isnan(interval_lows)
+            if not valid_lows.any():
+                continue
+            k = int(np.argmin(np.where(valid_lows, interval_lows, np.inf)))
+            min_pos = interval_mins[k]
+            min_val = interval_lows[k]
+
+            # Calculate depth
+            high_val = high_arr[h1_pos]
+            depth_pct = abs(calculate_percentage_change(high_val, min_val))
+            contractions.append({
+                'start_high_idx': h1_pos,
+                'low_idx': min_pos,
+                'end_high_idx': h2_pos,
+                'depth': depth_pct
+            })
 
         # Check if last contraction is ongoing (current price is near potential pivot or breakout)
         # For now, we only look at completed contractions or "setting up"
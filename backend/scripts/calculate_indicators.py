@@ -32,6 +32,16 @@ def main():
         default="^NSEI",
         help="Benchmark symbol ticker (default: ^NSEI)",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only compute days after each symbol's latest stored metrics",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recalculate symbols even if their price data is unchanged",
+    )
     args = parser.parse_args()
 
     logger.info("Starting indicator calculation process...")
@@ -40,11 +50,11 @@ def main():
         logger.error("Database connection failed. Exiting.")
         sys.exit(1)
 
-    manager = IndicatorManager()
+    manager = IndicatorManager(incremental=args.incremental)
 
     start_time = datetime.now()
     try:
-        manager.calculate_all(benchmark_symbol=args.benchmark)
+        manager.calculate_all(benchmark_symbol=args.benchmark, force=args.force)
     except Exception as e:
         logger.error(f"An error occurred during calculation: {e}")
         sys.exit(1)
@@ -17,11 +17,21 @@ import logging
 import sys
 from pathlib import Path
 
-from sqlalchemy import text
+from sqlalchemy import Float, text
 
 from backend.core.config import settings
+from backend.core.constants import (
+    PRICE_DATA_CHUNK_INTERVAL_DAYS,
+    PRICE_DATA_COMPRESS_AFTER_DAYS,
+)
 from backend.core.database import check_database_connection, engine
-from backend.models.db_models import Base
+from backend.models.db_models import (
+    BacktestResult,
+    Base,
+    DerivedMetrics,
+    PatternDetection,
+    PriceData,
+)
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -82,6 +92,94 @@ def create_tables() -> bool:
         return False
 
 
+def migrate_float_columns() -> bool:
+    """Convert legacy NUMERIC price and indicator columns to double precision.
+
+    Databases created before these columns became ``Float`` still store them
+    as arbitrary-precision NUMERIC. Only columns that are still NUMERIC are
+    altered, so this is safe to run repeatedly.
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        with engine.connect() as conn:
+            for table in (PriceData.__table__, DerivedMetrics.__table__):
+                float_columns = {
+                    column.name for column in table.columns
+                    if isinstance(column.type, Float)
+                }
+                result = conn.execute(
+                    text(
+                        "SELECT column_name FROM information_schema.columns "
+                        "WHERE table_name = :table AND data_type = 'numeric'"
+                    ),
+                    {"table": table.name},
+                )
+                legacy = sorted(float_columns & {row[0] for row in result})
+                if not legacy:
+                    continue
+
+                alterations = ", ".join(
+                    f'ALTER COLUMN "{name}" TYPE double precision '
+                    f'USING "{name}"::double precision'
+                    for name in legacy
+                )
+                conn.execute(text(f"ALTER TABLE {table.name} {alterations}"))
+                logger.info(
+                    f"✓ {table.name}: converted {len(legacy)} columns to double precision")
+
+            conn.commit()
+            return True
+
+    except Exception as e:
+        logger.error(f"Failed to migrate numeric columns: {e}")
+        return False
+
+
+def migrate_jsonb_columns() -> bool:
+    """Convert legacy JSON document columns to JSONB.
+
+    GIN indexes need JSONB. Only columns still typed ``json`` are altered,
+    so this is safe to run repeatedly.
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    columns = (
+        (PatternDetection.__tablename__, "pattern_metadata"),
+        (BacktestResult.__tablename__, "strategy_config"),
+    )
+    try:
+        with engine.connect() as conn:
+            for table, column in columns:
+                result = conn.execute(
+                    text(
+                        "SELECT 1 FROM information_schema.columns "
+                        "WHERE table_name = :table AND column_name = :column "
+                        "AND data_type = 'json'"
+                    ),
+                    {"table": table, "column": column},
+                )
+                if not result.fetchone():
+                    continue
+
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {table} ALTER COLUMN {column} "
+                        f"TYPE jsonb USING {column}::jsonb"
+                    )
+                )
+                logger.info(f"✓ {table}.{column} converted to jsonb")
+
+            conn.commit()
+            return True
+
+    except Exception as e:
+        logger.error(f"Failed to migrate JSON columns: {e}")
+        return False
+
+
 def convert_to_hypertable() -> bool:
     """Convert price_data table to TimescaleDB hypertable.
 
@@ -112,8 +210,11 @@ def convert_to_hypertable() -> bool:
                     "SELECT create_hypertable('price_data', 'date', "
                     "partitioning_column => 'symbol_id', "
                     "number_partitions => 4, "
+                    "chunk_time_interval => make_interval(days => :days), "
+                    "migrate_data => TRUE, "
                     "if_not_exists => TRUE)"
-                )
+                ),
+                {"days": PRICE_DATA_CHUNK_INTERVAL_DAYS},
             )
             conn.commit()
             logger.info("✓ price_data converted to TimescaleDB hypertable")
@@ -126,6 +227,56 @@ def convert_to_hypertable() -> bool:
         return False
 
 
+def enable_compression() -> bool:
+    """Enable TimescaleDB columnstore compression on price_data.
+
+    Chunks are segmented by symbol_id and ordered by date, matching the
+    per-symbol date-range reads, and compressed once they are older than
+    PRICE_DATA_COMPRESS_AFTER_DAYS. Safe to run repeatedly.
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        with engine.connect() as conn:
+            result = conn.execute(
+                text(
+                    "SELECT compression_enabled "
+                    "FROM timescaledb_information.hypertables "
+                    "WHERE hypertable_name = 'price_data'"
+                )
+            )
+            row = result.fetchone()
+            if row is None:
+                logger.warning("price_data is not a hypertable - skipping compression")
+                return False
+
+            if not row[0]:
+                conn.execute(
+                    text(
+                        "ALTER TABLE price_data SET ("
+                        "timescaledb.compress, "
+                        "timescaledb.compress_segmentby = 'symbol_id', "
+                        "timescaledb.compress_orderby = 'date DESC')"
+                    )
+                )
+
+            conn.execute(
+                text(
+                    "SELECT add_compression_policy('price_data', "
+                    "make_interval(days => :days), if_not_exists => TRUE)"
+                ),
+                {"days": PRICE_DATA_COMPRESS_AFTER_DAYS},
+            )
+            conn.commit()
+            logger.info("✓ price_data compression enabled")
+            return True
+
+    except Exception as e:
+        logger.error(f"Failed to enable compression: {e}")
+        return False
+
+
 def create_indexes() -> bool:
     """Create additional indexes for optimal query performance.
 
@@ -142,6 +293,14 @@ def create_indexes() -> bool:
                 )
             )
 
+            # Covering index for per-symbol date-range reads (also declared
+            # on the model; repeated here for tables created before it)
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_price_data_symbol_date_desc "
+                    "ON price_data(symbol_id, date DESC) "
+                    "INCLUDE (open, high, low, close, volume, adjusted_close)"))
+
             # Index on pattern_detections for confidence filtering
             conn.execute(
                 text(
@@ -149,6 +308,27 @@ def create_indexes() -> bool:
                     "ON pattern_detections(confidence_score) "
                     "WHERE confidence_score >= 70"))
 
+            # Containment (@>) lookups on pattern and strategy JSON;
+            # jsonb_path_ops is smaller and faster than the default jsonb_ops
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_pattern_metadata_gin "
+                    "ON pattern_detections "
+                    "USING gin (pattern_metadata jsonb_path_ops)"))
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_backtest_strategy_config_gin "
+                    "ON backtest_results "
+                    "USING gin (strategy_config jsonb_path_ops)"))
+
+            # Range filters on cup depth, the most queried metadata key
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_pattern_metadata_cup_depth "
+                    "ON pattern_detections "
+                    "(((pattern_metadata->>'cup_depth_pct')::double precision)) "
+                    "WHERE pattern_type IN ('CUP_AND_HANDLE', 'CUP_FORMING')"))
+
             conn.commit()
             logger.info("✓ Additional indexes created successfully")
             return True
@@ -234,6 +414,12 @@ def main() -> int:
     if not create_tables():
         logger.error("✗ Table creation failed")
         return 1
+    if not migrate_float_columns():
+        logger.warning(
+            "⚠ Numeric column migration failed - continuing anyway")
+    if not migrate_jsonb_columns():
+        logger.warning(
+            "⚠ JSON column migration failed - continuing anyway")
     logger.info("")
 
     # Step 4: Convert to hypertable (if TimescaleDB available)
@@ -242,6 +428,9 @@ def main() -> int:
         if not convert_to_hypertable():
             logger.warning(
                 "⚠ Hypertable conversion failed - continuing anyway")
+        elif not enable_compression():
+            logger.warning(
+                "⚠ Compression setup failed - continuing anyway")
         logger.info("")
     else:
         logger.info(
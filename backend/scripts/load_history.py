@@ -6,7 +6,7 @@ TimescaleDB hypertable (price_data).
 Features:
 - Supports both Indian (Zerodha) and US (Yahoo Finance) markets
 - Incremental loading (fetches only missing data)
-- Batch processing for performance
+- Batched, concurrent fetches per market
 - Error handling and logging
 - Sample mode for verification
 
@@ -30,13 +30,17 @@ import sys
 import time
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+import pandas as pd
 from sqlalchemy import func
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from backend.core.config import settings
 from backend.core.constants import (
+    BATCH_SIZE_FETCH,
     COL_ADJ_CLOSE,
     COL_CLOSE,
     COL_DATE,
@@ -88,6 +92,109 @@ def get_last_date(session, symbol_id: int) -> Optional[date]:
     return result
 
 
+def get_fetch_start(
+    session,
+    symbol: Symbol,
+    start_date: date,
+    end_date: date,
+    force: bool = False
+) -> Optional[date]:
+    """First date still to load for a symbol.
+
+    Args:
+        session: Database session
+        symbol: Symbol object
+        start_date: Target start date
+        end_date: Target end date
+        force: If True, ignore data already in the database
+
+    Returns:
+        Date to fetch from, or None if the symbol is up to date
+    """
+    actual_start = start_date
+    if not force:
+        last_date = get_last_date(session, symbol.id)
+        if last_date:
+            # Start from next day
+            actual_start = last_date + timedelta(days=1)
+
+            # If up to date, skip
+            if actual_start > end_date:
+                logger.debug(f"Skipping {symbol.symbol}: Up to date")
+                return None
+    return actual_start
+
+
+_PRICE_VALUE_COLUMNS = ("open", "high", "low", "close", "volume", "adjusted_close")
+
+
+def _price_records(symbol_id: int, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Build price_data rows from a provider frame, oldest date first.
+
+    Columns are converted once for the whole frame instead of per row;
+    prices are rounded to the cent, NaN becomes None (NULL) and volume is
+    truncated to an integer.
+    """
+    # Unadjusted providers (Zerodha) omit adjusted_close; store close
+    adj_col = COL_ADJ_CLOSE if COL_ADJ_CLOSE in df.columns else COL_CLOSE
+
+    def cents(col: str) -> pd.Series:
+        # Float columns keep whatever binary noise they arrive with
+        # (e.g. a float32 frame); store the exact cent value instead
+        return df[col].astype("float64").round(2)
+
+    frame = pd.DataFrame({
+        "date": pd.to_datetime(df[COL_DATE]).dt.date,
+        "open": cents(COL_OPEN),
+        "high": cents(COL_HIGH),
+        "low": cents(COL_LOW),
+        "close": cents(COL_CLOSE),
+        "volume": np.trunc(df[COL_VOLUME].astype("float64")).astype("Int64"),
+        "adjusted_close": cents(adj_col),
+    }).sort_values("date", kind="stable")
+    frame = frame.astype(object).where(frame.notna(), None)
+
+    names = ("symbol_id",) + tuple(frame.columns)
+    return [
+        dict(zip(names, (symbol_id,) + tuple(row)))
+        for row in frame.itertuples(index=False)
+    ]
+
+
+def store_symbol_history(session, symbol: Symbol, df) -> int:
+    """Upsert a provider DataFrame into price_data.
+
+    Rows go through one Core executemany (batched multi-row VALUES on
+    PostgreSQL) rather than a single statement with every row inlined.
+
+    Args:
+        session: Database session
+        symbol: Symbol object the rows belong to
+        df: Provider OHLCV DataFrame
+
+    Returns:
+        Number of records written
+    """
+    records = _price_records(symbol.id, df)
+    if not records:
+        return 0
+
+    # PostgreSQL in production; SQLite in tests
+    if session.get_bind().dialect.name == "sqlite":
+        stmt = sqlite_insert(PriceData.__table__)
+    else:
+        stmt = pg_insert(PriceData.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['symbol_id', 'date'],
+        set_={col: stmt.excluded[col] for col in _PRICE_VALUE_COLUMNS},
+    )
+
+    session.execute(stmt, records)
+    session.commit()
+
+    return len(records)
+
+
 def load_symbol_history(
     session,
     provider: BaseDataProvider,
@@ -110,18 +217,10 @@ def load_symbol_history(
         Number of records inserted
     """
     try:
-        # Determine actual start date
-        actual_start = start_date
-        if not force:
-            last_date = get_last_date(session, symbol.id)
-            if last_date:
-                # Start from next day
-                actual_start = last_date + timedelta(days=1)
-
-                # If up to date, skip
-                if actual_start > end_date:
-                    logger.debug(f"Skipping {symbol.symbol}: Up to date")
-                    return 0
+        actual_start = get_fetch_start(
+            session, symbol, start_date, end_date, force)
+        if actual_start is None:
+            return 0
 
         logger.info(
             f"Fetching {
@@ -140,38 +239,7 @@ def load_symbol_history(
             logger.warning(f"No data found for {symbol.symbol}")
             return 0
 
-        # Prepare records for insertion
-        records = []
-        for _, row in df.iterrows():
-            records.append({
-                'symbol_id': symbol.id,
-                'date': row[COL_DATE],
-                'open': row[COL_OPEN],
-                'high': row[COL_HIGH],
-                'low': row[COL_LOW],
-                'close': row[COL_CLOSE],
-                'volume': int(row[COL_VOLUME]),
-                'adjusted_close': row[COL_ADJ_CLOSE],
-            })
-
-        # Bulk insert with upsert (on conflict do update)
-        stmt = insert(PriceData).values(records)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=['symbol_id', 'date'],
-            set_={
-                'open': stmt.excluded.open,
-                'high': stmt.excluded.high,
-                'low': stmt.excluded.low,
-                'close': stmt.excluded.close,
-                'volume': stmt.excluded.volume,
-                'adjusted_close': stmt.excluded.adjusted_close,
-            }
-        )
-
-        session.execute(stmt)
-        session.commit()
-
-        return len(records)
+        return store_symbol_history(session, symbol, df)
 
     except DataNotFoundError:
         logger.warning(f"Symbol {symbol.symbol} not found in provider")
@@ -182,6 +250,70 @@ def load_symbol_history(
         return 0
 
 
+def load_market_history(
+    session,
+    provider: BaseDataProvider,
+    symbols: List[Symbol],
+    start_date: date,
+    end_date: date,
+    force: bool = False
+) -> int:
+    """Load historical data for many symbols of one market.
+
+    Symbols that share a fetch start date and exchange are requested
+    together through provider.get_historical_data_batch (concurrent
+    requests, or multi-ticker downloads for Yahoo), BATCH_SIZE_FETCH
+    symbols at a time, instead of one blocking request after another.
+
+    Args:
+        session: Database session
+        provider: Data provider instance
+        symbols: Symbol objects, all served by this provider
+        start_date: Target start date
+        end_date: Target end date
+        force: If True, reload even if data exists
+
+    Returns:
+        Number of records inserted
+    """
+    groups: Dict[Tuple[date, Optional[str]], List[Symbol]] = {}
+    for symbol in symbols:
+        actual_start = get_fetch_start(
+            session, symbol, start_date, end_date, force)
+        if actual_start is None:
+            continue
+        exchange = symbol.exchange if symbol.market == MARKET_IN else None
+        groups.setdefault((actual_start, exchange), []).append(symbol)
+
+    total_records = 0
+    done = len(symbols) - sum(len(group) for group in groups.values())
+    for (actual_start, exchange), group in groups.items():
+        for i in range(0, len(group), BATCH_SIZE_FETCH):
+            batch = {s.symbol: s for s in group[i:i + BATCH_SIZE_FETCH]}
+            logger.info(
+                f"Fetching {len(batch)} symbols from {actual_start} "
+                f"to {end_date}")
+
+            frames = provider.get_historical_data_batch(
+                list(batch), actual_start, end_date, exchange=exchange)
+
+            for ticker, symbol in batch.items():
+                df = frames.get(ticker)
+                if df is None or df.empty:
+                    logger.warning(f"No data found for {ticker}")
+                    continue
+                try:
+                    total_records += store_symbol_history(session, symbol, df)
+                except Exception as e:
+                    logger.error(f"Error loading {ticker}: {e}")
+                    session.rollback()
+
+            done += len(batch)
+            logger.info(f"Progress: {done}/{len(symbols)}")
+
+    return total_records
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Load historical price data")
@@ -270,16 +402,10 @@ def main() -> int:
                 f"Processing {
                     len(market_symbols)} symbols for {market}...")
 
-            for i, symbol in enumerate(market_symbols):
-                records = load_symbol_history(
-                    session, provider, symbol, start_date, end_date, args.force
-                )
-                total_records += records
-
-                # Progress logging
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Progress {market}: {
-                                i + 1}/{len(market_symbols)}")
+            total_records += load_market_history(
+                session, provider, market_symbols, start_date, end_date,
+                args.force
+            )
 
     duration = time.time() - start_time
     logger.info("=" * 70)
@@ -0,0 +1,99 @@
+"""Tests for backtest result caching."""
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.backtesting import cache
+from backend.backtesting.engine import BacktestEngine
+from backend.backtesting.risk_manager import RiskManager
+
+
+@pytest.fixture
+def price_data() -> Dict[str, pd.DataFrame]:
+    """Create sample price data for one symbol."""
+    dates = pd.date_range(start="2024-01-01", periods=30, freq="B")
+    prices = np.linspace(100, 125, 30)
+
+    df = pd.DataFrame(index=pd.Index(dates.date))
+    df["open"] = prices
+    df["high"] = prices + 1
+    df["low"] = prices - 1
+    df["close"] = prices
+    df["volume"] = 1000000
+    return {"AAPL": df}
+
+
+@pytest.fixture
+def signals() -> Dict[str, List[Dict[str, Any]]]:
+    """Create sample buy signal on first day."""
+    return {"2024-01-01": [{"symbol": "AAPL", "confidence": 85.0}]}
+
+
+@pytest.fixture(autouse=True)
+def clean_memory_cache() -> None:
+    """Isolate the in-process cache between tests."""
+    cache.clear_memory_cache()
+
+
+class TestBacktestCache:
+    def test_disabled_by_default(
+        self,
+        price_data: Dict[str, pd.DataFrame],
+        signals: Dict[str, List[Dict[str, Any]]],
+    ) -> None:
+        engine = BacktestEngine()
+        assert engine.cache_dir is None
+        engine.run_backtest(price_data, signals)
+        assert not cache._memory_cache
+
+    def test_hit_returns_stored_results(
+        self,
+        tmp_path: Path,
+        price_data: Dict[str, pd.DataFrame],
+        signals: Dict[str, List[Dict[str, Any]]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        first = BacktestEngine(cache_dir=tmp_path).run_backtest(
+            price_data, signals)
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+        # A hit must not re-run the simulation, even from a cold L1
+        cache.clear_memory_cache()
+        monkeypatch.setattr(
+            BacktestEngine,
+            "_process_day",
+            lambda *args: pytest.fail("simulation re-ran on cache hit"),
+        )
+        second = BacktestEngine(cache_dir=tmp_path).run_backtest(
+            price_data, signals)
+
+        assert second["trades"] == first["trades"]
+        assert second["equity_curve"].equals(first["equity_curve"])
+        assert second["metrics"] == first["metrics"]
+
+    def test_key_changes_with_inputs(
+        self,
+        price_data: Dict[str, pd.DataFrame],
+        signals: Dict[str, List[Dict[str, Any]]],
+    ) -> None:
+        engine = BacktestEngine()
+        base = cache.backtest_cache_key(engine, price_data, signals, None, None)
+
+        assert base == cache.backtest_cache_key(
+            BacktestEngine(), price_data, signals, None, None)
+
+        tighter = BacktestEngine(
+            risk_manager=RiskManager(initial_stop_loss_pct=0.05))
+        assert base != cache.backtest_cache_key(
+            tighter, price_data, signals, None, None)
+
+        bumped = {"AAPL": price_data["AAPL"].assign(
+            close=price_data["AAPL"]["close"] + 0.01)}
+        assert base != cache.backtest_cache_key(
+            engine, bumped, signals, None, None)
+
+        assert base != cache.backtest_cache_key(
+            engine, price_data, {}, None, None)
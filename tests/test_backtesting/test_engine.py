@@ -5,7 +5,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from backend.backtesting.engine import BacktestEngine
+from backend.backtesting.engine import BacktestEngine, run_parallel
 
 
 @pytest.fixture
@@ -52,7 +52,8 @@ class TestBacktestEngine:
 
         # Simulate some state changes
         engine.cash = 50000.0
-        engine.equity_curve.append(95000.0)
+        engine.equity_curve = np.array([95000.0])
+        engine._eq_i = 1
 
         engine.reset()
 
@@ -211,3 +212,162 @@ class TestBacktestEngine:
         assert "max_drawdown" in metrics
         assert "win_rate" in metrics
         assert "total_trades" in metrics
+
+    def test_atr_precomputed_once_per_symbol(
+        self,
+        sample_price_data: Dict[str, pd.DataFrame],
+        sample_signals: Dict[str, List[Dict[str, Any]]],
+    ) -> None:
+        """Test that ATR is cached per symbol for the daily loop."""
+        engine = BacktestEngine(initial_capital=100000.0)
+        engine.run_backtest(sample_price_data, sample_signals)
+
+        atr = engine._atr_mat[:, engine._col_of["AAPL"]]
+        assert len(atr) == len(sample_price_data["AAPL"])
+        assert np.isnan(atr[12])
+        assert not np.isnan(atr[13])
+
+    def test_exit_slots_track_open_positions(self) -> None:
+        """Test that exit-check arrays stay aligned with open positions."""
+        dates = pd.date_range(start="2024-01-01", periods=6, freq="B")
+        series = {
+            "AAPL": [100, 101, 102, 103, 104, 105],
+            "MSFT": [100, 95, 85, 80, 80, 80],  # stops out on day 3
+            "GOOG": [100, 100, 101, 101, 102, 102],
+        }
+        price_data: Dict[str, pd.DataFrame] = {}
+        for symbol, prices in series.items():
+            df = pd.DataFrame(index=pd.Index(dates.date))
+            df["open"] = prices
+            df["high"] = [p + 1 for p in prices]
+            df["low"] = [p - 1 for p in prices]
+            df["close"] = prices
+            df["volume"] = 1000000
+            price_data[symbol] = df
+
+        signals: Dict[str, List[Dict[str, Any]]] = {
+            "2024-01-01": [
+                {"symbol": s, "confidence": 80.0} for s in series
+            ]
+        }
+
+        engine = BacktestEngine(initial_capital=100000.0)
+        result = engine.run_backtest(price_data, signals)
+
+        assert [t.symbol for t in result["trades"]] == ["MSFT"]
+        assert engine._slot_symbols == list(engine.positions)
+        for symbol, slot in engine._slot_of.items():
+            position = engine.positions[symbol]
+            assert engine._slot_prices[slot] == position.current_price
+            assert engine._slot_stops[slot] == position.stop_loss
+
+    def test_incremental_portfolio_value_matches_positions(
+        self,
+        sample_price_data: Dict[str, pd.DataFrame],
+        sample_signals: Dict[str, List[Dict[str, Any]]],
+    ) -> None:
+        """Test that the running position value equals a full re-sum."""
+        engine = BacktestEngine(initial_capital=100000.0)
+        engine.run_backtest(sample_price_data, sample_signals)
+
+        expected = engine.cash + sum(
+            p.current_value for p in engine.positions.values()
+        )
+        assert engine._calculate_portfolio_value() == pytest.approx(expected)
+
+    def test_datetime_index_matches_date_index(
+        self,
+        sample_price_data: Dict[str, pd.DataFrame],
+        sample_signals: Dict[str, List[Dict[str, Any]]],
+    ) -> None:
+        """Test that DatetimeIndex frames build the same calendar."""
+        df = sample_price_data["AAPL"]
+        ts_df = df.set_axis(pd.DatetimeIndex(df.index))
+
+        by_date = BacktestEngine().run_backtest({"AAPL": df}, sample_signals)
+        engine = BacktestEngine()
+        by_ts = engine.run_backtest({"AAPL": ts_df}, sample_signals)
+
+        assert engine._calendar == list(df.index)
+        assert by_ts["trades"] == by_date["trades"]
+        assert by_ts["equity_curve"].equals(by_date["equity_curve"])
+
+    def test_signals_keyed_by_date_objects(
+        self,
+        sample_price_data: Dict[str, pd.DataFrame],
+        sample_signals: Dict[str, List[Dict[str, Any]]],
+    ) -> None:
+        """Test that date-keyed signals behave like ISO-string keys."""
+        date_signals = {
+            pd.Timestamp(k).date(): v for k, v in sample_signals.items()
+        }
+
+        by_str = BacktestEngine().run_backtest(
+            sample_price_data, sample_signals)
+        by_date = BacktestEngine().run_backtest(
+            sample_price_data, date_signals)
+
+        assert len(by_str["trades"]) + len(by_str["open_positions"]) >= 1
+        assert by_date["trades"] == by_str["trades"]
+        assert by_date["open_positions"] == by_str["open_positions"]
+
+    def test_entry_ranking_skips_and_ties(self) -> None:
+        """Test confidence ranking, tie order and fall-through on skips."""
+        dates = pd.date_range(start="2024-01-01", periods=5, freq="B")
+        price_data: Dict[str, pd.DataFrame] = {}
+        for symbol in ["AAPL", "MSFT", "GOOG", "AMZN"]:
+            df = pd.DataFrame(index=pd.Index(dates.date))
+            df["open"] = 100.0
+            df["high"] = 101.0
+            df["low"] = 99.0
+            df["close"] = 100.0
+            df["volume"] = 1000000
+            price_data[symbol] = df
+
+        signals = {"2024-01-01": [
+            {"symbol": "AMZN", "confidence": 50.0},
+            {"symbol": "NOPE", "confidence": 99.0},  # no price data
+            {"symbol": "GOOG", "confidence": 70.0},
+            {"symbol": "MSFT", "confidence": 70.0},
+            {"symbol": "AAPL", "confidence": 60.0},
+        ]}
+
+        engine = BacktestEngine(initial_capital=100000.0, max_positions=3)
+        engine.run_backtest(price_data, signals)
+
+        assert list(engine.positions) == ["GOOG", "MSFT", "AAPL"]
+
+
+class TestRunParallel:
+    """Test suite for the multi-process single-symbol runner."""
+
+    def test_matches_sequential_runs(self) -> None:
+        """Test that parallel results equal per-symbol sequential runs."""
+        dates = pd.date_range(start="2024-01-01", periods=20, freq="B")
+        price_data: Dict[str, pd.DataFrame] = {}
+        signals: Dict[str, List[Dict[str, Any]]] = {"2024-01-01": []}
+        for i, symbol in enumerate(["AAPL", "MSFT"]):
+            prices = np.linspace(100 + i * 10, 90 + i * 40, 20)
+            df = pd.DataFrame(index=pd.Index(dates.date))
+            df["open"] = prices
+            df["high"] = prices + 1
+            df["low"] = prices - 1
+            df["close"] = prices
+            df["volume"] = 1000000
+            price_data[symbol] = df
+            signals["2024-01-01"].append({"symbol": symbol, "confidence": 80.0})
+
+        results = run_parallel(
+            price_data, signals, max_workers=2, initial_capital=50000.0
+        )
+
+        assert set(results) == {"AAPL", "MSFT"}
+        for symbol, df in price_data.items():
+            expected = BacktestEngine(initial_capital=50000.0).run_backtest(
+                {symbol: df}, signals
+            )
+            assert results[symbol]["trades"] == expected["trades"]
+            assert (
+                results[symbol]["metrics"]["final_value"]
+                == expected["metrics"]["final_value"]
+            )
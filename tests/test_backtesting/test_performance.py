@@ -143,3 +143,60 @@ class TestPerformanceCalculator:
         """Test max drawdown with empty equity curve."""
         mdd = calc.calculate_max_drawdown(pd.Series([], dtype=float))
         assert mdd == 0.0
+
+    def test_max_drawdown_monotonic_curve(
+        self, calc: PerformanceCalculator
+    ) -> None:
+        """Test max drawdown is zero when equity never declines."""
+        equity = pd.Series([100.0, 101.0, 101.0, 105.0])
+        assert calc.calculate_max_drawdown(equity) == 0.0
+
+    def test_max_drawdown_picks_deepest_trough(
+        self, calc: PerformanceCalculator
+    ) -> None:
+        """Test the deepest decline wins over a later, shallower one."""
+        equity = pd.Series([100.0, 80.0, 120.0, 108.0])
+        assert calc.calculate_max_drawdown(equity) == pytest.approx(0.20)
+
+    def test_all_metrics_ratios_match_public_methods(
+        self, calc: PerformanceCalculator
+    ) -> None:
+        """Test fused return stats agree with the Series-based ratios."""
+        equity = pd.Series([100.0, 102.0, 99.0, 103.0, 101.0, 106.0])
+        metrics = calc.calculate_all_metrics(
+            trades=[], equity_curve=equity, initial_capital=100.0
+        )
+        returns = equity.pct_change().dropna()
+
+        assert metrics["sharpe_ratio"] == pytest.approx(
+            calc.calculate_sharpe_ratio(returns)
+        )
+        assert metrics["sortino_ratio"] == pytest.approx(
+            calc.calculate_sortino_ratio(returns)
+        )
+
+    def test_breakeven_trade_counts_as_loser(
+        self, calc: PerformanceCalculator, sample_trades: List[Trade]
+    ) -> None:
+        """Test a zero-P&L trade is a loser but adds no gross loss."""
+        breakeven = Trade(
+            symbol="AMZN",
+            entry_date=date(2024, 4, 1),
+            entry_price=100.0,
+            exit_date=date(2024, 4, 5),
+            exit_price=100.0,
+            shares=10,
+            profit_loss=0.0,
+            profit_loss_pct=0.0,
+            exit_reason="SIGNAL",
+        )
+        metrics = calc.calculate_all_metrics(
+            trades=sample_trades + [breakeven],
+            equity_curve=pd.Series([100.0, 101.0]),
+            initial_capital=100.0,
+        )
+
+        assert metrics["winning_trades"] == 2
+        assert metrics["losing_trades"] == 2
+        assert metrics["win_rate"] == pytest.approx(0.5)
+        assert metrics["profit_factor"] == pytest.approx(5.0)
@@ -93,3 +93,19 @@ class TestTrade:
         )
 
         assert trade.is_winner is False
+
+
+class TestSlots:
+    def test_position_and_trade_use_slots(self) -> None:
+        pos = Position(
+            symbol="AAPL",
+            shares=10,
+            entry_price=100.0,
+            entry_date=date(2024, 1, 1),
+            stop_loss=90.0,
+            take_profit=120.0,
+        )
+        assert not hasattr(pos, "__dict__")
+        assert pos.current_price == 100.0
+        assert pos.current_date == date(2024, 1, 1)
+        assert "__dict__" not in dir(Trade)
@@ -1,6 +1,8 @@
 """Tests for RiskManager class."""
 from datetime import date
 
+import numpy as np
+
 from backend.backtesting.positions import Position
 from backend.backtesting.risk_manager import RiskManager
 
@@ -86,3 +88,22 @@ class TestRiskManager:
         # Should reject duplicate
         assert rm.check_correlation_risk("AAPL", ["AAPL", "MSFT"]) is True
         assert rm.check_correlation_risk("GOOG", ["AAPL", "MSFT"]) is False
+
+    def test_size_batch_matches_scalar(self) -> None:
+        for stop_pct in (0.10, 0.0, -0.05):  # incl. stop at/above entry
+            rm = RiskManager(initial_stop_loss_pct=stop_pct)
+            prices = np.array([12.34, 100.0, 250.5, 3999.99])
+
+            stops, targets, shares = rm.size_batch(prices, 123456.0)
+
+            for i, price in enumerate(prices):
+                stop = rm.calculate_initial_stop_loss(price)
+                assert stops[i] == stop
+                assert targets[i] == rm.calculate_take_profit(price)
+                assert shares[i] == rm.calculate_position_size(
+                    123456.0, price, stop)
+
+    def test_size_batch_invalid_prices(self) -> None:
+        rm = RiskManager()
+        _, _, shares = rm.size_batch(np.array([np.nan, 0.0, 50.0]), 100000.0)
+        assert shares.tolist() == [0, 0, 200]
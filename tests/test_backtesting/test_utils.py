@@ -0,0 +1,65 @@
+"""Tests for backtesting utility functions."""
+import numpy as np
+import pandas as pd
+
+from backend.backtesting.utils import _atr_numpy, calculate_atr
+
+
+def _reference_atr(
+    high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14
+) -> pd.Series:
+    """Plain pandas ATR used as the correctness oracle."""
+    tr = pd.concat(
+        [high - low, abs(high - close.shift(1)), abs(low - close.shift(1))],
+        axis=1,
+    ).max(axis=1)
+    return tr.rolling(window=period).mean()
+
+
+class TestCalculateAtr:
+    def test_matches_pandas_reference(self) -> None:
+        rng = np.random.default_rng(42)
+        close = pd.Series(100 + rng.standard_normal(300).cumsum())
+        high = close + rng.random(300)
+        low = close - rng.random(300)
+
+        atr = calculate_atr(high, low, close)
+        expected = _reference_atr(high, low, close)
+
+        assert atr.index.equals(high.index)
+        np.testing.assert_allclose(atr, expected, equal_nan=True)
+
+    def test_nan_input_matches_pandas_reference(self) -> None:
+        close = pd.Series(np.linspace(100, 130, 60))
+        high = close + 1
+        low = close - 1
+        high.iloc[20] = np.nan
+
+        atr = calculate_atr(high, low, close, period=5)
+        expected = _reference_atr(high, low, close, period=5)
+
+        np.testing.assert_allclose(atr, expected, equal_nan=True)
+        assert not np.isnan(atr.iloc[-1])
+
+    def test_numpy_fallback_matches_pandas_reference(self) -> None:
+        rng = np.random.default_rng(7)
+        close = pd.Series(50 + rng.standard_normal(100).cumsum())
+        high = close + rng.random(100)
+        low = close - rng.random(100)
+        low.iloc[40] = np.nan
+
+        atr = _atr_numpy(
+            high.to_numpy(), low.to_numpy(), close.to_numpy(), 14
+        )
+        expected = _reference_atr(high, low, close)
+
+        np.testing.assert_allclose(atr, expected, equal_nan=True)
+
+    def test_empty_input_returns_empty_series(self) -> None:
+        empty = pd.Series([], dtype=float)
+
+        atr = calculate_atr(empty, empty, empty)
+        assert atr.empty
+
+        values = empty.to_numpy()
+        assert _atr_numpy(values, values, values, 14).size == 0
@@ -3,11 +3,14 @@
 Tests YahooFinanceProvider and ZerodhaProvider with mocked external dependencies.
 """
 
+import asyncio
 from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
+from yfinance.exceptions import YFRateLimitError
 
 from backend.core.constants import (
     COL_CLOSE,
@@ -19,8 +22,20 @@ from backend.core.constants import (
     EXCHANGE_BSE,
     EXCHANGE_NSE,
     MARKET_IN,
+    MARKET_US,
+    YAHOO_BATCH_SIZE,
 )
-from backend.data_providers.base import DataNotFoundError, DataProviderError
+from backend.data_providers.base import (
+    BaseDataProvider,
+    DataNotFoundError,
+    DataProviderError,
+    RateLimitError,
+    _first_invalid_row,
+    _invalid_row_mask,
+    downcast_ohlcv,
+)
+from backend.data_providers.cache import CachedHistoryMixin, clear_memory_cache
+from backend.data_providers import yahoo_client
 from backend.data_providers.yahoo_client import YahooFinanceProvider
 from backend.data_providers.zerodha_client import ZerodhaProvider
 
@@ -44,10 +59,6 @@ class TestYahooFinanceProvider:
 
     def test_get_historical_data_success(self, mock_yfinance):
         """Test successful historical data fetch."""
-        # Setup mock
-        mock_ticker = MagicMock()
-        mock_yfinance.Ticker.return_value = mock_ticker
-
         # Create sample DataFrame
         data = {
             'Open': [150.0, 152.0],
@@ -61,7 +72,7 @@ class TestYahooFinanceProvider:
         df = pd.DataFrame(data, index=dates)
         df.index.name = 'Date'
 
-        mock_ticker.history.return_value = df
+        mock_yfinance.download.return_value = pd.concat({'AAPL': df}, axis=1)
 
         # Execute
         provider = YahooFinanceProvider()
@@ -76,12 +87,12 @@ class TestYahooFinanceProvider:
         assert COL_DATE in result.columns
         assert COL_CLOSE in result.columns
         assert result.iloc[0][COL_CLOSE] == 153.0
+        assert result[COL_DATE].dtype == 'datetime64[ns]'
+        assert result[COL_DATE].iloc[0] == pd.Timestamp('2023-01-01')
 
     def test_get_historical_data_not_found(self, mock_yfinance):
         """Test handling of missing data."""
-        mock_ticker = MagicMock()
-        mock_yfinance.Ticker.return_value = mock_ticker
-        mock_ticker.history.return_value = pd.DataFrame()  # Empty DataFrame
+        mock_yfinance.download.return_value = pd.DataFrame()  # Empty DataFrame
 
         provider = YahooFinanceProvider()
 
@@ -91,6 +102,66 @@ class TestYahooFinanceProvider:
                     2023, 1, 1), date(
                     2023, 1, 2))
 
+    def test_get_historical_data_batch(self, mock_yfinance):
+        """Test that symbols are fetched YAHOO_BATCH_SIZE tickers per request."""
+        dates = pd.to_datetime(['2023-01-03', '2023-01-04'])
+        good = pd.DataFrame({
+            'Open': [150.0, 152.0],
+            'High': [155.0, 156.0],
+            'Low': [149.0, 151.0],
+            'Close': [153.0, 154.0],
+            'Volume': [1000000, 1200000],
+            'Adj Close': [153.0, 154.0],
+        }, index=pd.Index(dates, name='Date'))
+        missing = good.copy() * float('nan')  # failed tickers are all-NaN
+
+        def download(tickers, **kwargs):
+            return pd.concat(
+                {t: missing if t == 'BAD' else good for t in tickers}, axis=1)
+
+        mock_yfinance.download.side_effect = download
+        symbols = [f'S{i}' for i in range(YAHOO_BATCH_SIZE)] + ['AAPL', 'BAD']
+
+        provider = YahooFinanceProvider()
+        result = provider.get_historical_data_batch(
+            symbols, date(2023, 1, 3), date(2023, 1, 5))
+
+        assert mock_yfinance.download.call_count == 2
+        assert set(result) == set(symbols) - {'BAD'}
+        assert result['AAPL'][COL_CLOSE].tolist() == [153.0, 154.0]
+        assert list(result['AAPL'].columns)[0] == COL_DATE
+
+    def test_get_sp500_symbols_cached(self, mock_yfinance, tmp_path, monkeypatch):
+        """Test S&P 500 parsing and reuse from memory and disk."""
+        monkeypatch.setattr(yahoo_client, '_sp500_cache', None)
+        table = pd.DataFrame({
+            'Symbol': ['AAPL', 'IBM'],
+            'Security': ['Apple Inc.', 'IBM'],
+            'Exchange': ['NASDAQ', 'NYSE'],
+            'GICS Sector': ['Information Technology', 'Information Technology'],
+        })
+        provider = YahooFinanceProvider()
+        provider.cache_dir = tmp_path
+
+        with patch.object(yahoo_client.pd, 'read_html',
+                          return_value=[table]) as read_html:
+            symbols = provider.get_sp500_symbols()
+            assert symbols[1] == {
+                'symbol': 'IBM',
+                'name': 'IBM',
+                'exchange': 'NYSE',
+                'market': MARKET_US,
+                'sector': 'Information Technology',
+            }
+            assert symbols[0]['exchange'] == 'NASDAQ'
+
+            symbols[0]['symbol'] = 'CHANGED'  # must not leak into the cache
+            assert provider.get_sp500_symbols()[0]['symbol'] == 'AAPL'
+
+            monkeypatch.setattr(yahoo_client, '_sp500_cache', None)
+            assert provider.get_sp500_symbols()[1]['symbol'] == 'IBM'  # from disk
+            assert read_html.call_count == 1
+
     def test_validate_symbol_success(self, mock_yfinance):
         """Test successful symbol validation."""
         mock_ticker = MagicMock()
@@ -109,6 +180,17 @@ class TestYahooFinanceProvider:
         provider = YahooFinanceProvider()
         assert provider.validate_symbol('INVALID') is False
 
+    def test_symbol_info_fetched_once(self, mock_yfinance):
+        """Test that validate_symbol and get_symbol_info share one lookup."""
+        mock_ticker = MagicMock()
+        mock_yfinance.Ticker.return_value = mock_ticker
+        mock_ticker.info = {'regularMarketPrice': 150.0, 'longName': 'Apple Inc.'}
+
+        provider = YahooFinanceProvider()
+        assert provider.validate_symbol('AAPL') is True
+        assert provider.get_symbol_info('AAPL')['name'] == 'Apple Inc.'
+        mock_yfinance.Ticker.assert_called_once_with('AAPL')
+
 
 class TestZerodhaProvider:
     """Test suite for ZerodhaProvider."""
@@ -174,7 +256,8 @@ class TestZerodhaProvider:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 1
         assert result.iloc[0][COL_CLOSE] == 2520.0
-        assert 'adjusted_close' in result.columns
+        # Unadjusted prices: no duplicate adjusted_close column
+        assert 'adjusted_close' not in result.columns
 
     def test_get_nse_instruments(self, mock_kiteconnect):
         """Test fetching NSE instruments list."""
@@ -309,11 +392,177 @@ class TestYahooFinanceProviderExtended:
 
         assert provider.validate_data(df) is False
 
+    def test_data_validation_rejects_bad_rows(self, mock_yfinance):
+        """Test that nulls, broken OHLC and non-positive volume fail."""
+        provider = YahooFinanceProvider()
+        valid = {
+            COL_OPEN: [150.0, 151.0],
+            COL_HIGH: [155.0, 156.0],
+            COL_LOW: [149.0, 150.0],
+            COL_CLOSE: [153.0, 154.0],
+            COL_VOLUME: [1000000, 1200000],
+        }
+        assert provider.validate_data(pd.DataFrame(valid)) is True
+
+        for column, values in [
+            (COL_CLOSE, [153.0, None]),
+            (COL_HIGH, [148.0, 156.0]),   # high below low
+            (COL_LOW, [149.0, 157.0]),    # low above high/close
+            (COL_VOLUME, [1000000, 0]),
+        ]:
+            df = pd.DataFrame({**valid, column: values})
+            assert provider.validate_data(df) is False, column
+
+    def test_data_validation_arrays(self, mock_yfinance):
+        """Test validation straight from column arrays."""
+        provider = YahooFinanceProvider()
+        opens = np.array([150.0, 151.0])
+        highs = np.array([155.0, 156.0])
+        lows = np.array([149.0, 150.0])
+        closes = np.array([153.0, 154.0])
+
+        assert provider.validate_data_arrays(
+            opens, highs, lows, closes, np.array([10, 20])) is True
+        assert provider.validate_data_arrays(
+            opens, highs, lows, closes, np.array([10, -1])) is False
+        assert provider.validate_data_arrays(
+            opens, highs, lows, closes, np.array([10])) is False
+
+    def test_downcast_ohlcv(self):
+        """Test that columns narrow only when no precision is lost."""
+        df = pd.DataFrame({
+            COL_OPEN: [150.25], COL_HIGH: [155.5], COL_LOW: [149.75],
+            COL_CLOSE: [153.01], COL_VOLUME: [1000000],
+        })
+        out = downcast_ohlcv(df)
+        assert out[COL_CLOSE].dtype == np.float32
+        assert out[COL_VOLUME].dtype == np.int32
+        assert round(float(out[COL_CLOSE].iloc[0]), 2) == 153.01
+
+        big = pd.DataFrame({
+            COL_OPEN: [130000.55], COL_HIGH: [131000.0], COL_LOW: [129000.0],
+            COL_CLOSE: [130500.45], COL_VOLUME: [5_000_000_000],
+        })
+        out = downcast_ohlcv(big)
+        assert out[COL_CLOSE].dtype == np.float64
+        assert out[COL_VOLUME].dtype == np.int64
+
+    def test_first_invalid_row(self):
+        """Test the compiled validation pass reports the first bad row."""
+        good = [10.0, 12.0, 9.0, 11.0, 100.0]
+        arr = np.array([good] * 4)
+        assert _first_invalid_row(arr) == -1
+
+        arr[2, 3] = np.nan
+        arr[3, 4] = 0.0
+        assert _first_invalid_row(arr) == 2
+
+        arr = np.array([good, [10.0, 12.0, 11.0, 10.5, 100.0]])  # low > close
+        assert _first_invalid_row(arr) == 1
+
+    def test_rate_limit_paces_bursts(self, mock_yfinance):
+        """Test that back-to-back requests are spaced by 1 / rate_limit."""
+        provider = YahooFinanceProvider(rate_limit=4.0)
+        BaseDataProvider._rate_state.pop('yahoo', None)
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch('backend.data_providers.base.time') as mock_time, \
+                patch('backend.data_providers.base.random.uniform', return_value=0.0):
+            mock_time.monotonic.side_effect = lambda: clock[0]
+            mock_time.sleep.side_effect = fake_sleep
+            for _ in range(3):
+                provider._enforce_rate_limit()
+
+        assert sleeps == [pytest.approx(0.25), pytest.approx(0.25)]
+
+    def test_rate_limit_shared_across_instances(self, mock_yfinance):
+        """Test that instances with the same rate_limit_key share one budget."""
+        first = YahooFinanceProvider(rate_limit=4.0)
+        second = YahooFinanceProvider(rate_limit=4.0)
+        BaseDataProvider._rate_state.pop('yahoo', None)
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch('backend.data_providers.base.time') as mock_time, \
+                patch('backend.data_providers.base.random.uniform', return_value=0.0):
+            mock_time.monotonic.side_effect = lambda: clock[0]
+            mock_time.sleep.side_effect = fake_sleep
+            first._enforce_rate_limit()
+            second._enforce_rate_limit()
+
+        assert sleeps == [pytest.approx(0.25)]
+
+    def test_rate_limit_burst_and_jitter(self, mock_yfinance):
+        """Test that rate_burst requests pass unpaced and waits get jitter."""
+        class _BurstyProvider(_StubProvider):
+            rate_burst = 2.0
+
+        provider = _BurstyProvider(rate_limit=4.0)
+        BaseDataProvider._rate_state.pop('_BurstyProvider', None)
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch('backend.data_providers.base.time') as mock_time, \
+                patch('backend.data_providers.base.random.uniform', return_value=0.01):
+            mock_time.monotonic.side_effect = lambda: clock[0]
+            mock_time.sleep.side_effect = fake_sleep
+            for _ in range(3):
+                provider._enforce_rate_limit()
+
+        assert sleeps == [pytest.approx(0.26)]
+
+    def test_retry_on_provider_rate_limit_error(self, mock_yfinance):
+        """Test that yfinance's own 429 error is retried."""
+        provider = YahooFinanceProvider()
+        flaky = MagicMock(side_effect=[YFRateLimitError(), "ok"])
+
+        with patch('backend.data_providers.base.time.sleep') as mock_sleep:
+            assert provider._retry_on_failure(flaky) == "ok"
+        mock_sleep.assert_called_once()
+
+    def test_retry_on_failure(self, mock_yfinance):
+        """Test that only transient errors are retried, with backoff."""
+        provider = YahooFinanceProvider()
+        flaky = MagicMock(side_effect=[RateLimitError("429"), "ok"])
+        broken = MagicMock(side_effect=ValueError("bad request"))
+
+        with patch('backend.data_providers.base.time.sleep') as mock_sleep:
+            assert provider._retry_on_failure(flaky, "AAPL") == "ok"
+            flaky.assert_called_with("AAPL")
+            mock_sleep.assert_called_once()
+
+            with pytest.raises(ValueError):
+                provider._retry_on_failure(broken)
+            assert broken.call_count == 1
+
+    def test_invalid_row_mask_matches_kernel(self):
+        """Test the NumPy fallback flags exactly the rows the kernel does."""
+        rng = np.random.default_rng(0)
+        arr = rng.uniform(1.0, 2.0, size=(200, 5))
+        arr[rng.integers(0, 200, 10), 3] = np.nan
+        arr[rng.integers(0, 200, 10), 4] = 0.0
+
+        mask = _invalid_row_mask(arr)
+        assert mask.any()
+        for i in range(len(arr)):
+            assert mask[i] == (_first_invalid_row(arr[i:i + 1]) == 0)
+
     def test_error_handling_api_failure(self, mock_yfinance):
         """Test error handling when API fails."""
-        mock_ticker = MagicMock()
-        mock_yfinance.Ticker.return_value = mock_ticker
-        mock_ticker.history.side_effect = Exception("API Error")
+        mock_yfinance.download.side_effect = Exception("API Error")
 
         provider = YahooFinanceProvider()
 
@@ -345,6 +594,54 @@ class TestZerodhaProviderExtended:
         # instruments() should only be called once (caching works)
         assert mock_kite_instance.instruments.call_count == 1
 
+    def test_instruments_persisted_across_instances(self, mock_kiteconnect, tmp_path):
+        """Test that a fresh provider reuses the instruments list on disk."""
+        mock_kite_instance = mock_kiteconnect.return_value
+        mock_kite_instance.instruments.return_value = [
+            {'instrument_token': 123456, 'tradingsymbol': 'RELIANCE', 'exchange': EXCHANGE_NSE}
+        ]
+
+        first = ZerodhaProvider()
+        first.cache_dir = tmp_path
+        assert first.get_instrument_token('RELIANCE', EXCHANGE_NSE) == 123456
+
+        second = ZerodhaProvider()
+        second.cache_dir = tmp_path
+        assert second.get_instrument_token('RELIANCE', EXCHANGE_NSE) == 123456
+
+        assert mock_kite_instance.instruments.call_count == 1
+
+    def test_instruments_arrow_strings(self, mock_kiteconnect):
+        """Test that symbol columns use Arrow strings when pyarrow is present."""
+        pytest.importorskip('pyarrow')
+        mock_kite_instance = mock_kiteconnect.return_value
+        mock_kite_instance.instruments.return_value = [
+            {'instrument_token': 1, 'tradingsymbol': 'TCS', 'name': 'TCS',
+             'exchange': EXCHANGE_NSE, 'instrument_type': 'EQ', 'segment': 'NSE'},
+        ]
+
+        provider = ZerodhaProvider()
+
+        assert provider.get_instrument_token('TCS', EXCHANGE_NSE) == 1
+        assert provider._instruments_cache['tradingsymbol'].dtype == 'string[pyarrow]'
+        assert provider.get_nse_instruments()[0]['symbol'] == 'TCS'
+
+    def test_instrument_token_index(self, mock_kiteconnect):
+        """Test token lookups per exchange, keeping the first duplicate."""
+        mock_kite_instance = mock_kiteconnect.return_value
+        mock_kite_instance.instruments.return_value = [
+            {'instrument_token': 1, 'tradingsymbol': 'TCS', 'exchange': EXCHANGE_NSE},
+            {'instrument_token': 2, 'tradingsymbol': 'TCS', 'exchange': EXCHANGE_BSE},
+            {'instrument_token': 3, 'tradingsymbol': 'TCS', 'exchange': EXCHANGE_NSE},
+        ]
+
+        provider = ZerodhaProvider()
+
+        assert provider.get_instrument_token('TCS', EXCHANGE_NSE) == 1
+        assert provider.get_instrument_token('TCS', EXCHANGE_BSE) == 2
+        assert provider.get_instrument_token('INFY', EXCHANGE_NSE) is None
+        assert provider._instruments_cache['exchange'].dtype == 'category'
+
     def test_get_historical_data_not_found(self, mock_kiteconnect):
         """Test handling of symbol not found."""
         mock_kite_instance = mock_kiteconnect.return_value
@@ -432,8 +729,6 @@ if __name__ == "__main__":
         test_yahoo = TestYahooFinanceProvider()
 
         # test_get_historical_data_success
-        mock_ticker = MagicMock()
-        mock_yf.Ticker.return_value = mock_ticker
         data = {
             'Open': [150.0, 152.0],
             'High': [155.0, 156.0],
@@ -445,7 +740,7 @@ if __name__ == "__main__":
         dates = pd.to_datetime(['2023-01-01', '2023-01-02'])
         df = pd.DataFrame(data, index=dates)
         df.index.name = 'Date'
-        mock_ticker.history.return_value = df
+        mock_yf.download.return_value = pd.concat({'AAPL': df}, axis=1)
 
         provider = YahooFinanceProvider()
         result = provider.get_historical_data(
@@ -474,3 +769,235 @@ if __name__ == "__main__":
     finally:
         mock_yf_patcher.stop()
         mock_kite_patcher.stop()
+
+
+class _StubProvider(BaseDataProvider):
+    """Minimal concrete provider for exercising base-class behaviour."""
+
+    def get_historical_data(self, symbol, start_date, end_date, **kwargs):
+        self._enforce_rate_limit()
+        if symbol == "MISSING":
+            raise DataNotFoundError(f"No data for {symbol}")
+        return pd.DataFrame({COL_DATE: [start_date], COL_CLOSE: [1.0]})
+
+    def get_symbols_list(self, **kwargs):
+        return []
+
+    def validate_symbol(self, symbol, **kwargs):
+        return True
+
+
+class TestBatchFetch:
+    """Test suite for concurrent batch fetching."""
+
+    def test_batch_returns_successful_symbols(self):
+        """Test that failed symbols are dropped and the rest returned."""
+        provider = _StubProvider(rate_limit=1000.0)
+        symbols = ["AAPL", "MISSING", "MSFT", "GOOG"]
+
+        results = provider.get_historical_data_batch(
+            symbols, date(2024, 1, 1), date(2024, 1, 31), max_concurrency=3
+        )
+
+        assert list(results) == ["AAPL", "MSFT", "GOOG"]
+        assert all(df[COL_DATE].iloc[0] == date(2024, 1, 1)
+                   for df in results.values())
+
+    def test_batch_inside_event_loop(self):
+        """Test that the blocking batch call also works from async code."""
+        provider = _StubProvider(rate_limit=1000.0)
+
+        async def caller():
+            return provider.get_historical_data_batch(
+                ["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 1, 31))
+
+        assert list(asyncio.run(caller())) == ["AAPL", "MSFT"]
+
+    def test_batch_uses_async_override(self):
+        """Test that a native get_historical_data_async replaces the thread hop."""
+        class _AsyncStub(_StubProvider):
+            async def get_historical_data_async(
+                    self, symbol, start_date, end_date, **kwargs):
+                return pd.DataFrame({COL_DATE: [end_date], COL_CLOSE: [2.0]})
+
+        provider = _AsyncStub(rate_limit=1000.0)
+        results = asyncio.run(provider.fetch_historical_data_batch(
+            ["AAPL", "MISSING"], date(2024, 1, 1), date(2024, 1, 31)))
+
+        assert list(results) == ["AAPL", "MISSING"]
+        assert results["AAPL"][COL_CLOSE].iloc[0] == 2.0
+
+
+class _HistoryStub(BaseDataProvider):
+    """Provider returning one row per calendar day and recording calls."""
+
+    def __init__(self):
+        super().__init__(rate_limit=1000.0)
+        self.calls = []
+
+    def _fetch_history(self, symbol, start_date, end_date, **kwargs):
+        self.calls.append((start_date, end_date))
+        days = pd.date_range(start_date, end_date, freq="D").date
+        return pd.DataFrame({COL_DATE: days, COL_CLOSE: range(len(days))})
+
+    def get_historical_data(self, symbol, start_date, end_date, **kwargs):
+        return self._fetch_history(symbol, start_date, end_date, **kwargs)
+
+    def get_symbols_list(self, **kwargs):
+        return []
+
+    def validate_symbol(self, symbol, **kwargs):
+        return True
+
+
+class _CachedHistoryStub(CachedHistoryMixin, _HistoryStub):
+    """_HistoryStub behind the history cache."""
+
+
+class TestHistoryCache:
+    """Test suite for the provider history cache."""
+
+    @pytest.fixture(autouse=True)
+    def clean_memory_cache(self):
+        """Isolate the in-process cache between tests."""
+        clear_memory_cache()
+        yield
+        clear_memory_cache()
+
+    def test_disabled_by_default(self):
+        """Test that every call goes to the provider without a cache_dir."""
+        provider = _CachedHistoryStub()
+        assert provider.cache_dir is None
+        provider.get_historical_data("AAPL", date(2024, 1, 1), date(2024, 1, 10))
+        provider.get_historical_data("AAPL", date(2024, 1, 1), date(2024, 1, 10))
+        assert len(provider.calls) == 2
+
+    def test_serves_subranges_and_fetches_only_gaps(self, tmp_path):
+        """Test local slicing, tail extension and the on-disk tier."""
+        provider = _CachedHistoryStub()
+        provider.cache_dir = tmp_path
+
+        full = provider.get_historical_data(
+            "AAPL", date(2024, 1, 1), date(2024, 1, 31))
+        assert len(full) == 31
+
+        part = provider.get_historical_data(
+            "AAPL", date(2024, 1, 10), date(2024, 1, 20))
+        assert part[COL_DATE].tolist() == full[COL_DATE].tolist()[9:20]
+        assert len(provider.calls) == 1
+
+        extended = provider.get_historical_data(
+            "AAPL", date(2024, 1, 15), date(2024, 2, 10))
+        assert provider.calls[-1] == (date(2024, 2, 1), date(2024, 2, 10))
+        assert extended[COL_DATE].iloc[0] == date(2024, 1, 15)
+        assert extended[COL_DATE].iloc[-1] == date(2024, 2, 10)
+        assert extended[COL_DATE].is_unique
+
+        provider.get_historical_data("AAPL", date(2023, 12, 20), date(2024, 1, 5))
+        assert provider.calls[-1] == (date(2023, 12, 20), date(2023, 12, 31))
+
+        # A fresh process (cold L1) is served from disk
+        clear_memory_cache()
+        fresh = _CachedHistoryStub()
+        fresh.cache_dir = tmp_path
+        fresh.get_historical_data("AAPL", date(2024, 1, 5), date(2024, 2, 1))
+        assert fresh.calls == []
+
+    def test_slices_datetime64_dates(self, tmp_path):
+        """Test that cached frames with datetime64 dates slice by date."""
+        class _Datetime64History(_HistoryStub):
+            def _fetch_history(self, symbol, start_date, end_date, **kwargs):
+                return super()._fetch_history(
+                    symbol, start_date, end_date, **kwargs
+                ).astype({COL_DATE: 'datetime64[ns]'})
+
+        class _CachedDatetime64(CachedHistoryMixin, _Datetime64History):
+            pass
+
+        provider = _CachedDatetime64()
+        provider.cache_dir = tmp_path
+        provider.get_historical_data("AAPL", date(2024, 1, 1), date(2024, 1, 31))
+
+        part = provider.get_historical_data(
+            "AAPL", date(2024, 1, 10), date(2024, 1, 20))
+        assert part[COL_DATE].iloc[0] == pd.Timestamp("2024-01-10")
+        assert part[COL_DATE].iloc[-1] == pd.Timestamp("2024-01-20")
+        assert len(provider.calls) == 1
+
+    def test_yahoo_provider_uses_cache(self, mock_yfinance, tmp_path):
+        """Test the real Yahoo provider downloads a cached range once."""
+        dates = pd.to_datetime(['2023-01-03', '2023-01-04'])
+        df = pd.DataFrame({
+            'Open': [150.0, 152.0],
+            'High': [155.0, 156.0],
+            'Low': [149.0, 151.0],
+            'Close': [153.0, 154.0],
+            'Volume': [1000000, 1200000],
+            'Adj Close': [153.0, 154.0],
+        }, index=pd.Index(dates, name='Date'))
+        mock_yfinance.download.return_value = pd.concat({'AAPL': df}, axis=1)
+
+        provider = YahooFinanceProvider()
+        provider.cache_dir = tmp_path
+        first = provider.get_historical_data('AAPL', date(2023, 1, 3), date(2023, 1, 5))
+        second = provider.get_historical_data('AAPL', date(2023, 1, 3), date(2023, 1, 5))
+
+        assert mock_yfinance.download.call_count == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert (tmp_path / 'YahooFinanceProvider' / 'AAPL.pkl').exists()
+
+    def test_zerodha_provider_uses_cache(self, mock_kiteconnect, tmp_path):
+        """Test the real Zerodha provider fetches a cached range once."""
+        kite = mock_kiteconnect.return_value
+        kite.instruments.return_value = [
+            {'instrument_token': 123456, 'tradingsymbol': 'RELIANCE',
+             'exchange': EXCHANGE_NSE}
+        ]
+        kite.historical_data.return_value = [
+            {'date': datetime(2023, 1, 2), 'open': 2500.0, 'high': 2550.0,
+             'low': 2490.0, 'close': 2520.0, 'volume': 100000},
+        ]
+
+        provider = ZerodhaProvider()
+        provider.cache_dir = tmp_path
+        for _ in range(2):
+            result = provider.get_historical_data(
+                'RELIANCE', date(2023, 1, 2), date(2023, 1, 2),
+                exchange=EXCHANGE_NSE)
+
+        assert kite.historical_data.call_count == 1
+        assert result[COL_CLOSE].tolist() == [2520.0]
+        assert list((tmp_path / 'ZerodhaProvider').glob('RELIANCE*.pkl'))
+
+    def test_yahoo_batch_downloads_only_uncached(self, mock_yfinance, tmp_path):
+        """Test cached symbols skip the download and the rest share one."""
+        dates = pd.to_datetime(['2023-01-03', '2023-01-04'])
+        df = pd.DataFrame({
+            'Open': [150.0, 152.0],
+            'High': [155.0, 156.0],
+            'Low': [149.0, 151.0],
+            'Close': [153.0, 154.0],
+            'Volume': [1000000, 1200000],
+            'Adj Close': [153.0, 154.0],
+        }, index=pd.Index(dates, name='Date'))
+        requested = []
+
+        def download(tickers, **kwargs):
+            requested.append(list(tickers))
+            return pd.concat({t: df for t in tickers}, axis=1)
+
+        mock_yfinance.download.side_effect = download
+        provider = YahooFinanceProvider()
+        provider.cache_dir = tmp_path
+        start, end = date(2023, 1, 3), date(2023, 1, 5)
+
+        first = provider.get_historical_data_batch(['AAPL', 'MSFT'], start, end)
+        second = provider.get_historical_data_batch(
+            ['AAPL', 'MSFT', 'GOOG'], start, end)
+
+        assert requested == [['AAPL', 'MSFT'], ['GOOG']]
+        assert set(second) == {'AAPL', 'MSFT', 'GOOG'}
+        pd.testing.assert_frame_equal(first['AAPL'], second['AAPL'])
+        # Batch-cached ranges also serve single-symbol requests
+        provider.get_historical_data('MSFT', start, end)
+        assert len(requested) == 2
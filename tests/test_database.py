@@ -10,6 +10,8 @@ from sqlalchemy.exc import OperationalError
 
 from backend.core.database import (
     SessionLocal,
+    _async_database_url,
+    bulk_read,
     check_database_connection,
     engine,
     execute_with_retry,
@@ -96,6 +98,30 @@ class TestSessionManagement:
             assert result is None
 
 
+class TestAsyncEngine:
+    """Test suite for async engine configuration."""
+
+    def test_async_database_url_selects_async_driver(self):
+        """Test that sync URLs are mapped to their asyncio drivers."""
+        pg = _async_database_url("postgresql://user:pw@localhost:5432/db")
+        assert pg.drivername == "postgresql+psycopg"
+        assert pg.database == "db"
+        assert pg.password == "pw"
+
+        lite = _async_database_url("sqlite:////tmp/test.db")
+        assert lite.drivername == "sqlite+aiosqlite"
+
+
+class TestBulkRead:
+    """Test suite for ORM-free bulk reads."""
+
+    def test_bulk_read_returns_dataframe(self):
+        """Test that a parameterised SQL string comes back as a DataFrame."""
+        df = bulk_read("SELECT :x AS x, :y AS y", {"x": 1, "y": "two"})
+        assert list(df.columns) == ["x", "y"]
+        assert df.iloc[0].tolist() == [1, "two"]
+
+
 class TestDatabaseHealthCheck:
     """Test suite for database health check."""
 
@@ -106,9 +132,9 @@ class TestDatabaseHealthCheck:
 
     def test_check_database_connection_failure(self):
         """Test database connection check handles failures."""
-        # Mock the session to raise an exception
-        with patch('backend.core.database.get_session') as mock_session:
-            mock_session.side_effect = OperationalError(
+        # Mock the engine connection to raise an exception
+        with patch('backend.core.database.engine') as mock_engine:
+            mock_engine.connect.side_effect = OperationalError(
                 "Connection failed", None, None)
             result = check_database_connection()
             assert result is False
@@ -148,6 +174,19 @@ class TestRetryLogic:
         with pytest.raises(OperationalError):
             execute_with_retry(always_fails)
 
+    def test_execute_with_retry_fails_fast_on_non_transient(self):
+        """Test that programmer errors are not retried."""
+        call_count = 0
+
+        def buggy_query():
+            nonlocal call_count
+            call_count += 1
+            raise KeyError("missing")
+
+        with pytest.raises(KeyError):
+            execute_with_retry(buggy_query)
+        assert call_count == 1
+
     def test_execute_with_retry_with_args(self):
         """Test retry logic passes arguments correctly."""
         def query_with_args(arg1, arg2, kwarg1=None):
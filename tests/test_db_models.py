@@ -210,6 +210,47 @@ class TestPatternDetection:
             symbol_id=symbol.id).first()
         assert retrieved.pattern_metadata == metadata
 
+    def test_pattern_metadata_is_jsonb_on_postgresql(self):
+        """Test metadata renders as JSONB so it can carry a GIN index."""
+        from sqlalchemy.dialects import postgresql
+
+        column = PatternDetection.__table__.c.pattern_metadata
+        assert column.type.compile(dialect=postgresql.dialect()) == "JSONB"
+
+    def test_trade_recommendations_loaded_with_detections(
+            self, db_session, unique_symbol):
+        """Test recommendations arrive with the detection query (no N+1)."""
+        symbol = Symbol(symbol=unique_symbol, exchange="NASDAQ", market="US")
+        db_session.add(symbol)
+        db_session.flush()
+
+        pattern = PatternDetection(
+            symbol_id=symbol.id,
+            detection_date=date(2023, 1, 1),
+            pattern_type="VCP",
+        )
+        pattern.trade_recommendations = [
+            TradeRecommendation(
+                symbol_id=symbol.id,
+                recommendation_date=date(2023, 1, day),
+                trade_type="BUY",
+            )
+            for day in (2, 3)
+        ]
+        db_session.add(pattern)
+        db_session.commit()
+        db_session.expire_all()
+
+        retrieved = db_session.query(PatternDetection).filter_by(
+            symbol_id=symbol.id).one()
+        # Detached: a lazy load here would raise DetachedInstanceError
+        db_session.expunge(retrieved)
+        assert len(retrieved.trade_recommendations) == 2
+
+        # Committed rows would leak into other tests' queries
+        db_session.delete(db_session.get(Symbol, symbol.id))
+        db_session.commit()
+
 
 class TestTradeRecommendation:
     """Test suite for TradeRecommendation model."""
@@ -245,3 +245,168 @@ def test_calculate_mansfield_rs(sample_price_data):
     rs_down = calculate_mansfield_rs(symbol_down, benchmark_df)
     valid_rs_down = rs_down.dropna()
     assert valid_rs_down.iloc[-1] < 0
+
+
+def test_metric_records_replace_nan_with_none():
+    """Test DerivedMetrics insert rows map NaN to None and keep native types."""
+    import numpy as np
+
+    from backend.indicators.manager import _METRIC_COLUMNS, _metric_records
+
+    dates = pd.date_range(start="2023-01-02", periods=2, freq="D")
+    df = pd.DataFrame({col: [np.nan, 1.5] for col in _METRIC_COLUMNS},
+                      index=dates)
+    df["volume_avg_50"] = [np.nan, 1234.9]
+    df["mansfield_rs"] = None
+
+    records = _metric_records(df, symbol_id=7)
+
+    assert len(records) == 2
+    first, second = records
+    assert first["symbol_id"] == 7
+    assert first["date"] == dates[0].date()
+    assert all(first[col] is None for col in _METRIC_COLUMNS)
+    assert second["sma_50"] == 1.5
+    assert second["mansfield_rs"] is None
+    assert second["volume_avg_50"] == 1234
+    assert type(second["volume_avg_50"]) is int
+
+
+def test_fused_moving_averages_match_pandas():
+    """Test the fused kernel matches pandas rolling/ewm, including NaN gaps."""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    close = np.cumsum(rng.normal(0, 1, 600)) + 500
+    close[[0, 1, 100, 300, 301]] = np.nan
+    df = pd.DataFrame({"close": close},
+                      index=pd.date_range("2020-01-01", periods=600))
+
+    result = calculate_all_moving_averages(df.copy())
+
+    for period in (50, 150, 200):
+        pd.testing.assert_series_equal(
+            result[f"sma_{period}"], df["close"].rolling(period).mean(),
+            check_names=False, rtol=1e-10)
+        pd.testing.assert_series_equal(
+            result[f"ema_{period}"], df["close"].ewm(span=period, adjust=False).mean(),
+            check_names=False, rtol=1e-10)
+
+
+def test_talib_momentum_matches_pandas_ta(sample_price_data):
+    """Test the TA-Lib fast path agrees with pandas_ta once warmed up."""
+    from backend.indicators import momentum
+
+    if not momentum.TALIB_AVAILABLE:
+        pytest.skip("TA-Lib not installed")
+
+    series = sample_price_data["close"] * 1.0
+    series.iloc[::7] -= 3.0  # Mix in down days so RSI is not pinned at 100
+
+    rsi = momentum.calculate_rsi(series, 14)
+    expected = momentum.ta.rsi(series, length=14, talib=False)
+    pd.testing.assert_series_equal(
+        rsi.iloc[100:], expected.iloc[100:], check_names=False, rtol=1e-6)
+
+
+def test_mansfield_rs_skips_missing_benchmark_days(sample_price_data):
+    """Test RS is computed over common dates only, NaN where benchmark is missing."""
+    import numpy as np
+
+    from backend.indicators.relative_strength import calculate_mansfield_rs
+
+    symbol_df = sample_price_data.copy()
+    benchmark_df = sample_price_data.copy()
+    benchmark_df["close"] = 100 + np.sin(np.arange(300))
+    benchmark_df = benchmark_df.drop(benchmark_df.index[[10, 280]])
+
+    rs = calculate_mansfield_rs(symbol_df, benchmark_df)
+
+    common = symbol_df.index.intersection(benchmark_df.index)
+    rp = symbol_df.loc[common, "close"] / benchmark_df.loc[common, "close"]
+    expected = ((rp / rp.rolling(252).mean()) - 1) * 10
+
+    assert pd.isna(rs.iloc[280])
+    pd.testing.assert_series_equal(
+        rs.reindex(common), expected, check_names=False, rtol=1e-10)
+
+
+def test_52_week_high_low_matches_pandas_rolling():
+    """Test the monotonic-queue kernel matches rolling max/min with NaN gaps."""
+    import numpy as np
+
+    from backend.indicators.price_action import calculate_52_week_high_low
+
+    rng = np.random.default_rng(3)
+    high = np.cumsum(rng.normal(0, 1, 800)) + 100
+    low = high - rng.random(800)
+    high[[0, 5, 400]] = np.nan
+    high[300:560] = np.nan  # A gap longer than the window
+    low[[0, 3, 700]] = np.nan
+    df = pd.DataFrame({"high": high, "low": low})
+
+    result = calculate_52_week_high_low(df.copy())
+
+    pd.testing.assert_series_equal(
+        result["week_52_high"], df["high"].rolling(252, min_periods=1).max(),
+        check_names=False)
+    pd.testing.assert_series_equal(
+        result["week_52_low"], df["low"].rolling(252, min_periods=1).min(),
+        check_names=False)
+
+
+def test_incremental_window_matches_full_history():
+    """Test metrics from a trailing window + EMA seeds match a full recompute."""
+    import numpy as np
+
+    from backend.indicators.manager import _warmup_start, compute_metrics
+
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2015-01-01", periods=1500)
+    close = np.cumsum(rng.normal(0, 1, 1500)) + 300
+    prices = pd.DataFrame({
+        "open": close, "high": close + 1, "low": close - 1, "close": close,
+        "volume": rng.integers(1_000, 5_000, 1500),
+    }, index=dates)
+
+    full = pd.DataFrame(compute_metrics(1, prices.copy(), None)).set_index("date")
+
+    since = dates[-6].date()
+    seeds = {p: full.loc[since, f"ema_{p}"] for p in (50, 150, 200)}
+    window = prices.loc[prices.index >= pd.Timestamp(_warmup_start(since))].copy()
+    tail = pd.DataFrame(
+        compute_metrics(1, window, None, since=since, ema_seed=seeds)).set_index("date")
+
+    assert list(tail.index) == list(full.index[-5:])
+    numeric = [c for c in tail.columns if c not in ("symbol_id", "mansfield_rs")]
+    pd.testing.assert_frame_equal(
+        tail[numeric].astype(float), full[numeric].iloc[-5:].astype(float), rtol=1e-6)
+
+
+def test_float32_prices_stay_within_drift_tolerance():
+    """Test indicators from float32 prices stay within 1e-4 of the float64 run."""
+    import numpy as np
+
+    from backend.indicators.manager import compute_metrics
+
+    rng = np.random.default_rng(11)
+    close = np.round(500 * np.exp(np.cumsum(rng.normal(0, 0.02, 2000))), 2)
+    prices = pd.DataFrame({
+        "open": close, "high": np.round(close * 1.01, 2),
+        "low": np.round(close * 0.99, 2), "close": close,
+        "volume": rng.integers(1_000, 5_000, 2000),
+    }, index=pd.bdate_range("2015-01-01", periods=2000))
+    narrow = prices.astype({c: np.float32 for c in ("open", "high", "low", "close")})
+
+    wide = pd.DataFrame(compute_metrics(1, prices, None)).set_index("date")
+    slim = pd.DataFrame(compute_metrics(1, narrow, None)).set_index("date")
+
+    for col in ("sma_200", "ema_200", "rsi_14", "macd", "week_52_high", "week_52_low"):
+        a = wide[col].astype(float).to_numpy()
+        b = slim[col].astype(float).to_numpy()
+        scale = np.nanmax(np.abs(a))
+        assert np.nanmax(np.abs(a - b)) / scale < 1e-4, col
+
+    # Price passthroughs are stored at the raw cent value, not float32 noise
+    highs = prices["high"].rolling(252, min_periods=1).max()
+    assert slim["week_52_high"].astype(float).tolist() == highs.tolist()
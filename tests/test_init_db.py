@@ -3,7 +3,7 @@
 Tests the end-to-end database setup process.
 """
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import Float, create_engine, inspect
 
 from backend.models.db_models import Base
 
@@ -64,6 +64,33 @@ class TestDatabaseInitialization:
 
         assert expected_columns.issubset(columns)
 
+    def test_price_columns_are_double_precision(self):
+        """Test OHLC prices are stored as floats, not NUMERIC."""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+
+        inspector = inspect(engine)
+        types = {
+            col["name"]: col["type"]
+            for col in inspector.get_columns("price_data")
+        }
+
+        for name in ("open", "high", "low", "close", "adjusted_close"):
+            assert isinstance(types[name], Float)
+
+    def test_price_data_symbol_date_index(self):
+        """Test the per-symbol (symbol_id, date DESC) index is created."""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+
+        inspector = inspect(engine)
+        indexes = {
+            ix["name"]: ix["column_names"]
+            for ix in inspector.get_indexes("price_data")
+        }
+
+        assert indexes["ix_price_data_symbol_date_desc"] == ["symbol_id", "date"]
+
     def test_foreign_keys_exist(self):
         """Test that foreign key relationships are defined."""
         engine = create_engine("sqlite:///:memory:")
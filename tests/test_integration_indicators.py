@@ -5,7 +5,7 @@ Integration test for indicator calculation pipeline.
 from datetime import date, timedelta
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from backend.core.database import get_session
 from backend.indicators.manager import IndicatorManager
@@ -112,3 +112,126 @@ def test_indicator_pipeline(test_symbol_data):
 
         # Check Volume
         assert latest.volume_avg_50 == 10000
+
+
+def test_price_data_batch_matches_single_fetch(test_symbol_data):
+    """Batch price loading yields the same frame as the per-symbol query."""
+    import pandas as pd
+
+    from backend.indicators.utils import get_price_data, get_price_data_batch
+
+    symbol_id, _ = test_symbol_data
+
+    with get_session() as session:
+        batch = get_price_data_batch([symbol_id, -1], session)
+        single = get_price_data(symbol_id, session)
+
+    assert list(batch) == [symbol_id]
+    pd.testing.assert_frame_equal(batch[symbol_id], single)
+
+
+def test_calculate_all_in_worker_processes(test_symbol_data):
+    """calculate_all computes in worker processes and persists every row."""
+    symbol_id, _ = test_symbol_data
+
+    IndicatorManager().calculate_all(
+        benchmark_symbol="NO_SUCH_BENCHMARK", max_workers=2)
+
+    with get_session() as session:
+        metrics = session.execute(
+            select(DerivedMetrics)
+            .where(DerivedMetrics.symbol_id == symbol_id)
+        ).scalars().all()
+
+        assert len(metrics) == 300
+        assert all(m.mansfield_rs is None for m in metrics)
+
+
+def test_incremental_run_only_writes_new_days(test_symbol_data):
+    """Reruns upsert in place; incremental runs leave stored days untouched."""
+    from sqlalchemy import delete, func, update
+
+    symbol_id, _ = test_symbol_data
+    assert IndicatorManager().calculate_for_symbol(symbol_id)
+    # A full rerun upserts instead of duplicating rows
+    assert IndicatorManager().calculate_for_symbol(symbol_id)
+
+    with get_session() as session:
+        dates = session.execute(
+            select(DerivedMetrics.date)
+            .where(DerivedMetrics.symbol_id == symbol_id)
+            .order_by(DerivedMetrics.date)
+        ).scalars().all()
+        assert len(dates) == 300
+
+        # Drop the newest 5 days and mark the oldest one
+        session.execute(delete(DerivedMetrics).where(
+            DerivedMetrics.symbol_id == symbol_id,
+            DerivedMetrics.date > dates[-6]))
+        session.execute(update(DerivedMetrics).where(
+            DerivedMetrics.symbol_id == symbol_id,
+            DerivedMetrics.date == dates[0]).values(rsi_14=1))
+        session.commit()
+
+    assert IndicatorManager(incremental=True).calculate_for_symbol(symbol_id)
+
+    with get_session() as session:
+        count, last = session.execute(
+            select(func.count(), func.max(DerivedMetrics.date))
+            .where(DerivedMetrics.symbol_id == symbol_id)
+        ).one()
+        oldest_rsi = session.execute(
+            select(DerivedMetrics.rsi_14).where(
+                DerivedMetrics.symbol_id == symbol_id,
+                DerivedMetrics.date == dates[0])
+        ).scalar_one()
+
+    assert count == 300
+    assert last == dates[-1]
+    assert oldest_rsi == 1
+
+
+def test_calculate_all_skips_unchanged_symbols(test_symbol_data):
+    """Symbols whose prices have not changed since the last run are skipped."""
+    from backend.indicators.manager import _stale_symbol_ids
+
+    symbol_id, _ = test_symbol_data
+
+    with get_session() as session:
+        assert _stale_symbol_ids(session, [symbol_id]) == {symbol_id}
+
+    assert IndicatorManager().calculate_for_symbol(symbol_id)
+
+    with get_session() as session:
+        assert _stale_symbol_ids(session, [symbol_id]) == set()
+
+        # A new trading day makes the symbol stale again
+        last = session.execute(
+            select(PriceData).where(PriceData.symbol_id == symbol_id)
+            .order_by(PriceData.date.desc()).limit(1)).scalar_one()
+        session.add(PriceData(
+            symbol_id=symbol_id, date=last.date + timedelta(days=1),
+            open=500, high=502, low=498, close=500, volume=10000,
+            adjusted_close=500))
+        session.commit()
+
+        assert _stale_symbol_ids(session, [symbol_id]) == {symbol_id}
+
+
+def test_calculate_all_flushes_buffered_rows(test_symbol_data, monkeypatch):
+    """Rows buffered across symbols are all written when flushed mid-run."""
+    import backend.indicators.manager as manager_module
+
+    symbol_id, _ = test_symbol_data
+    monkeypatch.setattr(manager_module, "BATCH_SIZE_METRICS_ROWS", 100)
+
+    IndicatorManager().calculate_all(
+        benchmark_symbol="NO_SUCH_BENCHMARK", max_workers=1)
+
+    with get_session() as session:
+        count = session.execute(
+            select(func.count()).select_from(DerivedMetrics)
+            .where(DerivedMetrics.symbol_id == symbol_id)
+        ).scalar_one()
+
+    assert count == 300
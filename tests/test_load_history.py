@@ -0,0 +1,95 @@
+"""Tests for storing provider history in price_data."""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import select
+
+from backend.core.database import get_session
+from backend.data_providers.base import downcast_ohlcv
+from backend.models.db_models import PriceData, Symbol
+from backend.scripts.load_history import store_symbol_history
+
+
+@pytest.fixture
+def history_symbol():
+    """Create an empty test symbol and remove it afterwards."""
+    ticker = "TEST_LOAD_HISTORY"
+    with get_session() as session:
+        existing = session.execute(
+            select(Symbol).where(Symbol.symbol == ticker)).scalar_one_or_none()
+        if existing:
+            session.delete(existing)
+            session.commit()
+
+        symbol = Symbol(symbol=ticker, exchange="NSE", market="IN", active=True)
+        session.add(symbol)
+        session.commit()
+        symbol_id = symbol.id
+
+    yield symbol_id
+
+    with get_session() as session:
+        session.delete(session.get(Symbol, symbol_id))
+        session.commit()
+
+
+def _provider_frame(closes, volumes) -> pd.DataFrame:
+    # Provider frames may arrive unsorted; Zerodha has no adjusted_close
+    dates = pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-02"])
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame({
+        "date": dates[:len(closes)],
+        "open": closes,
+        "high": closes + 1,
+        "low": closes - 1,
+        "close": closes,
+        "volume": volumes,
+    })
+
+
+def test_store_symbol_history_upserts(history_symbol):
+    with get_session() as session:
+        symbol = session.get(Symbol, history_symbol)
+        df = _provider_frame([103.0, 101.0, 102.0], [300.0, 100.0, np.nan])
+        assert store_symbol_history(session, symbol, df) == 3
+
+        # Reloading overlapping dates updates in place
+        df = _provider_frame([113.0], [310.0])
+        assert store_symbol_history(session, symbol, df) == 1
+
+        rows = session.execute(
+            select(PriceData.date, PriceData.close, PriceData.volume,
+                   PriceData.adjusted_close)
+            .where(PriceData.symbol_id == history_symbol)
+            .order_by(PriceData.date)
+        ).all()
+
+    assert [tuple(r) for r in rows] == [
+        (date(2024, 1, 1), 101.0, 100, 101.0),
+        (date(2024, 1, 2), 102.0, None, 102.0),
+        (date(2024, 1, 3), 113.0, 310, 113.0),
+    ]
+
+
+def test_store_symbol_history_rounds_to_cents(history_symbol):
+    with get_session() as session:
+        symbol = session.get(Symbol, history_symbol)
+        # A float32 frame carries binary noise (123.45 -> 123.4499969...)
+        df = downcast_ohlcv(_provider_frame([123.45, 124.17], [100, 200]))
+        assert df["close"].dtype == np.float32
+        store_symbol_history(session, symbol, df)
+
+        rows = session.execute(
+            select(PriceData.open, PriceData.high, PriceData.low,
+                   PriceData.close, PriceData.adjusted_close)
+            .where(PriceData.symbol_id == history_symbol)
+            .order_by(PriceData.date)
+        ).all()
+
+    assert [tuple(r) for r in rows] == [
+        (124.17, 125.17, 123.17, 124.17, 124.17),
+        (123.45, 124.45, 122.45, 123.45, 123.45),
+    ]
@@ -58,3 +58,31 @@ def test_short_history() -> None:
     detector = CupWithHandleDetector()
     result = detector.detect("TEST", df)
     assert result is None
+
+
+def test_handle_below_cup_midpoint_rejected(cup_handle_data: pd.DataFrame) -> None:
+    # Cup runs 101 -> 74 -> 99, so the midpoint is 87.5; dip the handle to 80
+    prices = cup_handle_data["close"].to_numpy().copy()
+    prices[70:86] = np.linspace(98, 80, 16)
+    prices[85:] = np.linspace(80, 97, 15)
+    cup_handle_data["high"] = prices + 1
+    cup_handle_data["low"] = prices - 1
+
+    detector = CupWithHandleDetector()
+    result = detector.detect("TEST", cup_handle_data)
+
+    assert result is None
+
+
+def test_numpy_fallback_matches_kernel(
+    cup_handle_data: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from backend.patterns import cup_with_handle
+
+    expected = CupWithHandleDetector().detect("TEST", cup_handle_data)
+    monkeypatch.setattr(cup_with_handle, "NUMBA_AVAILABLE", False)
+    result = CupWithHandleDetector().detect("TEST", cup_handle_data)
+
+    assert expected is not None and result is not None
+    assert result.pattern_type == expected.pattern_type
+    assert result.meta_data == pytest.approx(expected.meta_data)
@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from backend.patterns.base import PatternDetector, PatternResult
 from backend.patterns.orchestrator import PatternScanner
 from backend.patterns.trend_template import TrendTemplateDetector
 
@@ -72,3 +73,64 @@ def test_get_actionable_setups(sample_data: pd.DataFrame) -> None:
     # Results should be sorted by confidence
     for i in range(len(results) - 1):
         assert results[i].confidence_score >= results[i + 1].confidence_score
+
+
+def test_scan_symbol_computes_extrema_once(
+    sample_data: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from backend.patterns import utils
+
+    calls = []
+    original = utils.find_local_extrema
+
+    def counting(data: pd.Series, order: int = 5):
+        calls.append(data.name)
+        return original(data, order)
+
+    monkeypatch.setattr(utils, "find_local_extrema", counting)
+    PatternScanner().scan_symbol("TEST", sample_data)
+
+    assert sorted(calls) == ["high", "low"]
+
+
+class _LegacyDetector(PatternDetector):
+    """Custom detector with the detect() signature predating extrema."""
+
+    def __init__(self) -> None:
+        super().__init__("Legacy")
+
+    def detect(self, symbol: str, data: pd.DataFrame) -> PatternResult:
+        return PatternResult(
+            pattern_type="LEGACY",
+            symbol=symbol,
+            detection_date=data.index[-1].date(),
+            confidence_score=60.0,
+        )
+
+
+class _FailingDetector(PatternDetector):
+    def __init__(self) -> None:
+        super().__init__("Failing")
+
+    def detect(self, symbol, data, extrema=None):
+        raise ValueError("boom")
+
+
+def test_scan_symbol_supports_legacy_detectors(
+    sample_data: pd.DataFrame,
+) -> None:
+    scanner = PatternScanner(detectors=[_LegacyDetector()])
+    results = scanner.scan_symbol("TEST", sample_data)
+
+    assert [r.pattern_type for r in results] == ["LEGACY"]
+
+
+def test_scan_symbol_logs_detector_errors(
+    sample_data: pd.DataFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    scanner = PatternScanner(
+        detectors=[_FailingDetector(), _LegacyDetector()])
+    results = scanner.scan_symbol("TEST", sample_data)
+
+    assert [r.pattern_type for r in results] == ["LEGACY"]
+    assert "_FailingDetector failed on TEST" in caplog.text
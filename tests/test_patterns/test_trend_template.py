@@ -79,6 +79,14 @@ def test_detect_fail_200sma_downtrend(
     assert result is None
 
 
+def test_200sma_trend_uses_20_row_lookback(
+        perfect_trend_data: pd.DataFrame) -> None:
+    # 25 rows are enough for the one-month (20-row) uptrend check
+    detector = TrendTemplateDetector()
+    assert detector.detect("TEST", perfect_trend_data.iloc[-25:]) is not None
+    assert detector.detect("TEST", perfect_trend_data.iloc[-19:]) is None
+
+
 def test_detect_fail_near_low(perfect_trend_data: pd.DataFrame) -> None:
     # Price near 52 week low (< 30% above low)
     current_price = perfect_trend_data['close'].iloc[-1]